@@ -2,11 +2,57 @@
 Brasileirão Python - Scraper para dados do Brasileirão Série A e B
 """
 
-from .src.brasileirao import Brasileirao, obter_dados_brasileirao_a, obter_dados_brasileirao_b
-from .src.models import Time, Partida, Rodada, TabelaClassificacao, DadosBrasileirao
-from .scrapers.http_client import HTTPClient
-from .scrapers.parsers import TabelaParser, RodadasParser
-from .src.utils import JSONUtils, DataConverter, FormatUtils
+from importlib import import_module
+
+# Atributo público -> módulo que o define, importado só no primeiro acesso
+# (ex.: 'from src.models import Time' não carrega requests nem BeautifulSoup)
+_ATRIBUTOS = {
+    'Brasileirao': '.src.brasileirao',
+    'obter_dados_brasileirao_a': '.src.brasileirao',
+    'obter_dados_brasileirao_b': '.src.brasileirao',
+    'AsyncBrasileirao': '.src.async_brasileirao',
+    'Time': '.src.models',
+    'Partida': '.src.models',
+    'Rodada': '.src.models',
+    'TabelaClassificacao': '.src.models',
+    'DadosBrasileirao': '.src.models',
+    'TimeTipado': '.src.models',
+    'PartidaTipada': '.src.models',
+    'RodadaTipada': '.src.models',
+    'IndiceTemporada': '.src.indice',
+    'Temporada': '.src.temporada',
+    'AgregadosTimes': '.src.agregados',
+    'AgregadoTime': '.src.agregados',
+    'Totais': '.src.agregados',
+    'ArraysTemporada': '.src.arrays',
+    'MotorClassificacao': '.src.classificacao',
+    'Classificacao': '.src.classificacao',
+    'SimuladorTemporada': '.src.simulacao',
+    'ResultadoSimulacao': '.src.simulacao',
+    'HTTPClient': '.scrapers.http_client',
+    'AsyncHTTPClient': '.scrapers.async_http_client',
+    'ResponseCache': '.scrapers.cache',
+    'registrar_campeonato': '.scrapers.campeonatos',
+    'TabelaParser': '.scrapers.parsers',
+    'RodadasParser': '.scrapers.parsers',
+    'JSONUtils': '.src.utils',
+    'DataConverter': '.src.utils',
+    'FormatUtils': '.src.utils',
+    'DateUtils': '.src.utils',
+    'AgendadorColetas': '.src.agendador',
+    'RatingsElo': '.src.elo',
+    'HistoricoSnapshots': '.src.historico',
+    'BancoSQLite': '.src.banco',
+    'ComparadorSnapshots': '.src.diff',
+    'Evento': '.src.diff',
+    'GolMarcado': '.src.diff',
+    'PlacarCorrigido': '.src.diff',
+    'PartidaEncerrada': '.src.diff',
+    'PartidaRemarcada': '.src.diff',
+    'PartidaAdicionada': '.src.diff',
+    'PartidaRemovida': '.src.diff',
+    'PosicaoAlterada': '.src.diff'
+}
 
 __version__ = "2.0.0"
 __author__ = "Brasileirão Python Team"
@@ -16,6 +62,7 @@ __url__ = "https://github.com/fcarlosmonteiro/python-brasileirao"
 __all__ = [
     # Classe principal
     'Brasileirao',
+    'AsyncBrasileirao',
     
     # Funções de conveniência
     'obter_dados_brasileirao_a',
@@ -27,16 +74,75 @@ __all__ = [
     'Rodada',
     'TabelaClassificacao',
     'DadosBrasileirao',
+    'TimeTipado',
+    'PartidaTipada',
+    'RodadaTipada',
     
     # Cliente HTTP
     'HTTPClient',
+    'AsyncHTTPClient',
+    'ResponseCache',
+    
+    # Campeonatos
+    'registrar_campeonato',
     
     # Parsers
     'TabelaParser',
     'RodadasParser',
     
+    # Análise
+    'IndiceTemporada',
+    'Temporada',
+    'AgregadosTimes',
+    'AgregadoTime',
+    'Totais',
+    
+    # Análise vetorizada (requer numpy)
+    'ArraysTemporada',
+    'MotorClassificacao',
+    'Classificacao',
+    'SimuladorTemporada',
+    'ResultadoSimulacao',
+    
     # Utilitários
     'JSONUtils',
     'DataConverter',
-    'FormatUtils'
+    'FormatUtils',
+    'DateUtils',
+    
+    # Coleta contínua
+    'AgendadorColetas',
+    
+    # Ratings
+    'RatingsElo',
+    
+    # Histórico de coletas com deltas
+    'HistoricoSnapshots',
+    
+    # Histórico de coletas em SQLite
+    'BancoSQLite',
+    
+    # Eventos de mudança entre snapshots
+    'ComparadorSnapshots',
+    'Evento',
+    'GolMarcado',
+    'PlacarCorrigido',
+    'PartidaEncerrada',
+    'PartidaRemarcada',
+    'PartidaAdicionada',
+    'PartidaRemovida',
+    'PosicaoAlterada'
 ]
+
+def __getattr__(nome):
+    """Importa sob demanda o módulo que define o atributo pedido"""
+    modulo = _ATRIBUTOS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(import_module(modulo, __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+def __dir__():
+    """Inclui os atributos ainda não importados"""
+    return sorted(set(globals()) | set(_ATRIBUTOS))
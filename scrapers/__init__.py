@@ -3,20 +3,80 @@ Brasileirão Python - Módulo de Scraping
 Contém os componentes para coleta de dados das páginas web
 """
 
-from .http_client import HTTPClient
-from .parsers import TabelaParser, RodadasParser
-from .config import URLS, REQUEST_CONFIG, CSS_SELECTORS
+from importlib import import_module
+
+# Atributo público -> módulo que o define, importado só no primeiro acesso
+# (ex.: 'from src.models import Time' não carrega requests nem BeautifulSoup)
+_ATRIBUTOS = {
+    'HTTPClient': '.http_client',
+    'AsyncHTTPClient': '.async_http_client',
+    'ResponseCache': '.cache',
+    'ParseMemo': '.cache',
+    'TokenBucket': '.rate_limiter',
+    'obter_limitador': '.rate_limiter',
+    'TabelaParser': '.parsers',
+    'RodadasParser': '.parsers',
+    'criar_documento': '.engines',
+    'engines_disponiveis': '.engines',
+    'registrar_campeonato': '.campeonatos',
+    'obter_urls': '.campeonatos',
+    'listar_campeonatos': '.campeonatos',
+    'URLS': '.config',
+    'CAMPEONATOS': '.config',
+    'URL_TEMPLATES': '.config',
+    'REQUEST_CONFIG': '.config',
+    'RATE_LIMIT_CONFIG': '.config',
+    'CACHE_CONFIG': '.config',
+    'PARSER_CONFIG': '.config',
+    'JSON_CONFIG': '.config',
+    'CSS_SELECTORS': '.config'
+}
 
 __all__ = [
     # Cliente HTTP
     'HTTPClient',
+    'AsyncHTTPClient',
+    
+    # Limite de taxa
+    'TokenBucket',
+    'obter_limitador',
+    
+    # Cache
+    'ResponseCache',
+    'ParseMemo',
     
     # Parsers
     'TabelaParser',
     'RodadasParser',
+    'criar_documento',
+    'engines_disponiveis',
+    
+    # Campeonatos
+    'registrar_campeonato',
+    'obter_urls',
+    'listar_campeonatos',
     
     # Configurações
     'URLS',
+    'CAMPEONATOS',
+    'URL_TEMPLATES',
     'REQUEST_CONFIG',
+    'RATE_LIMIT_CONFIG',
+    'CACHE_CONFIG',
+    'PARSER_CONFIG',
+    'JSON_CONFIG',
     'CSS_SELECTORS'
 ]
+
+def __getattr__(nome):
+    """Importa sob demanda o módulo que define o atributo pedido"""
+    modulo = _ATRIBUTOS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(import_module(modulo, __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+def __dir__():
+    """Inclui os atributos ainda não importados"""
+    return sorted(set(globals()) | set(_ATRIBUTOS))
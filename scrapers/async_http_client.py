@@ -0,0 +1,102 @@
+"""
+Cliente HTTP assíncrono para o projeto Brasileirão
+Executa várias requisições em paralelo sobre um pool de conexões compartilhado
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+from requests.adapters import HTTPAdapter
+from .engines import No
+from .http_client import HTTPClient
+from .config import REQUEST_CONFIG
+from .cache import ResponseCache
+
+class AsyncHTTPClient:
+    """
+    Cliente HTTP assíncrono com limite de concorrência
+    
+    Não faz I/O assíncrono: cada requisição roda no HTTPClient bloqueante
+    (requests) via loop.run_in_executor, em um pool de threads com
+    max_concorrencia workers. O event loop fica livre durante a espera, mas
+    cada requisição em andamento ocupa uma thread.
+    """
+    
+    def __init__(self, max_concorrencia: Optional[int] = None,
+                 cache: Optional[ResponseCache] = None):
+        """
+        Inicializa o cliente
+        
+        Args:
+            max_concorrencia: Número máximo de requisições simultâneas
+            cache: Cache de respostas para GET condicional (opcional)
+        """
+        self.max_concorrencia = max_concorrencia or REQUEST_CONFIG['max_concorrencia']
+        self.http_client = HTTPClient(cache)
+        self._setup_pool()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concorrencia,
+            thread_name_prefix='brasileirao-http'
+        )
+    
+    def _setup_pool(self):
+        """Dimensiona o pool de conexões da sessão para o limite de concorrência"""
+        adapter = HTTPAdapter(
+            pool_connections=self.max_concorrencia,
+            pool_maxsize=self.max_concorrencia
+        )
+        self.http_client.session.mount('https://', adapter)
+        self.http_client.session.mount('http://', adapter)
+    
+    async def get_page(self, url: str, engine: Optional[str] = None) -> No:
+        """
+        Obtém uma página HTML sem bloquear o event loop
+        
+        Args:
+            url: URL da página a ser obtida
+            engine: Engine de parsing (None usa PARSER_CONFIG['engine'])
+            
+        Returns:
+            Nó raiz do documento (ver scrapers.engines.criar_documento)
+            
+        Raises:
+            Exception: Em caso de erro na requisição
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.http_client.get_page, url, engine)
+    
+    async def get_conteudo(self, url: str) -> Tuple[str, str]:
+        """
+        Obtém o conteúdo de uma página e o hash desse conteúdo sem bloquear o event loop
+        
+        Args:
+            url: URL da página a ser obtida
+            
+        Returns:
+            Tupla (conteúdo, hash do conteúdo)
+            
+        Raises:
+            Exception: Em caso de erro na requisição
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.http_client.get_conteudo, url)
+    
+    def close(self):
+        """
+        Encerra o pool de threads e a sessão HTTP
+        
+        Espera as requisições em andamento terminarem; dentro de um event
+        loop, use aclose para não bloqueá-lo.
+        """
+        self._executor.shutdown(wait=True)
+        self.http_client.close()
+    
+    async def aclose(self):
+        """Como close, esperando as requisições em andamento em outra thread sem bloquear o event loop"""
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
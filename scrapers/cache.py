@@ -0,0 +1,152 @@
+"""
+Cache de respostas HTTP e memoização de parsing para o projeto Brasileirão
+Permite GET condicional (ETag/Last-Modified) e evita re-parsing de páginas inalteradas
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from .config import CACHE_CONFIG
+
+def hash_conteudo(texto: str) -> str:
+    """Calcula o hash SHA-256 do conteúdo de uma página"""
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+class ResponseCache:
+    """Cache em disco das respostas HTTP, indexado pela URL"""
+    
+    def __init__(self, diretorio: Optional[str] = None):
+        """
+        Inicializa o cache
+        
+        Args:
+            diretorio: Diretório onde as respostas são armazenadas
+        """
+        self.diretorio = Path(diretorio or CACHE_CONFIG['diretorio'])
+        self.diretorio.mkdir(parents=True, exist_ok=True)
+    
+    def _caminho(self, url: str) -> Path:
+        """Retorna o arquivo de cache de uma URL"""
+        chave = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.diretorio / f"{chave}.json"
+    
+    def obter(self, url: str) -> Optional[Dict[str, str]]:
+        """
+        Obtém a entrada em cache de uma URL
+        
+        Args:
+            url: URL da página
+            
+        Returns:
+            Dicionário com etag, last_modified, hash e corpo, ou None
+        """
+        try:
+            with open(self._caminho(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def salvar(self, url: str, corpo: str, etag: Optional[str] = None,
+               last_modified: Optional[str] = None) -> str:
+        """
+        Armazena uma resposta no cache
+        
+        Args:
+            url: URL da página
+            corpo: Conteúdo da resposta
+            etag: Header ETag da resposta
+            last_modified: Header Last-Modified da resposta
+            
+        Returns:
+            Hash do conteúdo armazenado
+        """
+        entrada = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'hash': hash_conteudo(corpo),
+            'corpo': corpo
+        }
+        
+        caminho = self._caminho(url)
+        temporario = caminho.with_suffix('.tmp')
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(entrada, f, ensure_ascii=False)
+        os.replace(temporario, caminho)
+        
+        return entrada['hash']
+    
+    @staticmethod
+    def headers_condicionais(entrada: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Monta os headers If-None-Match/If-Modified-Since de uma entrada"""
+        headers = {}
+        if entrada:
+            if entrada.get('etag'):
+                headers['If-None-Match'] = entrada['etag']
+            if entrada.get('last_modified'):
+                headers['If-Modified-Since'] = entrada['last_modified']
+        return headers
+
+class ParseMemo:
+    """
+    Memoiza o resultado do parsing de cada URL pelo hash do conteúdo
+    
+    A chave costuma incluir os filtros do parsing (ex. rodadas pendentes),
+    que mudam ao longo da temporada; por isso o número de entradas é
+    limitado e as menos usadas recentemente são descartadas.
+    """
+    
+    def __init__(self, max_entradas: Optional[int] = None):
+        """
+        Args:
+            max_entradas: Máximo de resultados mantidos (None usa CACHE_CONFIG['max_memo_parsing'])
+        """
+        self.max_entradas = max_entradas or CACHE_CONFIG['max_memo_parsing']
+        self._resultados: 'OrderedDict[str, Tuple[str, Any]]' = OrderedDict()
+        # Compartilhado pelas threads de coletar_varios
+        self._lock = threading.Lock()
+    
+    def obter(self, url: str, hash_pagina: str, parse: Callable[[], Any]) -> Any:
+        """
+        Retorna o último resultado de parsing se o conteúdo não mudou
+        
+        Args:
+            url: URL da página
+            hash_pagina: Hash do conteúdo atual da página
+            parse: Função que faz o parsing quando o conteúdo mudou
+            
+        Returns:
+            Resultado do parsing (memoizado ou novo)
+        """
+        anterior = self.consultar(url, hash_pagina)
+        if anterior is not None:
+            return anterior
+        
+        resultado = parse()
+        with self._lock:
+            self._resultados[url] = (hash_pagina, resultado)
+            self._resultados.move_to_end(url)
+            while len(self._resultados) > self.max_entradas:
+                self._resultados.popitem(last=False)
+        return resultado
+    
+    def consultar(self, url: str, hash_pagina: str) -> Optional[Any]:
+        """Retorna o resultado memoizado se o conteúdo não mudou, ou None"""
+        with self._lock:
+            anterior = self._resultados.get(url)
+            if anterior and anterior[0] == hash_pagina:
+                self._resultados.move_to_end(url)
+                return anterior[1]
+        return None
+    
+    def __len__(self) -> int:
+        return len(self._resultados)
+    
+    def limpar(self):
+        """Descarta todos os resultados memoizados"""
+        with self._lock:
+            self._resultados.clear()
@@ -0,0 +1,74 @@
+"""
+Registro de campeonatos do projeto Brasileirão
+Monta as URLs de qualquer campeonato/fase a partir dos templates da TRRSF
+"""
+
+import threading
+from typing import Dict, List, Union
+from .config import CAMPEONATOS, URLS, URL_TEMPLATES
+
+Identificador = Union[str, int]
+
+_lock = threading.Lock()
+
+def montar_urls(id_campeonato: int, id_fase: Union[str, int] = '') -> Dict[str, str]:
+    """
+    Monta as URLs de tabela e rodadas de um campeonato
+    
+    Args:
+        id_campeonato: idChampionship da TRRSF
+        id_fase: idPhase da TRRSF ('' para a fase padrão)
+        
+    Returns:
+        Dicionário com as URLs 'tabela' e 'rodadas'
+    """
+    return {
+        recurso: template.format(id_campeonato=id_campeonato, id_fase=id_fase)
+        for recurso, template in URL_TEMPLATES.items()
+    }
+
+def registrar_campeonato(chave: str, id_campeonato: int, nome: str = '',
+                         id_fase: Union[str, int] = '') -> Dict[str, str]:
+    """
+    Registra um campeonato (ex. Série C, Copa do Brasil, estaduais)
+    
+    Args:
+        chave: Identificador usado nas chamadas (ex. 'serie_c')
+        id_campeonato: idChampionship da TRRSF
+        nome: Nome legível do campeonato
+        id_fase: idPhase da TRRSF ('' para a fase padrão)
+        
+    Returns:
+        URLs do campeonato registrado
+    """
+    with _lock:
+        CAMPEONATOS[chave] = {'nome': nome or chave, 'id_campeonato': id_campeonato, 'id_fase': id_fase}
+        URLS[chave] = montar_urls(id_campeonato, id_fase)
+        return URLS[chave]
+
+def obter_urls(campeonato: Identificador) -> Dict[str, str]:
+    """
+    Retorna as URLs de um campeonato
+    
+    Args:
+        campeonato: Chave registrada (ex. 'serie_a'), idChampionship (ex. 1436)
+                    ou 'idChampionship:idPhase' (ex. '1436:5')
+        
+    Returns:
+        Dicionário com as URLs 'tabela' e 'rodadas'
+        
+    Raises:
+        KeyError: Se o campeonato não estiver registrado nem for um ID
+    """
+    if isinstance(campeonato, str) and campeonato in URLS:
+        return URLS[campeonato]
+    
+    id_campeonato, _, id_fase = str(campeonato).partition(':')
+    if not id_campeonato.isdigit() or (id_fase and not id_fase.isdigit()):
+        raise KeyError(f"Campeonato desconhecido: {campeonato}")
+    
+    return montar_urls(int(id_campeonato), id_fase)
+
+def listar_campeonatos() -> List[str]:
+    """Lista as chaves dos campeonatos registrados"""
+    return list(CAMPEONATOS)
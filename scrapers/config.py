@@ -2,23 +2,89 @@
 Configurações e constantes do projeto Brasileirão
 """
 
-# URLs das APIs da TRRSF
+# Templates das URLs das APIs da TRRSF, por campeonato e fase
+URL_TEMPLATES = {
+    'tabela': "https://p1.trrsf.com/api/musa-soccer/ms-standings-light?idChampionship={id_campeonato}&idPhase={id_fase}&language=pt-BR&country=BR&nav=N&timezone=BR",
+    'rodadas': "https://p1.trrsf.com/api/musa-soccer/ms-standings-games-light?idChampionship={id_campeonato}&idPhase={id_fase}&language=pt-BR&country=BR&nav=N&timezone=BR"
+}
+
+# Campeonatos conhecidos; outros podem ser registrados com registrar_campeonato
+# ou usados diretamente pelo idChampionship (ver scrapers/campeonatos.py)
+# Só as Séries A e B de 2025 vêm registradas: a TRRSF troca o idChampionship a
+# cada temporada e os IDs da Série C, Copa do Brasil e estaduais não foram conferidos
+CAMPEONATOS = {
+    'serie_a': {'nome': 'Brasileirão Série A', 'id_campeonato': 1436, 'id_fase': ''},
+    'serie_b': {'nome': 'Brasileirão Série B', 'id_campeonato': 1438, 'id_fase': ''}
+}
+
+# URLs por campeonato (mantido para compatibilidade; preenchido a partir do registro)
 URLS = {
-    'serie_a': {
-        'tabela': "https://p1.trrsf.com/api/musa-soccer/ms-standings-light?idChampionship=1436&idPhase=&language=pt-BR&country=BR&nav=N&timezone=BR",
-        'rodadas': "https://p1.trrsf.com/api/musa-soccer/ms-standings-games-light?idChampionship=1436&idPhase=&language=pt-BR&country=BR&nav=N&timezone=BR"
-    },
-    'serie_b': {
-        'tabela': "https://p1.trrsf.com/api/musa-soccer/ms-standings-light?idChampionship=1438&idPhase=&language=pt-BR&country=BR&nav=N&timezone=BR",
-        'rodadas': "https://p1.trrsf.com/api/musa-soccer/ms-standings-games-light?idChampionship=1438&idPhase=&language=pt-BR&country=BR&nav=N&timezone=BR"
+    chave: {
+        recurso: template.format(id_campeonato=info['id_campeonato'], id_fase=info['id_fase'])
+        for recurso, template in URL_TEMPLATES.items()
     }
+    for chave, info in CAMPEONATOS.items()
 }
 
 # Configurações de requisição
+# deadline: tempo total máximo (s) de uma chamada, somando tentativas e esperas
+# backoff_base/backoff_max: espera exponencial com jitter entre tentativas (s)
+# hedge: envia uma segunda requisição se a primeira demorar mais que hedge_delay
+# hedge_delay: atraso (s) do pedido extra; None usa o p95 das latências observadas
+# fonte_user_agent: 'embutido' (pool do projeto) ou 'fake_useragent' (dependência opcional)
 REQUEST_CONFIG = {
     'timeout': 30,
     'max_retries': 3,
-    'user_agent_rotation': True
+    'user_agent_rotation': True,
+    'fonte_user_agent': 'embutido',
+    'max_concorrencia': 4,
+    'deadline': 45,
+    'backoff_base': 0.5,
+    'backoff_max': 8,
+    'hedge': False,
+    'hedge_delay': None
+}
+
+# Status HTTP que justificam uma nova tentativa
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# Limite de taxa por host (token bucket), compartilhado por todos os clientes do processo
+# Desligado por padrão: ligue com 'habilitado': True (e chame redefinir_limitadores()
+# se os limitadores já tiverem sido criados)
+# taxa: requisições por segundo; rajada: tamanho máximo da rajada
+# diretorio_lock: se definido, o limite também é compartilhado entre processos
+# hosts: sobrescreve taxa/rajada por host, ex. {'p1.trrsf.com': {'taxa': 1, 'rajada': 2}}
+RATE_LIMIT_CONFIG = {
+    'habilitado': False,
+    'taxa': 2.0,
+    'rajada': 4,
+    'diretorio_lock': None,
+    'hosts': {}
+}
+
+# Configurações do cache de respostas HTTP (GET condicional)
+# max_memo_parsing: resultados de parsing mantidos em memória por ParseMemo
+# (os menos usados recentemente saem primeiro)
+CACHE_CONFIG = {
+    'habilitado': False,
+    'diretorio': '.cache_brasileirao',
+    'max_memo_parsing': 32
+}
+
+# Configurações de parsing HTML
+# engine: 'auto' (mais rápida instalada), 'selectolax', 'lxml' ou 'html.parser'
+# plano_extracao: preenche todos os campos de cada linha/partida em uma única passada
+PARSER_CONFIG = {
+    'engine': 'auto',
+    'plano_extracao': True
+}
+
+# Configurações de serialização JSON
+# backend: 'auto' (mais rápido instalado), 'orjson', 'ujson' ou 'json' (biblioteca padrão)
+# compacto: grava sem indentação nem espaços (menor e mais rápido de ler)
+JSON_CONFIG = {
+    'backend': 'auto',
+    'compacto': False
 }
 
 # Seletores CSS para parsing
@@ -0,0 +1,264 @@
+"""
+Engines de parsing HTML para o projeto Brasileirão
+Expõe uma interface comum de nós sobre BeautifulSoup, lxml e selectolax
+"""
+
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+from bs4 import BeautifulSoup, Tag
+from .config import PARSER_CONFIG
+
+ENGINES = ('selectolax', 'lxml', 'html.parser')
+
+class No(ABC):
+    """Interface comum de um nó HTML, independente da engine"""
+    
+    __slots__ = ()
+    
+    @abstractmethod
+    def select(self, seletor: str) -> List['No']:
+        """Retorna todos os descendentes que casam com o seletor CSS"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    def select_one(self, seletor: str) -> Optional['No']:
+        """Retorna o primeiro descendente que casa com o seletor CSS"""
+        raise NotImplementedError
+    
+    @property
+    @abstractmethod
+    def text(self) -> str:
+        """Texto completo do nó e de seus descendentes"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    def attr(self, nome: str) -> Optional[str]:
+        """Valor de um atributo do nó, ou None se não existir"""
+        raise NotImplementedError
+    
+    @property
+    def classes(self) -> List[str]:
+        """Classes CSS do nó"""
+        valor = self.attr('class')
+        return valor.split() if valor else []
+    
+    @property
+    @abstractmethod
+    def tag(self) -> str:
+        """Nome da tag do nó, em minúsculas"""
+        raise NotImplementedError
+    
+    @property
+    @abstractmethod
+    def parent(self) -> Optional['No']:
+        """Nó pai, ou None na raiz"""
+        raise NotImplementedError
+    
+    @abstractmethod
+    def iter_descendants(self) -> Iterator['No']:
+        """Percorre os elementos descendentes em ordem de documento"""
+        raise NotImplementedError
+
+class NoBS4(No):
+    """Nó sobre BeautifulSoup (html.parser)"""
+    
+    __slots__ = ('_tag',)
+    
+    def __init__(self, tag: Tag):
+        self._tag = tag
+    
+    def select(self, seletor: str) -> List[No]:
+        return [NoBS4(t) for t in self._tag.select(seletor)]
+    
+    def select_one(self, seletor: str) -> Optional[No]:
+        tag = self._tag.select_one(seletor)
+        return NoBS4(tag) if tag is not None else None
+    
+    @property
+    def text(self) -> str:
+        return self._tag.get_text()
+    
+    def attr(self, nome: str) -> Optional[str]:
+        valor = self._tag.attrs.get(nome)
+        if isinstance(valor, list):
+            return ' '.join(valor)
+        return valor
+    
+    @property
+    def classes(self) -> List[str]:
+        return self._tag.get('class') or []
+    
+    @property
+    def tag(self) -> str:
+        return self._tag.name
+    
+    @property
+    def parent(self) -> Optional[No]:
+        pai = self._tag.parent
+        return NoBS4(pai) if pai is not None else None
+    
+    def iter_descendants(self) -> Iterator[No]:
+        for descendente in self._tag.descendants:
+            if isinstance(descendente, Tag):
+                yield NoBS4(descendente)
+
+class NoLxml(No):
+    """Nó sobre lxml.html com seletores CSS pré-compilados"""
+    
+    __slots__ = ('_el',)
+    _seletores: Dict[str, object] = {}
+    
+    def __init__(self, el):
+        self._el = el
+    
+    @classmethod
+    def _compilar(cls, seletor: str):
+        """Compila (uma única vez) um seletor CSS para XPath"""
+        compilado = cls._seletores.get(seletor)
+        if compilado is None:
+            from lxml.cssselect import CSSSelector
+            compilado = cls._seletores[seletor] = CSSSelector(seletor)
+        return compilado
+    
+    def select(self, seletor: str) -> List[No]:
+        return [NoLxml(el) for el in self._compilar(seletor)(self._el)]
+    
+    def select_one(self, seletor: str) -> Optional[No]:
+        encontrados = self._compilar(seletor)(self._el)
+        return NoLxml(encontrados[0]) if encontrados else None
+    
+    @property
+    def text(self) -> str:
+        return self._el.text_content()
+    
+    def attr(self, nome: str) -> Optional[str]:
+        return self._el.get(nome)
+    
+    @property
+    def tag(self) -> str:
+        return self._el.tag
+    
+    @property
+    def parent(self) -> Optional[No]:
+        pai = self._el.getparent()
+        return NoLxml(pai) if pai is not None else None
+    
+    def iter_descendants(self) -> Iterator[No]:
+        for el in self._el.iterdescendants():
+            # Ignora comentários e instruções de processamento
+            if isinstance(el.tag, str):
+                yield NoLxml(el)
+
+class NoSelectolax(No):
+    """Nó sobre selectolax"""
+    
+    __slots__ = ('_node',)
+    
+    def __init__(self, node):
+        self._node = node
+    
+    def select(self, seletor: str) -> List[No]:
+        return [NoSelectolax(n) for n in self._node.css(seletor)]
+    
+    def select_one(self, seletor: str) -> Optional[No]:
+        node = self._node.css_first(seletor)
+        return NoSelectolax(node) if node is not None else None
+    
+    @property
+    def text(self) -> str:
+        return self._node.text(deep=True)
+    
+    def attr(self, nome: str) -> Optional[str]:
+        attrs = self._node.attributes
+        if nome not in attrs:
+            return None
+        # selectolax devolve None para atributos sem valor
+        return attrs[nome] or ''
+    
+    @property
+    def tag(self) -> str:
+        return self._node.tag
+    
+    @property
+    def parent(self) -> Optional[No]:
+        pai = self._node.parent
+        return NoSelectolax(pai) if pai is not None else None
+    
+    def iter_descendants(self) -> Iterator[No]:
+        nos = self._node.traverse(include_text=False)
+        next(nos, None)  # o primeiro é o próprio nó
+        for node in nos:
+            # Comentários aparecem como '_comment'/'-comment'
+            if not node.tag.startswith(('_', '-')):
+                yield NoSelectolax(node)
+
+@lru_cache(maxsize=None)
+def engines_disponiveis() -> Tuple[str, ...]:
+    """Lista as engines de parsing instaladas, da mais rápida para a mais lenta"""
+    disponiveis = []
+    try:
+        import selectolax.parser  # noqa: F401
+        disponiveis.append('selectolax')
+    except ImportError:
+        pass
+    try:
+        import lxml.html  # noqa: F401
+        import cssselect  # noqa: F401
+        disponiveis.append('lxml')
+    except ImportError:
+        pass
+    disponiveis.append('html.parser')
+    return tuple(disponiveis)
+
+def resolver_engine(engine: Optional[str] = None) -> str:
+    """
+    Resolve qual engine usar
+    
+    Args:
+        engine: Engine desejada ('auto', 'selectolax', 'lxml' ou 'html.parser').
+                Se None, usa PARSER_CONFIG['engine']
+                
+    Returns:
+        Nome da engine que será usada; cai para 'html.parser' se a
+        engine pedida não estiver instalada
+    """
+    engine = engine or PARSER_CONFIG['engine']
+    disponiveis = engines_disponiveis()
+    
+    if engine == 'auto':
+        return disponiveis[0]
+    if engine not in ENGINES:
+        raise ValueError(f"Engine de parsing desconhecida: {engine}")
+    
+    return engine if engine in disponiveis else 'html.parser'
+
+def criar_documento(html: str, engine: Optional[str] = None) -> No:
+    """
+    Constrói a árvore de um documento HTML com a engine configurada
+    
+    Args:
+        html: Conteúdo HTML
+        engine: Engine desejada (ver resolver_engine)
+        
+    Returns:
+        Nó raiz do documento
+    """
+    engine = resolver_engine(engine)
+    
+    if engine == 'selectolax':
+        from selectolax.parser import HTMLParser
+        return NoSelectolax(HTMLParser(html).root)
+    if engine == 'lxml':
+        import lxml.html
+        return NoLxml(lxml.html.document_fromstring(html))
+    
+    return NoBS4(BeautifulSoup(html, 'html.parser'))
+
+def como_no(documento) -> No:
+    """Adapta um BeautifulSoup/Tag para a interface No (nós já adaptados passam direto)"""
+    if isinstance(documento, No):
+        return documento
+    if isinstance(documento, Tag):
+        return NoBS4(documento)
+    raise TypeError(f"Documento HTML não suportado: {type(documento).__name__}")
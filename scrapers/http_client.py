@@ -3,18 +3,44 @@ Cliente HTTP para o projeto Brasileirão
 Gerencia conexões, User-Agents rotativos e tratamento de erros
 """
 
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import requests
-from fake_useragent import UserAgent
-from bs4 import BeautifulSoup
-from typing import Optional
-from .config import REQUEST_CONFIG
+from requests.compat import chardet
+from typing import Dict, Optional, Tuple
+from .config import REQUEST_CONFIG, CACHE_CONFIG, RETRY_STATUS
+from .cache import ResponseCache, hash_conteudo
+from .engines import No, criar_documento
+from .rate_limiter import aguardar_vez
+from .user_agents import obter_pool
+
+# Amostras mínimas de latência antes de estimar o p95 para hedging
+MIN_AMOSTRAS_P95 = 20
+
+# Tamanho dos blocos lidos do corpo; o deadline é verificado entre blocos
+TAMANHO_BLOCO = 8192
 
 class HTTPClient:
     """Cliente HTTP com User-Agent rotativo e tratamento de erros"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ResponseCache] = None):
+        """
+        Inicializa o cliente
+        
+        Args:
+            cache: Cache de respostas para GET condicional (opcional)
+        """
         self.session = requests.Session()
-        self.ua = UserAgent()
+        self.ua = obter_pool()
+        if cache is None and CACHE_CONFIG['habilitado']:
+            cache = ResponseCache()
+        self.cache = cache
+        self._latencias = deque(maxlen=200)
+        self._lock_latencias = threading.Lock()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
         self._setup_session()
     
     def _setup_session(self):
@@ -28,35 +54,84 @@ class HTTPClient:
             'Upgrade-Insecure-Requests': '1'
         })
     
-    def _rotate_user_agent(self):
-        """Rotaciona o User-Agent para evitar bloqueios"""
-        if REQUEST_CONFIG['user_agent_rotation']:
-            self.session.headers.update({'User-Agent': self.ua.random})
+    def _rotate_user_agent(self, headers: Dict[str, str]) -> Dict[str, str]:
+        """
+        Headers de uma requisição com User-Agent rotacionado para evitar bloqueios
+        
+        O User-Agent vai nos headers da própria requisição, sem alterar os da
+        sessão, que é compartilhada entre threads (hedging, coletar_varios).
+        """
+        if not REQUEST_CONFIG['user_agent_rotation']:
+            return headers
+        return {**headers, 'User-Agent': self.ua.random}
+    
+    def get_page(self, url: str, engine: Optional[str] = None) -> No:
+        """
+        Obtém uma página HTML e constrói sua árvore com a engine configurada
+        
+        Args:
+            url: URL da página a ser obtida
+            engine: Engine de parsing (None usa PARSER_CONFIG['engine'])
+            
+        Returns:
+            Nó raiz do documento (ver scrapers.engines.criar_documento)
+            
+        Raises:
+            Exception: Em caso de erro na requisição
+        """
+        texto, _ = self.get_conteudo(url)
+        return self.parse_html(texto, engine)
     
-    def get_page(self, url: str) -> BeautifulSoup:
+    def get_conteudo(self, url: str, deadline: Optional[float] = None) -> Tuple[str, str]:
         """
-        Obtém uma página HTML e retorna um objeto BeautifulSoup
+        Obtém o conteúdo de uma página e o hash desse conteúdo
+        
+        Com cache habilitado, envia If-None-Match/If-Modified-Since e,
+        em caso de 304, devolve o corpo armazenado sem baixá-lo de novo.
+        Timeouts, falhas de conexão e status em RETRY_STATUS são repetidos
+        até REQUEST_CONFIG['max_retries'] vezes, com backoff exponencial e
+        jitter, sem ultrapassar o deadline da chamada. O corpo é lido em
+        blocos e a leitura é interrompida quando o deadline passa, então um
+        servidor que envia o corpo aos poucos não prende a chamada; uma única
+        leitura parada ainda pode esperar até o timeout restante do socket.
         
         Args:
             url: URL da página a ser obtida
+            deadline: Tempo total máximo em segundos (None usa REQUEST_CONFIG['deadline'])
             
         Returns:
-            BeautifulSoup object da página
+            Tupla (conteúdo, hash do conteúdo)
             
         Raises:
             Exception: Em caso de erro na requisição
         """
         try:
-            self._rotate_user_agent()
+            entrada = self.cache.obter(url) if self.cache else None
+            if deadline is None:
+                deadline = REQUEST_CONFIG['deadline']
             
-            response = self.session.get(
-                url, 
-                timeout=REQUEST_CONFIG['timeout']
+            response, corpo = self._get_com_retentativas(
+                url,
+                ResponseCache.headers_condicionais(entrada),
+                time.monotonic() + deadline
             )
+            
+            if response.status_code == 304 and entrada:
+                return entrada['corpo'], entrada['hash']
+            
             response.raise_for_status()
             
-            return BeautifulSoup(response.text, 'html.parser')
+            texto = self._decodificar(response, corpo)
+            if self.cache:
+                return texto, self.cache.salvar(
+                    url,
+                    texto,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
             
+            return texto, hash_conteudo(texto)
+        
         except requests.Timeout:
             raise Exception(f"Timeout ao acessar: {url}")
         except requests.HTTPError as e:
@@ -66,8 +141,166 @@ class HTTPClient:
         except Exception as e:
             raise Exception(f"Erro inesperado: {str(e)}")
     
+    def _get_com_retentativas(self, url: str, headers: Dict[str, str],
+                              limite: float) -> Tuple[requests.Response, bytes]:
+        """
+        Executa o GET repetindo falhas transitórias até o limite de tempo
+        
+        Args:
+            url: URL da página
+            headers: Headers extras da requisição
+            limite: Instante (time.monotonic) em que a chamada deve terminar
+            
+        Returns:
+            Tupla (resposta final, corpo lido), bem-sucedida ou com erro não transitório
+            
+        Raises:
+            requests.RequestException: Quando as tentativas ou o tempo se esgotam
+        """
+        tentativa = 0
+        while True:
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                raise requests.Timeout(f"Deadline excedido ao acessar: {url}")
+            
+            try:
+                response, corpo = self._requisitar(
+                    url, self._rotate_user_agent(headers), min(REQUEST_CONFIG['timeout'], restante)
+                )
+                if response.status_code not in RETRY_STATUS or tentativa >= REQUEST_CONFIG['max_retries']:
+                    return response, corpo
+                response.close()
+            except (requests.Timeout, requests.ConnectionError):
+                if tentativa >= REQUEST_CONFIG['max_retries']:
+                    raise
+            
+            espera = self._calcular_backoff(tentativa)
+            if time.monotonic() + espera >= limite:
+                raise requests.Timeout(f"Deadline excedido ao acessar: {url}")
+            time.sleep(espera)
+            tentativa += 1
+    
+    @staticmethod
+    def _calcular_backoff(tentativa: int) -> float:
+        """Espera exponencial com jitter completo para a tentativa informada"""
+        teto = min(REQUEST_CONFIG['backoff_max'], REQUEST_CONFIG['backoff_base'] * (2 ** tentativa))
+        return random.uniform(0, teto)
+    
+    def _requisitar(self, url: str, headers: Dict[str, str],
+                    timeout: float) -> Tuple[requests.Response, bytes]:
+        """
+        Faz uma tentativa de GET, com hedging se habilitado
+        
+        Com hedging, se a primeira requisição não responder dentro do atraso
+        de hedge, uma segunda é disparada e vale a primeira que responder.
+        As duas usam os mesmos headers e a mesma sessão, sem alterá-la.
+        """
+        atraso = self._atraso_hedge() if REQUEST_CONFIG['hedge'] else None
+        if atraso is None or atraso >= timeout:
+            return self._get_medido(url, headers, timeout)
+        
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=2 * REQUEST_CONFIG['max_concorrencia'],
+                thread_name_prefix='brasileirao-hedge'
+            )
+        
+        inicio = time.monotonic()
+        pendentes = {self._hedge_executor.submit(self._get_medido, url, headers, timeout)}
+        concluidas, _ = wait(pendentes, timeout=atraso)
+        if not concluidas:
+            restante = max(timeout - (time.monotonic() - inicio), 0.001)
+            pendentes.add(self._hedge_executor.submit(self._get_medido, url, headers, restante))
+        
+        erro = None
+        while pendentes:
+            concluidas, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in concluidas:
+                if futuro.exception() is None:
+                    # A requisição perdedora é descartada quando terminar
+                    for perdedora in pendentes:
+                        perdedora.add_done_callback(self._descartar_resposta)
+                    return futuro.result()
+                erro = futuro.exception()
+        raise erro
+    
+    def _get_medido(self, url: str, headers: Dict[str, str],
+                    timeout: float) -> Tuple[requests.Response, bytes]:
+        """
+        Respeita o limite de taxa do host, executa o GET e registra a latência observada
+        
+        O timeout vale para a requisição inteira, incluindo a leitura do corpo.
+        """
+        inicio = time.monotonic()
+        limite = inicio + timeout
+        if not aguardar_vez(url, timeout):
+            raise requests.Timeout(f"Limite de taxa não liberou a requisição a tempo: {url}")
+        timeout = max(limite - time.monotonic(), 0.001)
+        
+        inicio = time.monotonic()
+        response = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+        corpo = self._ler_corpo(response, limite, url)
+        with self._lock_latencias:
+            self._latencias.append(time.monotonic() - inicio)
+        return response, corpo
+    
+    @staticmethod
+    def _ler_corpo(response: requests.Response, limite: float, url: str) -> bytes:
+        """
+        Lê o corpo de uma resposta em streaming, verificando o limite entre blocos
+        
+        Returns:
+            Corpo completo (a resposta fica consumida; use este valor, não response.content)
+            
+        Raises:
+            requests.Timeout: Se o limite passar antes do fim do corpo
+        """
+        blocos = []
+        try:
+            for bloco in response.iter_content(TAMANHO_BLOCO):
+                blocos.append(bloco)
+                if time.monotonic() > limite:
+                    raise requests.Timeout(f"Deadline excedido ao ler o corpo de: {url}")
+        except Exception:
+            response.close()
+            raise
+        return b''.join(blocos)
+    
+    @staticmethod
+    def _decodificar(response: requests.Response, corpo: bytes) -> str:
+        """Decodifica o corpo como response.text faria (charset do header ou detectado)"""
+        encoding = response.encoding or chardet.detect(corpo)['encoding']
+        try:
+            return str(corpo, encoding or 'utf-8', errors='replace')
+        except LookupError:
+            return str(corpo, 'utf-8', errors='replace')
+    
+    def _atraso_hedge(self) -> Optional[float]:
+        """Atraso do pedido extra: configurado ou o p95 das latências recentes"""
+        if REQUEST_CONFIG['hedge_delay'] is not None:
+            return REQUEST_CONFIG['hedge_delay']
+        
+        with self._lock_latencias:
+            latencias = sorted(self._latencias)
+        if len(latencias) < MIN_AMOSTRAS_P95:
+            return None
+        return latencias[int(len(latencias) * 0.95) - 1]
+    
+    @staticmethod
+    def _descartar_resposta(futuro):
+        """Fecha a resposta de uma requisição que perdeu o hedging"""
+        if futuro.exception() is None:
+            futuro.result()[0].close()
+    
+    @staticmethod
+    def parse_html(texto: str, engine: Optional[str] = None) -> No:
+        """Constrói a árvore HTML de um conteúdo já obtido com a engine configurada"""
+        return criar_documento(texto, engine)
+    
     def close(self):
         """Fecha a sessão HTTP"""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
         self.session.close()
     
     def __enter__(self):
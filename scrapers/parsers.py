@@ -2,21 +2,62 @@
 Parsers para extrair dados do HTML das páginas do Brasileirão
 """
 
-from bs4 import BeautifulSoup, Tag
-from typing import List, Dict, Optional
+import sys
+from bs4 import BeautifulSoup
+from datetime import date
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
 from .config import CSS_SELECTORS
-from src.models import Time, Partida, Rodada, TabelaClassificacao
+from .engines import No, como_no
+from .plano import obter_extrator
+from src.models import Time, Partida, Rodada, TabelaClassificacao, TimeTipado, PartidaTipada, RodadaTipada
+from src.utils import DataConverter, DateUtils
+
+def _texto(valores: Dict[str, Optional[str]], campo: str) -> str:
+    """Texto de um campo extraído, sem espaços nas pontas ('' se ausente)"""
+    valor = valores[campo]
+    return valor.strip() if valor is not None else ''
+
+def _normalizar_filtro(valores: Optional[Iterable]) -> Optional[FrozenSet]:
+    """Converte um filtro opcional (range, lista, set) em frozenset"""
+    return frozenset(valores) if valores is not None else None
+
+def _separar_times(times: str) -> Tuple[str, str]:
+    """
+    Separa 'Casa x Fora' nos nomes dos dois times
+    
+    Só o primeiro ' x ' (com espaços) separa os times, então nomes com a
+    letra x (ex. 'Caxias x Náutico') não quebram a separação.
+    
+    Raises:
+        ValueError: Se o texto não tiver o separador ' x '
+    """
+    time_casa, separador, time_fora = times.partition(" x ")
+    if not separador:
+        raise ValueError(f"Confronto sem o separador ' x ': {times}")
+    return sys.intern(time_casa.strip()), sys.intern(time_fora.strip())
+
+def _atributo(valores: Dict[str, Optional[str]], campo: str) -> str:
+    """Valor de atributo de um campo extraído ('' se ausente)"""
+    valor = valores[campo]
+    return valor if valor is not None else ''
+
+def _inteiro(valores: Dict[str, Optional[str]], campo: str) -> int:
+    """Número de um campo extraído (0 se ausente)"""
+    return DataConverter.para_inteiro(_texto(valores, campo))
 
 class TabelaParser:
     """Parser para dados da tabela de classificação"""
     
     @staticmethod
-    def parse_tabela(soup: BeautifulSoup) -> TabelaClassificacao:
+    def parse_tabela(soup: Union[BeautifulSoup, No], plano: Optional[bool] = None,
+                     tipado: bool = False) -> TabelaClassificacao:
         """
         Extrai dados da tabela de classificação
         
         Args:
-            soup: BeautifulSoup object da página
+            soup: BeautifulSoup object ou documento de qualquer engine (ver criar_documento)
+            plano: Se deve usar o plano de extração compilado (None usa PARSER_CONFIG)
+            tipado: Se deve gerar TimeTipado (campos numéricos) em vez de Time
             
         Returns:
             TabelaClassificacao com os times
@@ -27,144 +68,329 @@ class TabelaParser:
         try:
             times = []
             seletores = CSS_SELECTORS['tabela']
+            extrator = obter_extrator('time', plano)
             
             # Busca todas as linhas da tabela
-            linhas_times = soup.select(seletores['linhas'])
+            linhas_times = como_no(soup).select(seletores['linhas'])
+            
+            parse_linha = TabelaParser._parse_linha_time_tipado if tipado else TabelaParser._parse_linha_time
             
             for linha in linhas_times:
-                time = TabelaParser._parse_linha_time(linha, seletores)
+                time = parse_linha(linha, extrator)
                 times.append(time)
             
             return TabelaClassificacao(times=times)
-            
+        
         except Exception as e:
             raise Exception(f"Erro ao fazer parsing da tabela: {str(e)}")
     
     @staticmethod
-    def _parse_linha_time(linha: Tag, seletores: Dict) -> Time:
+    def _parse_linha_time(linha: No, extrator) -> Time:
         """Extrai dados de uma linha de time da tabela"""
-        def get_text(selector: str) -> str:
-            element = linha.select_one(selector)
-            return element.text.strip() if element else ''
-        
-        def get_attr(selector: str, attr: str) -> str:
-            element = linha.select_one(selector)
-            return element[attr] if element and attr in element.attrs else ''
+        valores = extrator.extrair(linha)
         
         return Time(
-            nome=get_attr(seletores['nome'], 'title'),
-            escudo=get_attr(seletores['escudo'], 'src'),
-            posicao=get_text(seletores['posicao']),
-            pontos=get_text(seletores['pontos']),
-            jogos=get_text(seletores['jogos']),
-            vitorias=get_text(seletores['vitorias']),
-            empates=get_text(seletores['empates']),
-            derrotas=get_text(seletores['derrotas']),
-            gols_pro=get_text(seletores['gols_pro']),
-            gols_contra=get_text(seletores['gols_contra']),
-            saldo_gols=get_text(seletores['saldo_gols']),
-            aproveitamento=get_text(seletores['aproveitamento']) + '%'
+            nome=_atributo(valores, 'nome'),
+            escudo=_atributo(valores, 'escudo'),
+            posicao=_texto(valores, 'posicao'),
+            pontos=_texto(valores, 'pontos'),
+            jogos=_texto(valores, 'jogos'),
+            vitorias=_texto(valores, 'vitorias'),
+            empates=_texto(valores, 'empates'),
+            derrotas=_texto(valores, 'derrotas'),
+            gols_pro=_texto(valores, 'gols_pro'),
+            gols_contra=_texto(valores, 'gols_contra'),
+            saldo_gols=_texto(valores, 'saldo_gols'),
+            aproveitamento=_texto(valores, 'aproveitamento') + '%'
+        )
+    
+    @staticmethod
+    def _parse_linha_time_tipado(linha: No, extrator) -> TimeTipado:
+        """Extrai dados de uma linha de time da tabela, já convertidos em números"""
+        valores = extrator.extrair(linha)
+        
+        return TimeTipado(
+            nome=_atributo(valores, 'nome'),
+            escudo=_atributo(valores, 'escudo'),
+            posicao=_inteiro(valores, 'posicao'),
+            pontos=_inteiro(valores, 'pontos'),
+            jogos=_inteiro(valores, 'jogos'),
+            vitorias=_inteiro(valores, 'vitorias'),
+            empates=_inteiro(valores, 'empates'),
+            derrotas=_inteiro(valores, 'derrotas'),
+            gols_pro=_inteiro(valores, 'gols_pro'),
+            gols_contra=_inteiro(valores, 'gols_contra'),
+            saldo_gols=_inteiro(valores, 'saldo_gols'),
+            aproveitamento=_inteiro(valores, 'aproveitamento')
         )
 
 class RodadasParser:
     """Parser para dados das rodadas e partidas"""
     
     @staticmethod
-    def parse_rodadas(soup: BeautifulSoup) -> List[Rodada]:
+    def parse_rodadas(soup: Union[BeautifulSoup, No], plano: Optional[bool] = None,
+                      rodadas: Optional[Iterable[int]] = None,
+                      times: Optional[Iterable[str]] = None,
+                      tipado: bool = False) -> List[Rodada]:
         """
         Extrai dados das rodadas e partidas
         
         Args:
-            soup: BeautifulSoup object da página
+            soup: BeautifulSoup object ou documento de qualquer engine (ver criar_documento)
+            plano: Se deve usar o plano de extração compilado (None usa PARSER_CONFIG)
+            rodadas: Números das rodadas desejadas (do título), ex. range(20, 26) (None para todas)
+            times: Nomes exatos dos times desejados, ex. {'Remo'} (None para todos)
+            tipado: Se deve gerar RodadaTipada e PartidaTipada em vez dos modelos de texto
             
         Returns:
             Lista de Rodada com suas partidas
             
+        Raises:
+            Exception: Em caso de erro no parsing
+        """
+        return list(RodadasParser.iter_rodadas(soup, plano, rodadas, times, tipado))
+    
+    @staticmethod
+    def iter_rodadas(soup: Union[BeautifulSoup, No], plano: Optional[bool] = None,
+                     rodadas: Optional[Iterable[int]] = None,
+                     times: Optional[Iterable[str]] = None,
+                     tipado: bool = False) -> Iterator[Rodada]:
+        """
+        Gera as rodadas uma a uma, à medida que são parseadas
+        
+        Permite começar a processar antes do fim do parsing e parar cedo
+        (por exemplo, na rodada atual) sem montar a temporada inteira.
+        Rodadas e partidas fora dos filtros são puladas sem serem extraídas;
+        com filtro de times, rodadas sem partidas desses times não são geradas.
+        
+        Args:
+            soup: BeautifulSoup object ou documento de qualquer engine (ver criar_documento)
+            plano: Se deve usar o plano de extração compilado (None usa PARSER_CONFIG)
+            rodadas: Números das rodadas desejadas, lidos do título ('12ª rodada'; None para todas)
+            times: Nomes exatos dos times desejados (None para todos)
+            tipado: Se deve gerar os modelos tipados em vez dos modelos de texto
+            
+        Yields:
+            Rodada com suas partidas
+            
         Raises:
             Exception: Em caso de erro no parsing
         """
         try:
-            rodadas = []
             seletores = CSS_SELECTORS['rodadas']
+            extrator_rodada = obter_extrator('rodada', plano)
+            extrator_partida = obter_extrator('partida', plano)
+            filtro_times = _normalizar_filtro(times)
             
-            # Busca todas as rodadas
-            elementos_rodadas = soup.select(seletores['container'])
+            for numero, elemento_rodada in RodadasParser._filtrar_rodadas(soup, seletores, rodadas):
+                rodada = RodadasParser._parse_rodada(
+                    elemento_rodada, seletores, extrator_rodada, extrator_partida, filtro_times,
+                    numero if tipado else None
+                )
+                if filtro_times is None or rodada.partidas:
+                    yield rodada
+        
+        except Exception as e:
+            raise Exception(f"Erro ao fazer parsing das rodadas: {str(e)}")
+    
+    @staticmethod
+    def iter_partidas(soup: Union[BeautifulSoup, No], plano: Optional[bool] = None,
+                      rodadas: Optional[Iterable[int]] = None,
+                      times: Optional[Iterable[str]] = None,
+                      tipado: bool = False) -> Iterator[Partida]:
+        """
+        Gera as partidas de todas as rodadas uma a uma, sem montar as rodadas
+        
+        Args:
+            soup: BeautifulSoup object ou documento de qualquer engine (ver criar_documento)
+            plano: Se deve usar o plano de extração compilado (None usa PARSER_CONFIG)
+            rodadas: Números das rodadas desejadas, lidos do título ('12ª rodada'; None para todas)
+            times: Nomes exatos dos times desejados (None para todos)
+            tipado: Se deve gerar os modelos tipados em vez dos modelos de texto
             
-            for elemento_rodada in elementos_rodadas:
-                rodada = RodadasParser._parse_rodada(elemento_rodada, seletores)
-                rodadas.append(rodada)
+        Yields:
+            Partida, na ordem das rodadas
             
-            return rodadas
+        Raises:
+            Exception: Em caso de erro no parsing
+        """
+        try:
+            seletores = CSS_SELECTORS['rodadas']
+            extrator_rodada = obter_extrator('rodada', plano) if tipado else None
+            extrator_partida = obter_extrator('partida', plano)
+            filtro_times = _normalizar_filtro(times)
             
+            for _, elemento_rodada in RodadasParser._filtrar_rodadas(soup, seletores, rodadas):
+                # Partidas tipadas precisam do início da rodada para saber o ano
+                inicio = None
+                if tipado:
+                    inicio = RodadasParser._inicio_rodada(extrator_rodada.extrair(elemento_rodada))
+                yield from RodadasParser._iter_partidas_rodada(
+                    elemento_rodada, seletores, extrator_partida, filtro_times, inicio
+                )
+        
         except Exception as e:
-            raise Exception(f"Erro ao fazer parsing das rodadas: {str(e)}")
+            raise Exception(f"Erro ao fazer parsing das partidas: {str(e)}")
+    
+    @staticmethod
+    def _filtrar_rodadas(soup: Union[BeautifulSoup, No], seletores: Dict,
+                         rodadas: Optional[Iterable[int]]) -> Iterator[Tuple[int, No]]:
+        """
+        Gera (número, elemento) das rodadas desejadas, parando quando não faltar nenhuma
+        
+        O número vem do título da rodada ('12ª rodada'; a posição só se o
+        título não tiver número). Cada rodada pulada custa apenas a leitura
+        do título: suas partidas não são extraídas. A busca para assim que
+        todas as rodadas pedidas foram encontradas, em qualquer ordem da página.
+        """
+        filtro = _normalizar_filtro(rodadas)
+        restantes = set(filtro) if filtro is not None else None
+        
+        # Busca todas as rodadas
+        elementos_rodadas = como_no(soup).select(seletores['container'])
+        
+        for posicao, elemento_rodada in enumerate(elementos_rodadas, 1):
+            titulo = elemento_rodada.select_one(seletores['titulo'])
+            numero = (DataConverter.numero_rodada(titulo.text) if titulo is not None else None) or posicao
+            if restantes is None:
+                yield numero, elemento_rodada
+                continue
+            if numero in filtro:
+                restantes.discard(numero)
+                yield numero, elemento_rodada
+                if not restantes:
+                    break
     
     @staticmethod
-    def _parse_rodada(elemento_rodada: Tag, seletores: Dict) -> Rodada:
-        """Extrai dados de uma rodada específica"""
-        data_rodada = elemento_rodada.select_one(seletores['data_rodada'])
-        if not data_rodada or 'data-date' not in data_rodada.attrs:
+    def _inicio_rodada(valores: Dict[str, Optional[str]]) -> date:
+        """Data de início de uma rodada a partir dos valores extraídos"""
+        data_completa = valores['data_rodada']
+        if data_completa is None:
+            raise Exception("Erro ao obter informações da rodada")
+        
+        ano, mes, dia = data_completa.split(" ")[0].split("-")
+        return date(int(ano), int(mes), int(dia))
+    
+    @staticmethod
+    def _parse_rodada(elemento_rodada: No, seletores: Dict, extrator_rodada,
+                      extrator_partida, times: Optional[FrozenSet[str]] = None,
+                      numero: Optional[int] = None) -> Union[Rodada, RodadaTipada]:
+        """Extrai dados de uma rodada específica (RodadaTipada se numero for informado)"""
+        valores = extrator_rodada.extrair(elemento_rodada)
+        
+        data_completa = valores['data_rodada']
+        if data_completa is None:
             raise Exception("Erro ao obter informações da rodada")
         
-        data_completa = data_rodada['data-date']
         data_parts = data_completa.split(" ")[0].split("-")
         ano, mes, dia = data_parts
         
-        titulo = elemento_rodada.select_one(seletores['titulo'])
-        titulo_texto = titulo.text.strip() if titulo else ''
+        rodada_atual = 'round' in elemento_rodada.classes
         
-        rodada_atual = 'round' in elemento_rodada.get('class', [])
+        if numero is not None:
+            inicio = date(int(ano), int(mes), int(dia))
+            return RodadaTipada(
+                numero=numero,
+                rodada=_texto(valores, 'titulo'),
+                inicio=inicio,
+                rodada_atual=rodada_atual,
+                partidas=RodadasParser._parse_partidas_rodada(
+                    elemento_rodada, seletores, extrator_partida, times, inicio
+                )
+            )
         
-        partidas = RodadasParser._parse_partidas_rodada(elemento_rodada, seletores)
+        partidas = RodadasParser._parse_partidas_rodada(
+            elemento_rodada, seletores, extrator_partida, times
+        )
         
         return Rodada(
-            rodada=titulo_texto,
+            rodada=_texto(valores, 'titulo'),
             inicio=f"{dia}/{mes}/{ano}",
             rodada_atual=rodada_atual,
             partidas=partidas
         )
     
     @staticmethod
-    def _parse_partidas_rodada(elemento_rodada: Tag, seletores: Dict) -> List[Partida]:
+    def _parse_partidas_rodada(elemento_rodada: No, seletores: Dict, extrator,
+                               times: Optional[FrozenSet[str]] = None,
+                               inicio: Optional[date] = None) -> List[Partida]:
         """Extrai partidas de uma rodada específica"""
-        partidas = []
-        elementos_partidas = elemento_rodada.select(seletores['partidas'])
-        
-        for partida_element in elementos_partidas:
-            partida = RodadasParser._parse_partida(partida_element, seletores)
-            partidas.append(partida)
+        return list(RodadasParser._iter_partidas_rodada(elemento_rodada, seletores, extrator, times, inicio))
+    
+    @staticmethod
+    def _iter_partidas_rodada(elemento_rodada: No, seletores: Dict, extrator,
+                              times: Optional[FrozenSet[str]] = None,
+                              inicio: Optional[date] = None) -> Iterator[Union[Partida, PartidaTipada]]:
+        """
+        Gera as partidas de uma rodada, pulando as que não envolvem os times pedidos
         
-        return partidas
+        Com o início da rodada informado, gera PartidaTipada.
+        """
+        for partida_element in elemento_rodada.select(seletores['partidas']):
+            if times is not None and not RodadasParser._envolve_times(partida_element, seletores, times):
+                continue
+            if inicio is not None:
+                yield RodadasParser._parse_partida_tipada(partida_element, extrator, inicio)
+            else:
+                yield RodadasParser._parse_partida(partida_element, extrator)
     
     @staticmethod
-    def _parse_partida(partida_element: Tag, seletores: Dict) -> Partida:
-        """Extrai dados de uma partida específica"""
+    def _envolve_times(partida_element: No, seletores: Dict, times: FrozenSet[str]) -> bool:
+        """Verifica, lendo apenas o meta com os nomes, se a partida envolve algum dos times"""
         times_meta = partida_element.select_one(seletores['times_meta'])
-        if not times_meta or 'content' not in times_meta.attrs:
-            raise Exception("Erro ao obter informações da partida")
-        
-        times = times_meta['content']
-        time_casa, time_fora = [t.strip() for t in times.split("x")]
+        conteudo = times_meta.attr('content') if times_meta else None
+        if conteudo is None:
+            # Deixa o parsing completo reportar a partida malformada
+            return True
         
-        gols_casa = partida_element.select_one(seletores['gols_casa'])
-        gols_casa_texto = gols_casa.text.strip() if gols_casa else ''
+        time_casa, time_fora = _separar_times(conteudo)
+        return time_casa in times or time_fora in times
+    
+    @staticmethod
+    def _parse_partida(partida_element: No, extrator) -> Partida:
+        """Extrai dados de uma partida específica"""
+        valores = extrator.extrair(partida_element)
         
-        gols_fora = partida_element.select_one(seletores['gols_fora'])
-        gols_fora_texto = gols_fora.text.strip() if gols_fora else ''
+        times = valores['times_meta']
+        if times is None:
+            raise Exception("Erro ao obter informações da partida")
         
-        data_partida = partida_element.select_one(seletores['data_partida'])
-        data_texto = data_partida.text.strip() if data_partida else ''
+        time_casa, time_fora = _separar_times(times)
         
-        local_partida = partida_element.select_one(seletores['local'])
-        local_texto = local_partida.text.strip() if local_partida else ''
+        gols_casa_texto = _texto(valores, 'gols_casa')
+        gols_fora_texto = _texto(valores, 'gols_fora')
         
+        # Nomes, locais e textos repetidos entre coletas ficam uma única vez na memória
         return Partida(
-            partida=times,
-            data=data_texto,
-            local=local_texto,
+            partida=sys.intern(times),
+            data=_texto(valores, 'data_partida'),
+            local=sys.intern(_texto(valores, 'local')),
             time_casa=time_casa,
             time_fora=time_fora,
             gols_casa=gols_casa_texto,
             gols_fora=gols_fora_texto,
-            resultado_texto=f"{time_casa} {gols_casa_texto} x {gols_fora_texto} {time_fora}"
+            resultado_texto=sys.intern(f"{time_casa} {gols_casa_texto} x {gols_fora_texto} {time_fora}")
+        )
+    
+    @staticmethod
+    def _parse_partida_tipada(partida_element: No, extrator, inicio: date) -> PartidaTipada:
+        """Extrai dados de uma partida já convertidos (placar em int, horário em datetime)"""
+        valores = extrator.extrair(partida_element)
+        
+        times = valores['times_meta']
+        if times is None:
+            raise Exception("Erro ao obter informações da partida")
+        
+        time_casa, time_fora = _separar_times(times)
+        data_texto = _texto(valores, 'data_partida')
+        
+        return PartidaTipada(
+            partida=sys.intern(times),
+            data=DateUtils.data_partida_na_rodada(data_texto, inicio),
+            data_texto=data_texto,
+            local=sys.intern(_texto(valores, 'local')),
+            time_casa=time_casa,
+            time_fora=time_fora,
+            gols_casa=DataConverter.para_gols(_texto(valores, 'gols_casa')),
+            gols_fora=DataConverter.para_gols(_texto(valores, 'gols_fora'))
         )
@@ -0,0 +1,222 @@
+"""
+Plano de extração compilado a partir dos seletores CSS
+Preenche todos os campos de uma linha/partida em uma única passada pelos nós
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+from .config import CSS_SELECTORS, PARSER_CONFIG
+from .engines import No
+
+_COMPOSTO = re.compile(
+    r'^(?P<tag>[a-zA-Z][\w-]*)?(?P<resto>(?:\.[\w-]+|\[[\w-]+(?:="[^"]*")?\])*)$'
+)
+_TOKEN = re.compile(r'>|(?:[^\s>\[]+|\[[^\]]*\])+')
+_PARTE = re.compile(r'\.(?P<classe>[\w-]+)|\[(?P<attr>[\w-]+)(?:="(?P<valor>[^"]*)")?\]')
+
+class _Composto:
+    """Seletor simples (tag, classes e atributos) sem combinadores"""
+    
+    __slots__ = ('tag', 'classes', 'attrs')
+    
+    def __init__(self, texto: str):
+        match = _COMPOSTO.match(texto)
+        if not match or not texto:
+            raise ValueError(f"Seletor não suportado pelo plano de extração: {texto}")
+        
+        self.tag = match.group('tag').lower() if match.group('tag') else None
+        self.classes = []
+        self.attrs = []
+        for parte in _PARTE.finditer(match.group('resto')):
+            if parte.group('classe'):
+                self.classes.append(parte.group('classe'))
+            else:
+                self.attrs.append((parte.group('attr'), parte.group('valor')))
+    
+    def casa(self, no: No, tag: str, classes: List[str]) -> bool:
+        """Verifica se o nó casa com o seletor"""
+        if self.tag is not None and self.tag != tag:
+            return False
+        for classe in self.classes:
+            if classe not in classes:
+                return False
+        for nome, valor in self.attrs:
+            atual = no.attr(nome)
+            if atual is None or (valor is not None and atual != valor):
+                return False
+        return True
+
+class SeletorCompilado:
+    """Seletor CSS com combinadores de filho ('>') e descendente (' ')"""
+    
+    __slots__ = ('texto', 'alvo', 'ancestrais')
+    
+    def __init__(self, texto: str):
+        self.texto = texto
+        tokens = _TOKEN.findall(texto)
+        
+        compostos = []
+        combinadores = []
+        for token in tokens:
+            if token == '>':
+                combinadores[-1] = '>'
+            else:
+                compostos.append(_Composto(token))
+                combinadores.append(' ')
+        
+        # Armazena da direita para a esquerda: alvo e a cadeia de ancestrais
+        self.alvo = compostos[-1]
+        self.ancestrais = list(zip(reversed(combinadores[:-1]), reversed(compostos[:-1])))
+    
+    @property
+    def chave(self) -> Tuple[Optional[str], Optional[str]]:
+        """Tag e primeira classe do alvo, usadas para despachar os candidatos"""
+        return self.alvo.tag, (self.alvo.classes[0] if self.alvo.classes else None)
+    
+    def casa(self, no: No, tag: str, classes: List[str]) -> bool:
+        """Verifica se o nó casa com o seletor, subindo pela cadeia de ancestrais"""
+        if not self.alvo.casa(no, tag, classes):
+            return False
+        
+        atual = no
+        for combinador, composto in self.ancestrais:
+            atual = self._subir(atual, combinador, composto)
+            if atual is None:
+                return False
+        return True
+    
+    @staticmethod
+    def _subir(no: No, combinador: str, composto: _Composto) -> Optional[No]:
+        """Encontra o ancestral que satisfaz o próximo seletor da cadeia"""
+        pai = no.parent
+        while pai is not None:
+            if composto.casa(pai, pai.tag, pai.classes):
+                return pai
+            if combinador == '>':
+                return None
+            pai = pai.parent
+        return None
+
+class PlanoExtracao:
+    """Conjunto de campos extraídos de um nó em uma única passada"""
+    
+    def __init__(self, campos: Dict[str, Tuple[str, Optional[str]]]):
+        """
+        Compila os campos do plano
+        
+        Args:
+            campos: Mapa nome -> (seletor CSS, atributo). Com atributo None,
+                    o valor do campo é o texto do nó
+        """
+        self.campos = list(campos)
+        self._por_tag: Dict[str, List[Tuple[str, SeletorCompilado, Optional[str]]]] = {}
+        self._por_classe: Dict[str, List[Tuple[str, SeletorCompilado, Optional[str]]]] = {}
+        self._qualquer: List[Tuple[str, SeletorCompilado, Optional[str]]] = []
+        
+        for nome, (seletor, atributo) in campos.items():
+            compilado = SeletorCompilado(seletor)
+            item = (nome, compilado, atributo)
+            tag, classe = compilado.chave
+            if classe is not None:
+                self._por_classe.setdefault(classe, []).append(item)
+            elif tag is not None:
+                self._por_tag.setdefault(tag, []).append(item)
+            else:
+                self._qualquer.append(item)
+    
+    def extrair(self, raiz: No) -> Dict[str, Optional[str]]:
+        """
+        Percorre os descendentes da raiz uma única vez e preenche os campos
+        
+        Cada campo recebe o primeiro nó que casa com seu seletor, em ordem de
+        documento (mesma semântica de select_one).
+        
+        Args:
+            raiz: Nó da linha/partida/rodada
+            
+        Returns:
+            Mapa nome -> valor (None se não houver nó ou atributo correspondente)
+        """
+        valores: Dict[str, Optional[str]] = dict.fromkeys(self.campos)
+        resolvidos = set()
+        
+        for no in raiz.iter_descendants():
+            tag = no.tag
+            classes = no.classes
+            
+            candidatos = list(self._por_tag.get(tag, ()))
+            for classe in classes:
+                candidatos.extend(self._por_classe.get(classe, ()))
+            candidatos.extend(self._qualquer)
+            
+            for nome, seletor, atributo in candidatos:
+                if nome in resolvidos or not seletor.casa(no, tag, classes):
+                    continue
+                valores[nome] = no.text if atributo is None else no.attr(atributo)
+                resolvidos.add(nome)
+            
+            if len(resolvidos) == len(self.campos):
+                break
+        
+        return valores
+
+class ExtracaoPorSeletores:
+    """Extração campo a campo com um select_one por campo (caminho original)"""
+    
+    def __init__(self, campos: Dict[str, Tuple[str, Optional[str]]]):
+        self.campos = campos
+    
+    def extrair(self, raiz: No) -> Dict[str, Optional[str]]:
+        """Mesmo contrato de PlanoExtracao.extrair, com uma busca por campo"""
+        valores = {}
+        for nome, (seletor, atributo) in self.campos.items():
+            no = raiz.select_one(seletor)
+            if no is None:
+                valores[nome] = None
+            else:
+                valores[nome] = no.text if atributo is None else no.attr(atributo)
+        return valores
+
+def _campos(grupo: str, nomes: List[str],
+            atributos: Optional[Dict[str, str]] = None) -> Dict[str, Tuple[str, Optional[str]]]:
+    """Monta os campos de um plano a partir de CSS_SELECTORS"""
+    atributos = atributos or {}
+    return {nome: (CSS_SELECTORS[grupo][nome], atributos.get(nome)) for nome in nomes}
+
+CAMPOS = {
+    'time': _campos(
+        'tabela',
+        ['nome', 'escudo', 'posicao', 'pontos', 'jogos', 'vitorias', 'empates',
+         'derrotas', 'gols_pro', 'gols_contra', 'saldo_gols', 'aproveitamento'],
+        {'nome': 'title', 'escudo': 'src'}
+    ),
+    'rodada': _campos(
+        'rodadas',
+        ['data_rodada', 'titulo'],
+        {'data_rodada': 'data-date'}
+    ),
+    'partida': _campos(
+        'rodadas',
+        ['times_meta', 'gols_casa', 'gols_fora', 'data_partida', 'local'],
+        {'times_meta': 'content'}
+    )
+}
+
+# Planos compilados uma única vez a partir de CSS_SELECTORS
+PLANOS = {nome: PlanoExtracao(campos) for nome, campos in CAMPOS.items()}
+EXTRACOES_POR_SELETORES = {nome: ExtracaoPorSeletores(campos) for nome, campos in CAMPOS.items()}
+
+def obter_extrator(nome: str, plano: Optional[bool] = None):
+    """
+    Retorna o extrator de um grupo de campos ('time', 'rodada' ou 'partida')
+    
+    Args:
+        nome: Grupo de campos
+        plano: Se deve usar o plano compilado; None usa PARSER_CONFIG['plano_extracao']
+        
+    Returns:
+        PlanoExtracao ou ExtracaoPorSeletores
+    """
+    if plano is None:
+        plano = PARSER_CONFIG['plano_extracao']
+    return PLANOS[nome] if plano else EXTRACOES_POR_SELETORES[nome]
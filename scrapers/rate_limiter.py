@@ -0,0 +1,169 @@
+"""
+Limitador de taxa (token bucket) por host para o projeto Brasileirão
+Compartilhado por todos os clientes de um processo e, opcionalmente, entre processos
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+from .config import RATE_LIMIT_CONFIG
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows não tem fcntl
+    fcntl = None
+
+class TokenBucket:
+    """Token bucket com reposição contínua, seguro entre threads"""
+    
+    def __init__(self, taxa: float, rajada: int):
+        """
+        Inicializa o bucket cheio
+        
+        Args:
+            taxa: Tokens repostos por segundo (requisições por segundo)
+            rajada: Capacidade máxima do bucket
+        """
+        if taxa <= 0 or rajada < 1:
+            raise ValueError("taxa deve ser positiva e rajada pelo menos 1")
+        self.taxa = float(taxa)
+        self.rajada = float(rajada)
+        self._tokens = self.rajada
+        self._atualizado = self._agora()
+        self._lock = threading.Lock()
+    
+    def adquirir(self, timeout: Optional[float] = None) -> bool:
+        """
+        Consome um token, esperando a reposição se necessário
+        
+        Args:
+            timeout: Tempo máximo de espera em segundos (None espera indefinidamente)
+            
+        Returns:
+            True se o token foi obtido, False se o timeout expirou antes
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                espera = self._consumir()
+            if espera == 0:
+                return True
+            if limite is not None and time.monotonic() + espera > limite:
+                return False
+            time.sleep(espera)
+    
+    def _agora(self) -> float:
+        """Relógio da reposição: monotônico, imune a ajustes do relógio do sistema"""
+        return time.monotonic()
+    
+    def _consumir(self) -> float:
+        """Tenta consumir um token; retorna 0 se conseguiu ou a espera necessária"""
+        agora = self._agora()
+        self._tokens, self._atualizado = self._repor(self._tokens, self._atualizado, agora)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.taxa
+    
+    def _repor(self, tokens: float, atualizado: float, agora: float):
+        """Calcula os tokens disponíveis após o tempo decorrido"""
+        decorrido = max(agora - atualizado, 0)
+        return min(self.rajada, tokens + decorrido * self.taxa), agora
+
+class TokenBucketArquivo(TokenBucket):
+    """Token bucket cujo estado fica em um arquivo protegido por flock, compartilhado entre processos"""
+    
+    def __init__(self, taxa: float, rajada: int, arquivo: str):
+        """
+        Inicializa o bucket
+        
+        Args:
+            taxa: Tokens repostos por segundo (requisições por segundo)
+            rajada: Capacidade máxima do bucket
+            arquivo: Arquivo de estado compartilhado entre os processos
+        """
+        super().__init__(taxa, rajada)
+        self.arquivo = Path(arquivo)
+        self.arquivo.parent.mkdir(parents=True, exist_ok=True)
+    
+    def _agora(self) -> float:
+        """Relógio de parede, comparável entre processos que gravam no mesmo arquivo"""
+        return time.time()
+    
+    def _consumir(self) -> float:
+        fd = os.open(self.arquivo, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            
+            conteudo = os.read(fd, 4096)
+            agora = self._agora()
+            try:
+                estado = json.loads(conteudo)
+                tokens, atualizado = estado['tokens'], estado['atualizado']
+            except (ValueError, KeyError, TypeError):
+                tokens, atualizado = self.rajada, agora
+            
+            tokens, atualizado = self._repor(tokens, atualizado, agora)
+            espera = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                espera = (1 - tokens) / self.taxa
+            
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, json.dumps({'tokens': tokens, 'atualizado': atualizado}).encode('utf-8'))
+            return espera
+        finally:
+            os.close(fd)  # fechar o descritor libera o flock
+
+_buckets: Dict[str, TokenBucket] = {}
+_lock_registro = threading.Lock()
+
+def obter_limitador(host: str) -> TokenBucket:
+    """
+    Retorna o limitador compartilhado de um host, criando-o na primeira vez
+    
+    Args:
+        host: Nome do host (ex. 'p1.trrsf.com')
+        
+    Returns:
+        TokenBucket do host
+    """
+    with _lock_registro:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            config = {**RATE_LIMIT_CONFIG, **RATE_LIMIT_CONFIG['hosts'].get(host, {})}
+            diretorio = config['diretorio_lock']
+            if diretorio and fcntl is not None:
+                bucket = TokenBucketArquivo(
+                    config['taxa'], config['rajada'], os.path.join(diretorio, f"{host}.bucket")
+                )
+            else:
+                bucket = TokenBucket(config['taxa'], config['rajada'])
+            _buckets[host] = bucket
+        return bucket
+
+def aguardar_vez(url: str, timeout: Optional[float] = None) -> bool:
+    """
+    Aguarda a liberação do limitador do host de uma URL
+    
+    Args:
+        url: URL que será requisitada
+        timeout: Tempo máximo de espera em segundos
+        
+    Returns:
+        True se a requisição pode seguir, False se o timeout expirou
+    """
+    if not RATE_LIMIT_CONFIG['habilitado']:
+        return True
+    return obter_limitador(urlsplit(url).hostname or '').adquirir(timeout)
+
+def redefinir_limitadores():
+    """Descarta os limitadores criados (útil após mudar RATE_LIMIT_CONFIG)"""
+    with _lock_registro:
+        _buckets.clear()
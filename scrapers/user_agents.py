@@ -0,0 +1,61 @@
+"""
+Pool de User-Agents embutido no projeto Brasileirão
+Sorteio ponderado em O(1), sem carregar bases externas na inicialização
+"""
+
+import random
+from functools import lru_cache
+from typing import Sequence, Tuple
+from .config import REQUEST_CONFIG
+
+# User-Agents de navegadores desktop e mobile comuns, com peso aproximado de uso
+USER_AGENTS: Tuple[Tuple[str, int], ...] = (
+    ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36", 30),
+    ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36", 15),
+    ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36 Edg/124.0.0.0", 10),
+    ("Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0", 6),
+    ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36", 8),
+    ("Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4.1 Safari/605.1.15", 7),
+    ("Mozilla/5.0 (Macintosh; Intel Mac OS X 14.4; rv:125.0) Gecko/20100101 Firefox/125.0", 2),
+    ("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36", 4),
+    ("Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:125.0) Gecko/20100101 Firefox/125.0", 2),
+    ("Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Mobile Safari/537.36", 8),
+    ("Mozilla/5.0 (iPhone; CPU iPhone OS 17_4_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4.1 Mobile/15E148 Safari/604.1", 6),
+    ("Mozilla/5.0 (Linux; Android 14; SM-S918B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Mobile Safari/537.36", 2)
+)
+
+class PoolUserAgents:
+    """Pool de User-Agents com a mesma interface de fake_useragent.UserAgent (atributo random)"""
+    
+    def __init__(self, user_agents: Sequence[Tuple[str, int]] = USER_AGENTS):
+        """
+        Prepara a tabela de sorteio
+        
+        Args:
+            user_agents: Pares (User-Agent, peso inteiro)
+        """
+        # Cada UA aparece "peso" vezes, então random.choice respeita os pesos em O(1)
+        self._tabela = tuple(ua for ua, peso in user_agents for _ in range(peso))
+        if not self._tabela:
+            raise ValueError("O pool de User-Agents está vazio")
+    
+    @property
+    def random(self) -> str:
+        """Sorteia um User-Agent de acordo com os pesos"""
+        return random.choice(self._tabela)
+
+@lru_cache(maxsize=None)
+def obter_pool():
+    """
+    Retorna o pool de User-Agents do processo, criado na primeira chamada
+    
+    Com REQUEST_CONFIG['fonte_user_agent'] == 'fake_useragent' e o pacote
+    instalado, usa fake_useragent; caso contrário, o pool embutido.
+    """
+    if REQUEST_CONFIG['fonte_user_agent'] == 'fake_useragent':
+        try:
+            from fake_useragent import UserAgent
+            return UserAgent()
+        except ImportError:
+            pass
+    return PoolUserAgents()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Script de coleta contínua guiada pelo calendário
+Coleta com frequência durante os jogos e raramente fora deles
+"""
+
+import sys
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.agendador import AgendadorColetas
+from src.elo import RatingsElo
+from src.models import DadosBrasileirao
+from src.utils import DataConverter, DateUtils, JSONUtils, FUSO_BRASILIA
+
+def criar_salvamento(serie: str, diretorio_base: Path, compacto: bool = False):
+    """Cria a função que salva cada coleta na pasta do dia"""
+    def salvar(tabela, rodadas):
+        hoje = datetime.now(FUSO_BRASILIA).strftime("%Y-%m-%d")
+        dir_dados = diretorio_base / hoje
+        dir_dados.mkdir(parents=True, exist_ok=True)
+        
+        dados = DataConverter.dados_brasileirao_to_dict(DadosBrasileirao(tabela=tabela, rodadas=rodadas))
+        arquivo = dir_dados / f"{serie}.json"
+        if JSONUtils.save_to_json(dados, str(arquivo), compacto=compacto):
+            print(f"💾 {datetime.now(FUSO_BRASILIA).strftime('%H:%M:%S')} - {serie} salva em: {arquivo}")
+    
+    return salvar
+
+def criar_atualizacao_elo(arquivo: str, serie: str):
+    """Cria a função que aplica as partidas encerradas aos ratings e os grava"""
+    elo = RatingsElo.carregar(arquivo)
+    
+    def atualizar(tabela, rodadas):
+        nonlocal elo
+        agora = datetime.now(FUSO_BRASILIA)
+        if elo is None:
+            elo = RatingsElo.de_rodadas(rodadas, agora, campeonato=serie)
+            alteradas = len(elo.ajustes)
+        else:
+            # Partidas já aplicadas (mesmo campeonato, temporada e rodada) são ignoradas em O(1)
+            alteradas = sum(
+                elo.atualizar(partida, numero, temporada)
+                for numero, temporada, partida in DateUtils.partidas_em_ordem(rodadas, agora)
+            )
+        if alteradas:
+            elo.salvar(arquivo)
+            lider, rating = elo.ranking()[0]
+            print(f"📈 Elo: {alteradas} partida(s) aplicada(s); líder {lider} ({rating:.0f})")
+    
+    return atualizar
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Coleta contínua do Brasileirão guiada pelo calendário")
+    parser.add_argument('--serie', default='serie_a', choices=['serie_a', 'serie_b'], help="Série a coletar")
+    parser.add_argument('--intervalo-ao-vivo', type=float, default=60, help="Segundos entre coletas durante os jogos")
+    parser.add_argument('--intervalo-ocioso', type=float, default=6 * 3600, help="Segundos máximos entre coletas sem jogos")
+    parser.add_argument('--max-coletas', type=int, default=None, help="Encerra após N coletas")
+    parser.add_argument('--elo', default=None, help="Arquivo JSON dos ratings Elo, atualizados a cada coleta")
+    parser.add_argument('--compacto', action='store_true', help="Grava o JSON sem indentação")
+    args = parser.parse_args()
+    
+    diretorio_base = Path(__file__).parent.parent / "dados_coletados"
+    print(f"⏰ Agendador de coletas - {args.serie}")
+    
+    salvar = criar_salvamento(args.serie, diretorio_base, args.compacto)
+    ao_coletar = salvar
+    if args.elo:
+        atualizar_elo = criar_atualizacao_elo(args.elo, args.serie)
+        
+        def ao_coletar(tabela, rodadas):
+            salvar(tabela, rodadas)
+            atualizar_elo(tabela, rodadas)
+    
+    with AgendadorColetas(
+        args.serie,
+        intervalo_ao_vivo=args.intervalo_ao_vivo,
+        intervalo_ocioso=args.intervalo_ocioso,
+        ao_coletar=ao_coletar
+    ) as agendador:
+        try:
+            agendador.executar(args.max_coletas)
+        except KeyboardInterrupt:
+            print("\n⏹️  Agendador interrompido")
+        finally:
+            print(f"📡 Requisições realizadas: {agendador.total_requisicoes}")
+
+if __name__ == "__main__":
+    main()
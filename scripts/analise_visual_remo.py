@@ -15,6 +15,10 @@ from pathlib import Path
 # Adiciona o diretório pai ao path para importar a biblioteca
 sys.path.append(str(Path(__file__).parent.parent))
 
+from src.agregados import AgregadosTimes
+from src.indice import IndiceTemporada
+from src.utils import DataConverter
+
 def carregar_dados_remo():
     """Carrega dados específicos do Remo"""
     print("🦅 Carregando dados do Clube do Remo...")
@@ -34,24 +38,21 @@ def carregar_dados_remo():
             remo_tabela = time
             break
     
-    # Encontrar partidas do Remo
+    # Encontrar partidas do Remo pelo índice por time (nome exato, sem varrer as partidas)
+    rodadas = [DataConverter.rodada_from_dict(r) for r in rodadas_data['rodadas']]
+    indice = IndiceTemporada(rodadas)
+    titulos = {DataConverter.numero_rodada(r.rodada): r.rodada for r in rodadas}
+    
     partidas_remo = []
-    for rodada in rodadas_data['rodadas']:
-        for partida in rodada['partidas']:
-            if 'Remo' in partida['partida']:
-                partidas_remo.append({
-                    'rodada': rodada['rodada'],
-                    'data': partida['data'],
-                    'partida': partida['partida'],
-                    'local': partida['local'],
-                    'time_casa': partida['time_casa'],
-                    'time_fora': partida['time_fora'],
-                    'gols_casa': partida['gols_casa'],
-                    'gols_fora': partida['gols_fora'],
-                    'resultado_texto': partida['resultado_texto']
-                })
-    
-    return remo_tabela, partidas_remo
+    for i in indice.indices_do_time('Remo'):
+        partida = DataConverter.partida_to_dict(indice.partidas[i])
+        partida['rodada'] = titulos.get(indice.rodada[i], str(indice.rodada[i]))
+        partidas_remo.append(partida)
+    
+    # Totais por adversário e casa/fora vêm dos agregados, montados uma vez
+    remo_agregado = AgregadosTimes.de_rodadas(rodadas)['Remo']
+    
+    return remo_tabela, partidas_remo, remo_agregado
 
 def criar_grafico_performance_geral(remo_tabela):
     """Cria gráfico de performance geral do Remo"""
@@ -142,55 +143,18 @@ def criar_grafico_gols(partidas_remo):
     
     return fig
 
-def criar_grafico_performance_adversarios(partidas_remo):
+def criar_grafico_performance_adversarios(remo_agregado):
     """Cria gráfico de performance por adversário"""
     print("🎯 Criando gráfico de performance por adversário...")
     
-    adversarios = {}
-    
-    for partida in partidas_remo:
-        # Pular jogos sem resultado
-        if partida['gols_casa'] == '' or partida['gols_fora'] == '':
-            continue
-            
-        if partida['time_casa'] == 'Remo':
-            adversario = partida['time_fora']
-            gols_remo = int(partida['gols_casa'])
-            gols_adversario = int(partida['gols_fora'])
-        else:
-            adversario = partida['time_casa']
-            gols_remo = int(partida['gols_fora'])
-            gols_adversario = int(partida['gols_casa'])
-        
-        if adversario not in adversarios:
-            adversarios[adversario] = {
-                'jogos': 0,
-                'vitorias': 0,
-                'empates': 0,
-                'derrotas': 0,
-                'gols_pro': 0,
-                'gols_contra': 0
-            }
-        
-        adversarios[adversario]['jogos'] += 1
-        adversarios[adversario]['gols_pro'] += gols_remo
-        adversarios[adversario]['gols_contra'] += gols_adversario
-        
-        if gols_remo > gols_adversario:
-            adversarios[adversario]['vitorias'] += 1
-        elif gols_remo == gols_adversario:
-            adversarios[adversario]['empates'] += 1
-        else:
-            adversarios[adversario]['derrotas'] += 1
-    
     # Preparar dados para o gráfico
     nomes_adversarios = []
     aproveitamentos = []
     cores = []
     
-    for adversario, stats in adversarios.items():
-        if stats['jogos'] > 0:
-            aproveitamento = ((stats['vitorias'] * 3 + stats['empates']) / (stats['jogos'] * 3)) * 100
+    for adversario, totais in remo_agregado.adversarios.items():
+        if totais.jogos > 0:
+            aproveitamento = totais.aproveitamento
             nomes_adversarios.append(adversario)
             aproveitamentos.append(aproveitamento)
             
@@ -227,46 +191,12 @@ def criar_grafico_performance_adversarios(partidas_remo):
     
     return fig
 
-def criar_grafico_casa_fora(partidas_remo):
+def criar_grafico_casa_fora(remo_agregado):
     """Cria gráfico comparando performance em casa vs fora"""
     print("🏠 Criando gráfico casa vs fora...")
     
-    casa_stats = {'jogos': 0, 'vitorias': 0, 'empates': 0, 'derrotas': 0}
-    fora_stats = {'jogos': 0, 'vitorias': 0, 'empates': 0, 'derrotas': 0}
-    
-    for partida in partidas_remo:
-        # Pular jogos sem resultado
-        if partida['gols_casa'] == '' or partida['gols_fora'] == '':
-            continue
-            
-        if partida['time_casa'] == 'Remo':
-            casa_stats['jogos'] += 1
-            gols_remo = int(partida['gols_casa'])
-            gols_adversario = int(partida['gols_fora'])
-        else:
-            fora_stats['jogos'] += 1
-            gols_remo = int(partida['gols_fora'])
-            gols_adversario = int(partida['gols_casa'])
-        
-        if gols_remo > gols_adversario:
-            if partida['time_casa'] == 'Remo':
-                casa_stats['vitorias'] += 1
-            else:
-                fora_stats['vitorias'] += 1
-        elif gols_remo == gols_adversario:
-            if partida['time_casa'] == 'Remo':
-                casa_stats['empates'] += 1
-            else:
-                fora_stats['empates'] += 1
-        else:
-            if partida['time_casa'] == 'Remo':
-                casa_stats['derrotas'] += 1
-            else:
-                fora_stats['derrotas'] += 1
-    
-    # Calcular aproveitamentos
-    aproveitamento_casa = ((casa_stats['vitorias'] * 3 + casa_stats['empates']) / (casa_stats['jogos'] * 3)) * 100 if casa_stats['jogos'] > 0 else 0
-    aproveitamento_fora = ((fora_stats['vitorias'] * 3 + fora_stats['empates']) / (fora_stats['jogos'] * 3)) * 100 if fora_stats['jogos'] > 0 else 0
+    aproveitamento_casa = remo_agregado.casa.aproveitamento
+    aproveitamento_fora = remo_agregado.fora.aproveitamento
     
     fig = go.Figure(data=[
         go.Bar(
@@ -293,7 +223,7 @@ def criar_grafico_casa_fora(partidas_remo):
     
     return fig
 
-def criar_dashboard_completo(remo_tabela, partidas_remo):
+def criar_dashboard_completo(remo_tabela, partidas_remo, remo_agregado):
     """Cria dashboard completo com todos os gráficos"""
     print("📊 Criando dashboard completo...")
     
@@ -346,38 +276,8 @@ def criar_dashboard_completo(remo_tabela, partidas_remo):
     )
     
     # Gráfico 3: Performance por Adversário
-    adversarios = {}
-    for partida in partidas_remo:
-        if partida['gols_casa'] == '' or partida['gols_fora'] == '':
-            continue
-            
-        if partida['time_casa'] == 'Remo':
-            adversario = partida['time_fora']
-            gols_remo = int(partida['gols_casa'])
-            gols_adversario = int(partida['gols_fora'])
-        else:
-            adversario = partida['time_casa']
-            gols_remo = int(partida['gols_fora'])
-            gols_adversario = int(partida['gols_casa'])
-        
-        if adversario not in adversarios:
-            adversarios[adversario] = {'jogos': 0, 'vitorias': 0, 'empates': 0, 'derrotas': 0}
-        
-        adversarios[adversario]['jogos'] += 1
-        if gols_remo > gols_adversario:
-            adversarios[adversario]['vitorias'] += 1
-        elif gols_remo == gols_adversario:
-            adversarios[adversario]['empates'] += 1
-        else:
-            adversarios[adversario]['derrotas'] += 1
-    
-    nomes_adversarios = []
-    aproveitamentos = []
-    for adversario, stats in adversarios.items():
-        if stats['jogos'] > 0:
-            aproveitamento = ((stats['vitorias'] * 3 + stats['empates']) / (stats['jogos'] * 3)) * 100
-            nomes_adversarios.append(adversario)
-            aproveitamentos.append(aproveitamento)
+    nomes_adversarios = list(remo_agregado.adversarios)
+    aproveitamentos = [totais.aproveitamento for totais in remo_agregado.adversarios.values()]
     
     fig.add_trace(
         go.Bar(x=nomes_adversarios, y=aproveitamentos, name='Aproveitamento'),
@@ -385,40 +285,8 @@ def criar_dashboard_completo(remo_tabela, partidas_remo):
     )
     
     # Gráfico 4: Casa vs Fora
-    casa_stats = {'jogos': 0, 'vitorias': 0, 'empates': 0, 'derrotas': 0}
-    fora_stats = {'jogos': 0, 'vitorias': 0, 'empates': 0, 'derrotas': 0}
-    
-    for partida in partidas_remo:
-        if partida['gols_casa'] == '' or partida['gols_fora'] == '':
-            continue
-            
-        if partida['time_casa'] == 'Remo':
-            casa_stats['jogos'] += 1
-            gols_remo = int(partida['gols_casa'])
-            gols_adversario = int(partida['gols_fora'])
-        else:
-            fora_stats['jogos'] += 1
-            gols_remo = int(partida['gols_fora'])
-            gols_adversario = int(partida['gols_casa'])
-        
-        if gols_remo > gols_adversario:
-            if partida['time_casa'] == 'Remo':
-                casa_stats['vitorias'] += 1
-            else:
-                fora_stats['vitorias'] += 1
-        elif gols_remo == gols_adversario:
-            if partida['time_casa'] == 'Remo':
-                casa_stats['empates'] += 1
-            else:
-                fora_stats['empates'] += 1
-        else:
-            if partida['time_casa'] == 'Remo':
-                casa_stats['derrotas'] += 1
-            else:
-                fora_stats['derrotas'] += 1
-    
-    aproveitamento_casa = ((casa_stats['vitorias'] * 3 + casa_stats['empates']) / (casa_stats['jogos'] * 3)) * 100 if casa_stats['jogos'] > 0 else 0
-    aproveitamento_fora = ((fora_stats['vitorias'] * 3 + fora_stats['empates']) / (fora_stats['jogos'] * 3)) * 100 if fora_stats['jogos'] > 0 else 0
+    aproveitamento_casa = remo_agregado.casa.aproveitamento
+    aproveitamento_fora = remo_agregado.fora.aproveitamento
     
     fig.add_trace(
         go.Bar(x=['Em Casa', 'Fora'], y=[aproveitamento_casa, aproveitamento_fora], name='Casa vs Fora'),
@@ -467,7 +335,7 @@ def main():
     
     try:
         # Carregar dados
-        remo_tabela, partidas_remo = carregar_dados_remo()
+        remo_tabela, partidas_remo, remo_agregado = carregar_dados_remo()
         
         if not remo_tabela:
             print("❌ Erro: Dados do Remo não encontrados!")
@@ -479,9 +347,9 @@ def main():
         figuras = {
             'performance_geral': criar_grafico_performance_geral(remo_tabela),
             'gols': criar_grafico_gols(partidas_remo),
-            'adversarios': criar_grafico_performance_adversarios(partidas_remo),
-            'casa_fora': criar_grafico_casa_fora(partidas_remo),
-            'dashboard': criar_dashboard_completo(remo_tabela, partidas_remo)
+            'adversarios': criar_grafico_performance_adversarios(remo_agregado),
+            'casa_fora': criar_grafico_casa_fora(remo_agregado),
+            'dashboard': criar_dashboard_completo(remo_tabela, partidas_remo, remo_agregado)
         }
         
         # Salvar gráficos
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark de inicialização do cliente HTTP
+Mede o tempo de criar o HTTPClient e de sortear User-Agents com o pool
+embutido e, se instalado, com o fake-useragent
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from scrapers.config import REQUEST_CONFIG
+from scrapers.http_client import HTTPClient
+from scrapers.user_agents import obter_pool
+
+def medir(funcao, repeticoes):
+    """Executa a função várias vezes e retorna o melhor tempo em ms"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor * 1000
+
+def medir_fonte(fonte, repeticoes, sorteios):
+    """Mede a primeira criação do cliente (frio), as seguintes e os sorteios"""
+    REQUEST_CONFIG['fonte_user_agent'] = fonte
+    obter_pool.cache_clear()
+    
+    def criar_cliente():
+        HTTPClient().close()
+    
+    frio = medir(criar_cliente, 1)
+    quente = medir(criar_cliente, repeticoes)
+    pool = obter_pool()
+    
+    inicio = time.perf_counter()
+    for _ in range(sorteios):
+        pool.random
+    por_sorteio = (time.perf_counter() - inicio) / sorteios * 1e6
+    
+    return type(pool).__name__, frio, quente, por_sorteio
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização do HTTPClient")
+    parser.add_argument("--repeticoes", type=int, default=20, help="Repetições por medição")
+    parser.add_argument("--sorteios", type=int, default=10000, help="User-Agents sorteados")
+    args = parser.parse_args()
+    
+    fontes = ['embutido']
+    try:
+        import fake_useragent  # noqa: F401
+        fontes.append('fake_useragent')
+    except ImportError:
+        print("fake-useragent não instalado; medindo apenas o pool embutido")
+    
+    print(f"{'fonte':<16}{'pool':<18}{'1º cliente':>12}{'cliente':>12}{'sorteio':>12}")
+    for fonte in fontes:
+        nome, frio, quente, sorteio = medir_fonte(fonte, args.repeticoes, args.sorteios)
+        print(f"{fonte:<16}{nome:<18}{frio:>10.2f}ms{quente:>10.2f}ms{sorteio:>10.2f}µs")
+
+if __name__ == "__main__":
+    main()
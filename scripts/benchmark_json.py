@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark da serialização JSON
+Mede vazão de escrita/leitura e tamanho dos arquivos coletados em cada
+backend instalado, nos modos indentado e compacto
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.serializacao import backends_disponiveis, codificar, decodificar
+
+DIRETORIO_PADRAO = Path(__file__).parent.parent / "dados_coletados"
+
+def medir(funcao, repeticoes):
+    """Executa a função várias vezes e retorna o melhor tempo em segundos"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark da serialização JSON")
+    parser.add_argument('--diretorio', default=str(DIRETORIO_PADRAO), help="Pasta com os JSON coletados")
+    parser.add_argument('--repeticoes', type=int, default=20, help="Repetições por medição")
+    args = parser.parse_args()
+    
+    arquivos = sorted(Path(args.diretorio).rglob('*.json'))
+    if not arquivos:
+        print(f"❌ Nenhum JSON encontrado em {args.diretorio}")
+        return
+    
+    print(f"⏱️  Benchmark JSON: {len(arquivos)} arquivo(s), backends: {', '.join(backends_disponiveis())}")
+    print(f"{'arquivo':<32} {'backend':<8} {'modo':<10} {'tamanho':>10} {'escrita':>19} {'leitura':>19}")
+    
+    for arquivo in arquivos:
+        original = arquivo.read_bytes()
+        dados = decodificar(original, 'json')
+        # Vazão medida sobre o tamanho do arquivo original, para comparar os modos
+        mb = len(original) / 1e6
+        nome = str(arquivo.relative_to(args.diretorio))
+        
+        for backend in backends_disponiveis():
+            for compacto in (False, True):
+                conteudo = codificar(dados, compacto, backend)
+                if decodificar(conteudo, backend) != dados:
+                    print(f"❌ {nome} {backend}: leitura diferente dos dados originais")
+                if not compacto and conteudo != original:
+                    print(f"⚠️  {nome} {backend}: texto indentado difere do arquivo salvo")
+                
+                escrita = medir(lambda: codificar(dados, compacto, backend), args.repeticoes)
+                leitura = medir(lambda: decodificar(conteudo, backend), args.repeticoes)
+                print(f"{nome:<32} {backend:<8} {'compacto' if compacto else 'indentado':<10} "
+                      f"{len(conteudo) / 1024:>8.1f}KB "
+                      f"{escrita * 1000:>7.2f}ms {mb / escrita:>5.0f}MB/s "
+                      f"{leitura * 1000:>7.2f}ms {mb / leitura:>5.0f}MB/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos parsers do Brasileirão
+Compara engines de parsing e o plano de extração compilado contra o caminho
+original (um select_one por campo), usando HTML gerado a partir dos dados coletados
+"""
+
+import sys
+import json
+import time
+import argparse
+from html import escape
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from scrapers.engines import criar_documento, engines_disponiveis
+from scrapers.parsers import TabelaParser, RodadasParser
+
+ARQUIVO_PADRAO = Path(__file__).parent.parent / "dados_coletados" / "2025-09-09" / "serie_b.json"
+
+def gerar_html_tabela(tabela):
+    """Gera um HTML equivalente à página da tabela de classificação"""
+    linhas = []
+    for time_ in tabela:
+        colunas = [
+            f'<td class="position">{escape(time_["posicao"])}</td>',
+            f'<td class="shield"><a href="#"><img src="{escape(time_["escudo"])}"></a></td>',
+            f'<td class="team-name"><a href="#" title="{escape(time_["nome"])}">{escape(time_["nome"])}</a></td>',
+            f'<td class="points">{escape(time_["pontos"])}</td>'
+        ]
+        for campo, titulo in (('jogos', 'Jogos'), ('vitorias', 'Vitórias'), ('empates', 'Empates'),
+                              ('derrotas', 'Derrotas'), ('gols_pro', 'Gols Pró'),
+                              ('gols_contra', 'Gols Contra'), ('saldo_gols', 'Saldo de Gols')):
+            colunas.append(f'<td title="{titulo}">{escape(time_[campo])}</td>')
+        colunas.append(f'<td title="Aproveitamento">{escape(time_["aproveitamento"].rstrip("%"))}</td>')
+        linhas.append(f'<tr>{"".join(colunas)}</tr>')
+    
+    return f'<html><body><table><tbody>{"".join(linhas)}</tbody></table></body></html>'
+
+def gerar_html_rodadas(rodadas):
+    """Gera um HTML equivalente à página de rodadas e partidas"""
+    itens = []
+    for rodada in rodadas:
+        dia, mes, ano = rodada['inicio'].split('/')
+        partidas = []
+        for partida in rodada['partidas']:
+            partidas.append(
+                '<li class="match">'
+                f'<meta itemprop="name" content="{escape(partida["partida"])}">'
+                '<div class="details">'
+                f'<strong class="date-manager">{escape(partida["data"])}</strong>'
+                f'<span class="stadium">{escape(partida["local"])}</span>'
+                '</div>'
+                f'<span class="goals home">{escape(partida["gols_casa"])}</span>'
+                f'<span class="goals away">{escape(partida["gols_fora"])}</span>'
+                '</li>'
+            )
+        classe = ' class="round"' if rodada['rodada_atual'] else ''
+        itens.append(
+            f'<li{classe}><h3>{escape(rodada["rodada"])}</h3>'
+            f'<br class="date-round" data-date="{ano}-{mes}-{dia} 00:00:00">'
+            f'<ul>{"".join(partidas)}</ul></li>'
+        )
+    
+    return f'<html><body><ul class="rounds">{"".join(itens)}</ul></body></html>'
+
+def medir(funcao, repeticoes):
+    """Executa a função várias vezes e retorna o melhor tempo em milissegundos"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor * 1000
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark dos parsers do Brasileirão")
+    parser.add_argument('--arquivo', default=str(ARQUIVO_PADRAO), help="JSON coletado usado para gerar o HTML")
+    parser.add_argument('--repeticoes', type=int, default=5, help="Repetições por medição")
+    args = parser.parse_args()
+    
+    with open(args.arquivo, 'r', encoding='utf-8') as f:
+        dados = json.load(f)
+    
+    html_tabela = gerar_html_tabela(dados['tabela'])
+    html_rodadas = gerar_html_rodadas(dados['rodadas'])
+    total_partidas = sum(len(r['partidas']) for r in dados['rodadas'])
+    
+    print(f"⏱️  Benchmark de parsing: {len(dados['tabela'])} times, "
+          f"{len(dados['rodadas'])} rodadas, {total_partidas} partidas")
+    print(f"{'engine':<12} {'etapa':<10} {'seletores':>12} {'plano':>12} {'ganho':>8}")
+    
+    referencia = None
+    for engine in engines_disponiveis():
+        inicio = time.perf_counter()
+        doc_tabela = criar_documento(html_tabela, engine)
+        doc_rodadas = criar_documento(html_rodadas, engine)
+        construcao = (time.perf_counter() - inicio) * 1000
+        
+        resultado = (
+            TabelaParser.parse_tabela(doc_tabela, plano=True),
+            RodadasParser.parse_rodadas(doc_rodadas, plano=True)
+        )
+        if resultado != (TabelaParser.parse_tabela(doc_tabela, plano=False),
+                         RodadasParser.parse_rodadas(doc_rodadas, plano=False)):
+            print(f"❌ {engine}: plano e seletores produziram modelos diferentes")
+        if referencia is None:
+            referencia = resultado
+        elif resultado != referencia:
+            print(f"❌ {engine}: modelos diferentes dos da engine {engines_disponiveis()[0]}")
+        
+        for etapa, funcao, doc in (('tabela', TabelaParser.parse_tabela, doc_tabela),
+                                   ('rodadas', RodadasParser.parse_rodadas, doc_rodadas)):
+            antes = medir(lambda: funcao(doc, plano=False), args.repeticoes)
+            depois = medir(lambda: funcao(doc, plano=True), args.repeticoes)
+            print(f"{engine:<12} {etapa:<10} {antes:>10.2f}ms {depois:>10.2f}ms {antes / depois:>7.1f}x")
+        
+        print(f"{engine:<12} {'árvore':<10} {construcao:>10.2f}ms")
+
+if __name__ == "__main__":
+    main()
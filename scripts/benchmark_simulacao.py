@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark do simulador Monte Carlo
+Mede temporadas simuladas por segundo com o restante da temporada coletada
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.utils import DataConverter
+from src.arrays import ArraysTemporada
+from src.simulacao import SimuladorTemporada
+
+ARQUIVO_PADRAO = Path(__file__).parent.parent / "dados_coletados" / "2025-09-09" / "serie_b.json"
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Benchmark do simulador de temporadas")
+    parser.add_argument("--arquivo", default=str(ARQUIVO_PADRAO), help="JSON com tabela e rodadas")
+    parser.add_argument("--temporadas", type=int, default=1_000_000, help="Temporadas simuladas")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 0],
+                        help="Processos a comparar (0 usa todos os núcleos)")
+    parser.add_argument("--semente", type=int, default=2025, help="Semente do sorteio")
+    args = parser.parse_args()
+    
+    with open(args.arquivo, 'r', encoding='utf-8') as f:
+        dados = DataConverter.dados_brasileirao_from_dict(json.load(f))
+    
+    inicio = time.perf_counter()
+    simulador = SimuladorTemporada(ArraysTemporada.de_dados(dados))
+    print(f"Preparação: {(time.perf_counter() - inicio) * 1000:.1f}ms "
+          f"({len(simulador.restantes)} partidas restantes)")
+    
+    resultado = None
+    for workers in args.workers:
+        inicio = time.perf_counter()
+        resultado = simulador.simular(args.temporadas, workers=workers or None, semente=args.semente)
+        tempo = time.perf_counter() - inicio
+        print(f"workers={workers or 'todos':<6} {args.temporadas:,} temporadas em {tempo:.2f}s "
+              f"({args.temporadas / tempo:,.0f}/s)")
+    
+    print(f"\n{'time':<20}{'título':>9}{'acesso':>9}{'rebaix.':>9}{'pos. média':>12}")
+    for nome, probabilidades in resultado.por_time().items():
+        print(f"{nome:<20}{probabilidades['titulo']:>9.1%}{probabilidades['acesso']:>9.1%}"
+              f"{probabilidades['rebaixamento']:>9.1%}{probabilidades['posicao_media']:>12.2f}")
+
+if __name__ == "__main__":
+    main()
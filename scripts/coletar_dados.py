@@ -6,48 +6,75 @@ Coleta dados das Séries A e B e salva na pasta dataset
 
 import sys
 import os
+import asyncio
+import argparse
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.brasileirao import Brasileirao
+from src.async_brasileirao import AsyncBrasileirao
+from src.banco import BancoSQLite
+from src.historico import HistoricoSnapshots
 
-def coletar_dados():
-    """Coleta dados das duas séries e salva na pasta dataset"""
+SERIES = {
+    'serie_a': 'Série A',
+    'serie_b': 'Série B'
+}
+
+async def coletar_dados(compacto: bool = False, historico: Optional[str] = None, sqlite: Optional[str] = None):
+    """
+    Coleta dados das duas séries em paralelo e salva na pasta dataset
+    
+    Args:
+        compacto: Grava o JSON sem indentação
+        historico: Pasta de um HistoricoSnapshots; se informada, grava só o que
+                   mudou desde a última coleta em vez de uma cópia completa por dia
+        sqlite: Arquivo SQLite onde cada coleta também é gravada (ver BancoSQLite)
+    """
     print("⚽ Iniciando coleta de dados do Brasileirão...")
-    print(f"🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    agora = datetime.now()
+    print(f"🕐 {agora.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    hoje = datetime.now().strftime("%Y-%m-%d")
-    dir_dados = Path(__file__).parent.parent / "dados_coletados" / hoje
-    dir_dados.mkdir(parents=True, exist_ok=True)
+    if historico:
+        store = HistoricoSnapshots(historico)
+        dir_dados = Path(historico)
+    else:
+        hoje = agora.strftime("%Y-%m-%d")
+        dir_dados = Path(__file__).parent.parent / "dados_coletados" / hoje
+        dir_dados.mkdir(parents=True, exist_ok=True)
     
     print(f"📁 Salvando dados em: {dir_dados}")
     
-    with Brasileirao() as brasileirao:
-        # Coletar Série A
-        print("🔴 Coletando Série A...")
-        dados_a = brasileirao.obter_dados_brasileirao_a(rodadas=True)
-        
-        if 'erro' not in dados_a:
-            arquivo_a = dir_dados / "serie_a.json"
-            brasileirao.salvar_json(dados_a, str(arquivo_a))
-            print(f"✅ Série A: {len(dados_a['tabela'])} times, {len(dados_a.get('rodadas', []))} rodadas")
-        else:
-            print(f"❌ Erro Série A: {dados_a['erro']}")
-        
-        # Coletar Série B
-        print("🔵 Coletando Série B...")
-        dados_b = brasileirao.obter_dados_brasileirao_b(rodadas=True)
+    async with AsyncBrasileirao() as brasileirao:
+        print("📡 Coletando Séries A e B...")
+        resultados = await brasileirao.obter_dados(series=list(SERIES), rodadas=True)
         
-        if 'erro' not in dados_b:
-            arquivo_b = dir_dados / "serie_b.json"
-            brasileirao.salvar_json(dados_b, str(arquivo_b))
-            print(f"✅ Série B: {len(dados_b['tabela'])} times, {len(dados_b.get('rodadas', []))} rodadas")
-        else:
-            print(f"❌ Erro Série B: {dados_b['erro']}")
+        for serie, nome in SERIES.items():
+            dados = resultados[serie]
+            
+            if 'erro' not in dados:
+                if historico:
+                    arquivo = store.registrar(serie, dados, agora)
+                    print(f"🗂️  {nome}: {arquivo or 'sem mudanças desde a última coleta'}")
+                else:
+                    arquivo = dir_dados / f"{serie}.json"
+                    brasileirao.salvar_json(dados, str(arquivo), compacto)
+                if sqlite:
+                    with BancoSQLite(sqlite) as banco:
+                        banco.registrar(serie, dados, agora)
+                print(f"✅ {nome}: {len(dados['tabela'])} times, {len(dados.get('rodadas', []))} rodadas")
+            else:
+                print(f"❌ Erro {nome}: {dados['erro']}")
     
     print(f"\n🎉 Coleta concluída! Dados salvos em: {dir_dados}")
 
 if __name__ == "__main__":
-    coletar_dados()
+    parser = argparse.ArgumentParser(description="Coleta de dados do Brasileirão")
+    parser.add_argument('--compacto', action='store_true', help="Grava o JSON sem indentação")
+    parser.add_argument('--historico', default=None,
+                        help="Pasta do histórico com deltas (em vez de uma cópia completa por dia)")
+    parser.add_argument('--sqlite', default=None, help="Arquivo SQLite onde cada coleta também é gravada")
+    args = parser.parse_args()
+    asyncio.run(coletar_dados(args.compacto, args.historico, args.sqlite))
@@ -5,6 +5,7 @@ Coleta apenas dados da Série B e salva na pasta dataset
 """
 
 import sys
+import argparse
 from datetime import datetime
 from pathlib import Path
 
@@ -13,7 +14,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from src.brasileirao import Brasileirao
 
-def coletar_serie_b():
+def coletar_serie_b(compacto: bool = False):
     """Coleta dados apenas da Série B"""
     print("🔵 Coletando dados da Série B...")
     print(f"🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -33,18 +34,18 @@ def coletar_serie_b():
         if 'erro' not in dados_b:
             # Salvar dados completos
             arquivo_completo = dir_dados / "serie_b.json"
-            brasileirao.salvar_json(dados_b, str(arquivo_completo))
+            brasileirao.salvar_json(dados_b, str(arquivo_completo), compacto)
             
             # Salvar apenas tabela
             dados_tabela = {'tabela': dados_b['tabela']}
             arquivo_tabela = dir_dados / "serie_b_tabela.json"
-            brasileirao.salvar_json(dados_tabela, str(arquivo_tabela))
+            brasileirao.salvar_json(dados_tabela, str(arquivo_tabela), compacto)
             
             # Salvar apenas rodadas
             if 'rodadas' in dados_b:
                 dados_rodadas = {'rodadas': dados_b['rodadas']}
                 arquivo_rodadas = dir_dados / "serie_b_rodadas.json"
-                brasileirao.salvar_json(dados_rodadas, str(arquivo_rodadas))
+                brasileirao.salvar_json(dados_rodadas, str(arquivo_rodadas), compacto)
             
             print(f"✅ Série B: {len(dados_b['tabela'])} times, {len(dados_b.get('rodadas', []))} rodadas")
             
@@ -61,4 +62,6 @@ def coletar_serie_b():
     return True
 
 if __name__ == "__main__":
-    coletar_serie_b()
+    parser = argparse.ArgumentParser(description="Coleta da Série B")
+    parser.add_argument('--compacto', action='store_true', help="Grava o JSON sem indentação")
+    coletar_serie_b(parser.parse_args().compacto)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Verificação do tempo de importação
+Garante que consumidores de modelos e utilitários não carregam a pilha HTTP
+(requests, BeautifulSoup, fake-useragent) e importam dentro do limite de tempo
+"""
+
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+RAIZ = Path(__file__).parent.parent
+
+# Importações leves: não podem carregar nenhum dos módulos pesados
+IMPORTACOES_LEVES = (
+    "from src.models import Time, Partida, Rodada",
+    "from src.utils import JSONUtils, DataConverter",
+    "from src.diff import ComparadorSnapshots",
+    "import src, scrapers",
+    "from scrapers.config import URLS"
+)
+
+MODULOS_PESADOS = ('requests', 'bs4', 'fake_useragent', 'lxml', 'selectolax', 'urllib3', 'numpy')
+
+SONDA = """
+import sys, json, time
+inicio = time.perf_counter()
+exec({codigo!r})
+tempo = time.perf_counter() - inicio
+pesados = sorted(m for m in sys.modules if m.split('.')[0] in {pesados!r})
+print(json.dumps({{'tempo': tempo, 'pesados': pesados}}))
+"""
+
+def medir(codigo):
+    """Executa a importação em um interpretador limpo e retorna tempo e módulos pesados"""
+    sonda = SONDA.format(codigo=codigo, pesados=MODULOS_PESADOS)
+    saida = subprocess.run(
+        [sys.executable, "-c", sonda], cwd=str(RAIZ),
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(saida)
+
+def main():
+    """Função principal"""
+    parser = argparse.ArgumentParser(description="Verifica o custo de importação dos módulos leves")
+    parser.add_argument("--limite-ms", type=float, default=150.0, help="Tempo máximo por importação (ms)")
+    args = parser.parse_args()
+    
+    falhas = 0
+    for codigo in IMPORTACOES_LEVES:
+        try:
+            resultado = medir(codigo)
+        except subprocess.CalledProcessError as e:
+            print(f"❌ {codigo}: {e.stderr.strip().splitlines()[-1]}")
+            falhas += 1
+            continue
+        
+        tempo_ms = resultado['tempo'] * 1000
+        problemas = []
+        if resultado['pesados']:
+            problemas.append(f"carregou {', '.join(resultado['pesados'])}")
+        if tempo_ms > args.limite_ms:
+            problemas.append(f"acima de {args.limite_ms:.0f}ms")
+        
+        marca = "❌" if problemas else "✅"
+        print(f"{marca} {codigo}: {tempo_ms:.1f}ms {'; '.join(problemas)}")
+        falhas += bool(problemas)
+    
+    sys.exit(1 if falhas else 0)
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,51 @@ Brasileirão Python - Módulo Principal
 Contém as classes e funcionalidades principais da biblioteca
 """
 
-from .brasileirao import Brasileirao, obter_dados_brasileirao_a, obter_dados_brasileirao_b
-from .models import Time, Partida, Rodada, TabelaClassificacao, DadosBrasileirao
-from .utils import JSONUtils, DataConverter, FormatUtils
+from importlib import import_module
+
+# Atributo público -> módulo que o define, importado só no primeiro acesso
+# (ex.: 'from src.models import Time' não carrega requests nem BeautifulSoup)
+_ATRIBUTOS = {
+    'Brasileirao': '.brasileirao',
+    'obter_dados_brasileirao_a': '.brasileirao',
+    'obter_dados_brasileirao_b': '.brasileirao',
+    'AsyncBrasileirao': '.async_brasileirao',
+    'Time': '.models',
+    'Partida': '.models',
+    'Rodada': '.models',
+    'TabelaClassificacao': '.models',
+    'DadosBrasileirao': '.models',
+    'TimeTipado': '.models',
+    'PartidaTipada': '.models',
+    'RodadaTipada': '.models',
+    'IndiceTemporada': '.indice',
+    'Temporada': '.temporada',
+    'AgregadosTimes': '.agregados',
+    'AgregadoTime': '.agregados',
+    'Totais': '.agregados',
+    'ArraysTemporada': '.arrays',
+    'MotorClassificacao': '.classificacao',
+    'Classificacao': '.classificacao',
+    'SimuladorTemporada': '.simulacao',
+    'ResultadoSimulacao': '.simulacao',
+    'JSONUtils': '.utils',
+    'DataConverter': '.utils',
+    'FormatUtils': '.utils',
+    'DateUtils': '.utils',
+    'AgendadorColetas': '.agendador',
+    'RatingsElo': '.elo',
+    'HistoricoSnapshots': '.historico',
+    'BancoSQLite': '.banco',
+    'ComparadorSnapshots': '.diff',
+    'Evento': '.diff',
+    'GolMarcado': '.diff',
+    'PlacarCorrigido': '.diff',
+    'PartidaEncerrada': '.diff',
+    'PartidaRemarcada': '.diff',
+    'PartidaAdicionada': '.diff',
+    'PartidaRemovida': '.diff',
+    'PosicaoAlterada': '.diff'
+}
 
 __version__ = "2.0.0"
 __author__ = "Brasileirão Python Team"
@@ -13,6 +55,7 @@ __author__ = "Brasileirão Python Team"
 __all__ = [
     # Classe principal
     'Brasileirao',
+    'AsyncBrasileirao',
     
     # Funções de conveniência
     'obter_dados_brasileirao_a',
@@ -24,9 +67,63 @@ __all__ = [
     'Rodada',
     'TabelaClassificacao',
     'DadosBrasileirao',
+    'TimeTipado',
+    'PartidaTipada',
+    'RodadaTipada',
+    
+    # Análise
+    'IndiceTemporada',
+    'Temporada',
+    'AgregadosTimes',
+    'AgregadoTime',
+    'Totais',
+    
+    # Análise vetorizada (requer numpy)
+    'ArraysTemporada',
+    'MotorClassificacao',
+    'Classificacao',
+    'SimuladorTemporada',
+    'ResultadoSimulacao',
     
     # Utilitários
     'JSONUtils',
     'DataConverter',
-    'FormatUtils'
+    'FormatUtils',
+    'DateUtils',
+    
+    # Coleta contínua
+    'AgendadorColetas',
+    
+    # Ratings
+    'RatingsElo',
+    
+    # Histórico de coletas com deltas
+    'HistoricoSnapshots',
+    
+    # Histórico de coletas em SQLite
+    'BancoSQLite',
+    
+    # Eventos de mudança entre snapshots
+    'ComparadorSnapshots',
+    'Evento',
+    'GolMarcado',
+    'PlacarCorrigido',
+    'PartidaEncerrada',
+    'PartidaRemarcada',
+    'PartidaAdicionada',
+    'PartidaRemovida',
+    'PosicaoAlterada'
 ]
+
+def __getattr__(nome):
+    """Importa sob demanda o módulo que define o atributo pedido"""
+    modulo = _ATRIBUTOS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(import_module(modulo, __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+def __dir__():
+    """Inclui os atributos ainda não importados"""
+    return sorted(set(globals()) | set(_ATRIBUTOS))
@@ -0,0 +1,188 @@
+"""
+Agendador de coletas guiado pelo calendário das partidas
+Coleta com frequência apenas enquanto há jogos em andamento
+"""
+
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from .brasileirao import Brasileirao
+from .models import DadosBrasileirao, Rodada, TabelaClassificacao
+from .utils import DataConverter, DateUtils, FUSO_BRASILIA, DURACAO_PARTIDA
+
+# Janela de uma partida começa um pouco antes do apito inicial
+ANTECEDENCIA = timedelta(minutes=5)
+
+class AgendadorColetas:
+    """Agenda as coletas de rodadas de uma série a partir do calendário de jogos"""
+    
+    def __init__(self, serie: str, brasileirao: Optional[Brasileirao] = None,
+                 intervalo_ao_vivo: float = 60, intervalo_ocioso: float = 6 * 3600,
+                 ao_coletar: Optional[Callable[[TabelaClassificacao, List[Rodada]], None]] = None,
+                 relogio: Optional[Callable[[], datetime]] = None):
+        """
+        Inicializa o agendador
+        
+        Args:
+            serie: Nome da série ('serie_a' ou 'serie_b')
+            brasileirao: Instância usada nas coletas (uma nova é criada se None)
+            intervalo_ao_vivo: Segundos entre coletas enquanto há jogos em andamento
+            intervalo_ocioso: Segundos máximos entre coletas sem jogos em andamento
+            ao_coletar: Função chamada após cada coleta com a tabela e todas as rodadas
+            relogio: Função que retorna o horário atual (com fuso)
+        """
+        self.serie = serie
+        self.brasileirao = brasileirao or Brasileirao()
+        self.intervalo_ao_vivo = timedelta(seconds=intervalo_ao_vivo)
+        self.intervalo_ocioso = timedelta(seconds=intervalo_ocioso)
+        self.ao_coletar = ao_coletar
+        self.relogio = relogio or (lambda: datetime.now(FUSO_BRASILIA))
+        
+        self.rodadas: Dict[int, Rodada] = {}
+        self.impressoes: Dict[int, str] = {}
+        self.tabela: Optional[TabelaClassificacao] = None
+        self.encerradas: Set[int] = set()
+        self.total_requisicoes = 0
+    
+    def coletar(self) -> List[Rodada]:
+        """
+        Faz uma coleta, reprocessando apenas as rodadas ainda não encerradas
+        
+        A página de rodadas é baixada inteira a cada coleta (o site não
+        permite pedir só algumas rodadas); o filtro de pendentes apenas evita
+        extrair as rodadas encerradas. Como o filtro muda quando rodadas se
+        encerram, os resultados memoizados ficam limitados pelo ParseMemo.
+        A tabela só é buscada de novo quando algum placar ou horário mudou.
+        As rodadas recebidas são guardadas pelo número do título ('12ª
+        rodada'; a posição pedida só se o título não tiver número).
+        
+        Returns:
+            Todas as rodadas conhecidas, em ordem
+        """
+        pendentes = None
+        if self.rodadas:
+            pendentes = sorted(n for n in self.rodadas if n not in self.encerradas)
+        
+        if pendentes == []:
+            return self.todas_rodadas()
+        
+        novas = self.brasileirao.obter_rodadas(self.serie, rodadas=pendentes)
+        self.total_requisicoes += 1
+        
+        mudou = self.tabela is None
+        numeros = []
+        for posicao, rodada in enumerate(novas):
+            numero = self._numero_rodada(rodada, posicao, pendentes)
+            impressao = DataConverter.impressao_rodada(rodada)
+            mudou = mudou or self.impressoes.get(numero) != impressao
+            self.rodadas[numero] = rodada
+            self.impressoes[numero] = impressao
+            numeros.append(numero)
+        
+        agora = self.relogio()
+        for numero in numeros:
+            if self._rodada_encerrada(self.rodadas[numero], agora):
+                self.encerradas.add(numero)
+        
+        if mudou:
+            self.tabela = self.brasileirao.obter_tabela(self.serie)
+            self.total_requisicoes += 1
+        
+        rodadas = self.todas_rodadas()
+        if self.ao_coletar:
+            self.ao_coletar(self.tabela, rodadas)
+        return rodadas
+    
+    def todas_rodadas(self) -> List[Rodada]:
+        """Todas as rodadas conhecidas, em ordem"""
+        return [self.rodadas[n] for n in sorted(self.rodadas)]
+    
+    def snapshot(self) -> DadosBrasileirao:
+        """
+        Snapshot da última coleta, com as impressões das rodadas já calculadas
+        
+        As rodadas encerradas são os mesmos objetos entre snapshots, então
+        ComparadorSnapshots só percorre as que foram reprocessadas.
+        
+        Returns:
+            DadosBrasileirao com a tabela e todas as rodadas conhecidas
+        """
+        return DadosBrasileirao(
+            tabela=self.tabela, rodadas=self.todas_rodadas(), impressoes=dict(self.impressoes)
+        )
+    
+    def proxima_coleta(self) -> datetime:
+        """
+        Calcula o horário da próxima coleta a partir do calendário
+        
+        Durante a janela de uma partida, coleta a cada intervalo_ao_vivo.
+        Fora delas, espera até o início ou o fim da próxima janela, limitado
+        a intervalo_ocioso.
+        
+        Returns:
+            Horário da próxima coleta
+        """
+        agora = self.relogio()
+        proxima = agora + self.intervalo_ocioso
+        
+        for inicio, fim in self._janelas():
+            if inicio <= agora < fim:
+                return agora + self.intervalo_ao_vivo
+            # O início abre a janela ao vivo e o fim garante uma coleta com o placar final
+            for marco in (inicio, fim):
+                if agora < marco < proxima:
+                    proxima = marco
+        
+        return proxima
+    
+    def executar(self, max_coletas: Optional[int] = None):
+        """
+        Executa o ciclo de coletas até ser interrompido
+        
+        Args:
+            max_coletas: Número máximo de coletas (None para rodar indefinidamente)
+        """
+        coletas = 0
+        while max_coletas is None or coletas < max_coletas:
+            self.coletar()
+            coletas += 1
+            if max_coletas is not None and coletas >= max_coletas:
+                break
+            
+            espera = (self.proxima_coleta() - self.relogio()).total_seconds()
+            time.sleep(max(espera, 0))
+    
+    def _janelas(self) -> List[Tuple[datetime, datetime]]:
+        """Janelas de coleta ao vivo das partidas das rodadas não encerradas"""
+        janelas = []
+        for numero, rodada in self.rodadas.items():
+            if numero in self.encerradas:
+                continue
+            for partida in rodada.partidas:
+                inicio = DateUtils.parse_data_partida(partida.data, rodada.inicio)
+                if inicio is not None:
+                    janelas.append((inicio - ANTECEDENCIA, inicio + DURACAO_PARTIDA))
+        return janelas
+    
+    @staticmethod
+    def _numero_rodada(rodada: Rodada, posicao: int, pedidas: Optional[List[int]]) -> int:
+        """Número da rodada pelo título, ou pela posição na lista recebida"""
+        numero = DataConverter.numero_rodada(rodada.rodada)
+        if numero:
+            return numero
+        return pedidas[posicao] if pedidas else posicao + 1
+    
+    @staticmethod
+    def _rodada_encerrada(rodada: Rodada, agora: datetime) -> bool:
+        """Uma rodada está encerrada quando todas as suas partidas terminaram"""
+        return all(DateUtils.partida_encerrada(p, rodada.inicio, agora) for p in rodada.partidas)
+    
+    def close(self):
+        """Fecha a instância do Brasileirão"""
+        self.brasileirao.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,212 @@
+"""
+Agregados por time do Brasileirão
+Totais, forma recente e sequências mantidos de forma incremental a cada partida
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
+from .models import Partida, PartidaTipada, Rodada, RodadaTipada
+from .utils import DataConverter, DateUtils
+
+# Resultados da forma recente, do ponto de vista do time
+VITORIA, EMPATE, DERROTA = 'V', 'E', 'D'
+
+PONTOS = {VITORIA: 3, EMPATE: 1, DERROTA: 0}
+
+class Totais:
+    """Contadores de jogos, resultados e gols"""
+    
+    __slots__ = ('jogos', 'vitorias', 'empates', 'derrotas', 'gols_pro', 'gols_contra')
+    
+    def __init__(self):
+        self.jogos = 0
+        self.vitorias = 0
+        self.empates = 0
+        self.derrotas = 0
+        self.gols_pro = 0
+        self.gols_contra = 0
+    
+    def somar(self, resultado: str, gols_pro: int, gols_contra: int):
+        """Acrescenta uma partida"""
+        self.jogos += 1
+        if resultado == VITORIA:
+            self.vitorias += 1
+        elif resultado == EMPATE:
+            self.empates += 1
+        else:
+            self.derrotas += 1
+        self.gols_pro += gols_pro
+        self.gols_contra += gols_contra
+    
+    @property
+    def pontos(self) -> int:
+        return 3 * self.vitorias + self.empates
+    
+    @property
+    def saldo_gols(self) -> int:
+        return self.gols_pro - self.gols_contra
+    
+    @property
+    def aproveitamento(self) -> float:
+        """Aproveitamento em % (0 sem jogos)"""
+        return self.pontos * 100 / (self.jogos * 3) if self.jogos else 0.0
+    
+    def __repr__(self) -> str:
+        return (f"Totais(jogos={self.jogos}, vitorias={self.vitorias}, empates={self.empates}, "
+                f"derrotas={self.derrotas}, gols_pro={self.gols_pro}, gols_contra={self.gols_contra})")
+
+class AgregadoTime:
+    """Agregados de um time: totais (geral, casa, fora, por adversário), forma e sequências"""
+    
+    __slots__ = ('nome', 'geral', 'casa', 'fora', 'adversarios', 'gols_por_rodada', 'forma',
+                 'sequencia_resultado', 'sequencia', 'invicto', 'sem_vencer',
+                 'maior_sequencia_vitorias', 'maior_invencibilidade')
+    
+    def __init__(self, nome: str, tamanho_forma: int):
+        self.nome = nome
+        self.geral = Totais()
+        self.casa = Totais()
+        self.fora = Totais()
+        self.adversarios: Dict[str, Totais] = {}
+        # Rodada -> (gols pró, gols contra)
+        self.gols_por_rodada: Dict[int, Tuple[int, int]] = {}
+        # Últimos resultados, do mais antigo para o mais recente
+        self.forma: Deque[str] = deque(maxlen=tamanho_forma)
+        self.sequencia_resultado: Optional[str] = None
+        self.sequencia = 0
+        self.invicto = 0
+        self.sem_vencer = 0
+        self.maior_sequencia_vitorias = 0
+        self.maior_invencibilidade = 0
+    
+    @property
+    def pontos_forma(self) -> int:
+        """Pontos somados nos jogos da forma recente"""
+        return sum(PONTOS[resultado] for resultado in self.forma)
+    
+    def registrar(self, rodada: int, adversario: str, em_casa: bool, gols_pro: int, gols_contra: int):
+        """Acrescenta uma partida encerrada do time, em O(1)"""
+        if gols_pro > gols_contra:
+            resultado = VITORIA
+        elif gols_pro == gols_contra:
+            resultado = EMPATE
+        else:
+            resultado = DERROTA
+        
+        self.geral.somar(resultado, gols_pro, gols_contra)
+        (self.casa if em_casa else self.fora).somar(resultado, gols_pro, gols_contra)
+        if adversario not in self.adversarios:
+            self.adversarios[adversario] = Totais()
+        self.adversarios[adversario].somar(resultado, gols_pro, gols_contra)
+        
+        pro, contra = self.gols_por_rodada.get(rodada, (0, 0))
+        self.gols_por_rodada[rodada] = (pro + gols_pro, contra + gols_contra)
+        
+        self.forma.append(resultado)
+        if resultado == self.sequencia_resultado:
+            self.sequencia += 1
+        else:
+            self.sequencia_resultado, self.sequencia = resultado, 1
+        self.invicto = self.invicto + 1 if resultado != DERROTA else 0
+        self.sem_vencer = self.sem_vencer + 1 if resultado != VITORIA else 0
+        if resultado == VITORIA:
+            self.maior_sequencia_vitorias = max(self.maior_sequencia_vitorias, self.sequencia)
+        self.maior_invencibilidade = max(self.maior_invencibilidade, self.invicto)
+
+class AgregadosTimes:
+    """
+    Agregados de todos os times, montados uma vez e atualizados por partida
+    
+    As partidas devem chegar em ordem cronológica (de_rodadas cuida disso)
+    para que forma e sequências façam sentido. Cada partida (campeonato,
+    temporada, rodada e confronto; ver DataConverter.id_partida) é contada
+    uma única vez; correções de placar exigem remontar com de_rodadas.
+    """
+    
+    def __init__(self, tamanho_forma: int = 5, campeonato: str = ''):
+        """
+        Args:
+            tamanho_forma: Número de jogos da forma recente
+            campeonato: Campeonato padrão das partidas registradas (ex. 'serie_b')
+        """
+        self.tamanho_forma = tamanho_forma
+        self.campeonato = campeonato
+        self.times: Dict[str, AgregadoTime] = {}
+        # Identidades (DataConverter.id_partida) das partidas já contadas
+        self.registradas: Set[str] = set()
+    
+    @classmethod
+    def de_rodadas(cls, rodadas: Iterable[Union[Rodada, RodadaTipada]], tamanho_forma: int = 5,
+                   agora: Optional[datetime] = None, campeonato: str = '') -> 'AgregadosTimes':
+        """
+        Monta os agregados com as partidas jogadas, em ordem cronológica
+        
+        Args:
+            rodadas: Rodadas da temporada (de texto ou tipadas)
+            tamanho_forma: Número de jogos da forma recente
+            agora: Se informado, ignora partidas ainda em andamento nesse horário
+            campeonato: Campeonato das rodadas
+            
+        Returns:
+            AgregadosTimes com todas as partidas encerradas
+        """
+        agregados = cls(tamanho_forma, campeonato)
+        for numero, temporada, partida in DateUtils.partidas_em_ordem(rodadas, agora):
+            agregados.registrar(partida, numero, temporada)
+        return agregados
+    
+    def __getitem__(self, nome: str) -> AgregadoTime:
+        """
+        Agregados de um time
+        
+        Raises:
+            KeyError: Se o time ainda não tem partidas registradas
+        """
+        return self.times[nome]
+    
+    def _time(self, nome: str) -> AgregadoTime:
+        """Agregados de um time, criados no primeiro jogo"""
+        agregado = self.times.get(nome)
+        if agregado is None:
+            agregado = self.times[nome] = AgregadoTime(nome, self.tamanho_forma)
+        return agregado
+    
+    def registrar(self, partida: Union[Partida, PartidaTipada], rodada: int,
+                  temporada: Optional[int] = None, campeonato: Optional[str] = None) -> bool:
+        """
+        Acrescenta uma partida encerrada aos dois times, em O(1)
+        
+        Args:
+            partida: Partida com placar
+            rodada: Número da rodada da partida
+            temporada: Ano da temporada (ver DateUtils.partidas_em_ordem)
+            campeonato: Campeonato da partida (None usa self.campeonato)
+            
+        Returns:
+            True se a partida foi contada; False se não tem placar ou já foi registrada
+        """
+        if isinstance(partida, PartidaTipada):
+            gols_casa, gols_fora = partida.gols_casa, partida.gols_fora
+        else:
+            gols_casa = DataConverter.para_gols(partida.gols_casa)
+            gols_fora = DataConverter.para_gols(partida.gols_fora)
+        
+        chave = DataConverter.id_partida(
+            partida.time_casa, partida.time_fora, rodada, temporada,
+            self.campeonato if campeonato is None else campeonato
+        )
+        if gols_casa is None or gols_fora is None or chave in self.registradas:
+            return False
+        
+        self.registradas.add(chave)
+        self._time(partida.time_casa).registrar(rodada, partida.time_fora, True, gols_casa, gols_fora)
+        self._time(partida.time_fora).registrar(rodada, partida.time_casa, False, gols_fora, gols_casa)
+        return True
+    
+    def ranking_forma(self) -> List[Tuple[str, int]]:
+        """Times ordenados pelos pontos da forma recente (empates por saldo geral)"""
+        return sorted(
+            ((nome, agregado.pontos_forma) for nome, agregado in self.times.items()),
+            key=lambda item: (-item[1], -self.times[item[0]].geral.saldo_gols, item[0])
+        )
@@ -0,0 +1,171 @@
+"""
+Representação colunar de uma temporada do Brasileirão
+Partidas em arrays NumPy, base para cálculos vetorizados (requer numpy)
+"""
+
+from datetime import timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - numpy é uma dependência opcional
+    raise ImportError("ArraysTemporada requer numpy, que é opcional: pip install numpy") from e
+from .models import DadosBrasileirao, Partida, PartidaTipada, Rodada, RodadaTipada
+from .utils import DataConverter, DateUtils
+
+# Horário desconhecido (partida sem data definida)
+SEM_HORARIO = np.datetime64('NaT', 's')
+
+class ArraysTemporada:
+    """
+    Partidas de uma temporada em colunas NumPy
+    
+    Cada posição i dos arrays é uma partida. Os times são identificados por
+    inteiros (índices em `times`); os gols de partidas não jogadas valem 0 e
+    ficam de fora da máscara `jogada`. Os horários são datetime64[s] em UTC.
+    """
+    
+    __slots__ = ('times', 'indice_times', 'casa', 'fora', 'gols_casa', 'gols_fora',
+                 'jogada', 'rodada', 'horario')
+    
+    def __init__(self, times: Sequence[str], casa: np.ndarray, fora: np.ndarray,
+                 gols_casa: np.ndarray, gols_fora: np.ndarray, jogada: np.ndarray,
+                 rodada: np.ndarray, horario: np.ndarray):
+        """
+        Inicializa a partir de arrays já montados (ver de_rodadas)
+        
+        Args:
+            times: Nomes dos times; o id de cada time é sua posição
+            casa: Id do mandante de cada partida
+            fora: Id do visitante de cada partida
+            gols_casa: Gols do mandante (0 se não jogada)
+            gols_fora: Gols do visitante (0 se não jogada)
+            jogada: Máscara das partidas com placar
+            rodada: Número da rodada de cada partida
+            horario: Início de cada partida (datetime64[s] UTC, NaT se indefinido)
+        """
+        self.times = tuple(times)
+        self.indice_times = {nome: i for i, nome in enumerate(self.times)}
+        self.casa = casa
+        self.fora = fora
+        self.gols_casa = gols_casa
+        self.gols_fora = gols_fora
+        self.jogada = jogada
+        self.rodada = rodada
+        self.horario = horario
+    
+    @classmethod
+    def de_rodadas(cls, rodadas: Iterable[Union[Rodada, RodadaTipada]],
+                   times: Optional[Iterable[str]] = None) -> 'ArraysTemporada':
+        """
+        Monta os arrays a partir das rodadas parseadas (de texto ou tipadas)
+        
+        Args:
+            rodadas: Rodadas com suas partidas
+            times: Nomes de todos os times (ex. da tabela); se None, usa os
+                   times das partidas em ordem alfabética
+                   
+        Returns:
+            ArraysTemporada com uma posição por partida
+        """
+        linhas: List[Tuple[str, str, Optional[int], Optional[int], int, Optional[int]]] = []
+        
+        for posicao, rodada in enumerate(rodadas, 1):
+            if isinstance(rodada, RodadaTipada):
+                numero = rodada.numero
+            else:
+                numero = DataConverter.numero_rodada(rodada.rodada) or posicao
+            
+            for partida in rodada.partidas:
+                linhas.append(cls._linha_partida(partida, rodada, numero))
+        
+        if times is None:
+            times = sorted({l[0] for l in linhas} | {l[1] for l in linhas})
+        times = list(times)
+        indice = {nome: i for i, nome in enumerate(times)}
+        
+        # Times que só aparecem nas partidas entram no fim da tabela de nomes
+        for casa, fora, *_ in linhas:
+            for nome in (casa, fora):
+                if nome not in indice:
+                    indice[nome] = len(times)
+                    times.append(nome)
+        
+        n = len(linhas)
+        casa = np.fromiter((indice[l[0]] for l in linhas), dtype=np.int16, count=n)
+        fora = np.fromiter((indice[l[1]] for l in linhas), dtype=np.int16, count=n)
+        jogada = np.fromiter((l[2] is not None and l[3] is not None for l in linhas), dtype=bool, count=n)
+        gols_casa = np.fromiter((l[2] or 0 for l in linhas), dtype=np.int16, count=n)
+        gols_fora = np.fromiter((l[3] or 0 for l in linhas), dtype=np.int16, count=n)
+        gols_casa[~jogada] = 0
+        gols_fora[~jogada] = 0
+        rodada = np.fromiter((l[4] for l in linhas), dtype=np.int16, count=n)
+        horario = np.array(
+            [SEM_HORARIO if l[5] is None else np.datetime64(l[5], 's') for l in linhas],
+            dtype='datetime64[s]'
+        )
+        
+        return cls(times, casa, fora, gols_casa, gols_fora, jogada, rodada, horario)
+    
+    @classmethod
+    def de_dados(cls, dados: DadosBrasileirao) -> 'ArraysTemporada':
+        """
+        Monta os arrays a partir dos dados completos, com os times da tabela
+        
+        Args:
+            dados: Dados com tabela e rodadas
+            
+        Returns:
+            ArraysTemporada da temporada
+        """
+        times = [time.nome for time in dados.tabela.times]
+        return cls.de_rodadas(dados.rodadas or [], times or None)
+    
+    @staticmethod
+    def _linha_partida(partida: Union[Partida, PartidaTipada], rodada: Union[Rodada, RodadaTipada],
+                       numero: int) -> Tuple[str, str, Optional[int], Optional[int], int, Optional[int]]:
+        """Valores de uma partida: (casa, fora, gols_casa, gols_fora, rodada, timestamp UTC)"""
+        if isinstance(partida, PartidaTipada):
+            gols_casa, gols_fora, horario = partida.gols_casa, partida.gols_fora, partida.data
+        else:
+            gols_casa = DataConverter.para_gols(partida.gols_casa)
+            gols_fora = DataConverter.para_gols(partida.gols_fora)
+            horario = DateUtils.parse_data_partida(partida.data, rodada.inicio)
+        
+        timestamp = int(horario.astimezone(timezone.utc).timestamp()) if horario is not None else None
+        return partida.time_casa, partida.time_fora, gols_casa, gols_fora, numero, timestamp
+    
+    def __len__(self) -> int:
+        return len(self.casa)
+    
+    @property
+    def n_times(self) -> int:
+        """Número de times da temporada"""
+        return len(self.times)
+    
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelos arrays, em bytes"""
+        return sum(getattr(self, campo).nbytes for campo in
+                   ('casa', 'fora', 'gols_casa', 'gols_fora', 'jogada', 'rodada', 'horario'))
+    
+    def id_time(self, nome: str) -> int:
+        """
+        Id de um time pelo nome
+        
+        Raises:
+            KeyError: Se o time não estiver na temporada
+        """
+        return self.indice_times[nome]
+    
+    def mascara_time(self, nome: str) -> np.ndarray:
+        """Máscara das partidas em que o time joga (em casa ou fora)"""
+        id_time = self.id_time(nome)
+        return (self.casa == id_time) | (self.fora == id_time)
+    
+    def mascara_ate_rodada(self, rodada: int) -> np.ndarray:
+        """Máscara das partidas jogadas até a rodada informada (inclusive)"""
+        return self.jogada & (self.rodada <= rodada)
+    
+    def restantes(self) -> np.ndarray:
+        """Índices das partidas ainda sem placar"""
+        return np.flatnonzero(~self.jogada)
@@ -0,0 +1,129 @@
+"""
+Versão assíncrona da classe principal do Brasileirão Python
+Busca tabelas e rodadas de várias séries ao mesmo tempo
+"""
+
+import asyncio
+from typing import Dict, Iterable, Optional, Union
+from scrapers.async_http_client import AsyncHTTPClient
+from scrapers.parsers import TabelaParser, RodadasParser
+from scrapers.cache import ResponseCache, ParseMemo
+from scrapers.engines import criar_documento
+from scrapers.campeonatos import obter_urls
+from .brasileirao import chave_filtros, montar_resultado, normalizar_filtros
+from .utils import JSONUtils
+
+class AsyncBrasileirao:
+    """
+    Classe assíncrona para obter dados de várias séries em paralelo
+    
+    As requisições não usam I/O assíncrono: cada uma roda no HTTPClient
+    bloqueante dentro de uma thread (ver AsyncHTTPClient).
+    """
+    
+    def __init__(self, max_concorrencia: Optional[int] = None,
+                 cache: Optional[ResponseCache] = None):
+        """
+        Inicializa a classe com cliente HTTP assíncrono
+        
+        Args:
+            max_concorrencia: Número máximo de requisições simultâneas
+            cache: Cache de respostas para GET condicional (opcional)
+        """
+        self.http_client = AsyncHTTPClient(max_concorrencia, cache)
+        self._memo = ParseMemo()
+    
+    async def obter_dados(self, series: Iterable[str] = ('serie_a', 'serie_b'),
+                          rodadas: Union[bool, Iterable[int]] = True,
+                          times: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+        """
+        Obtém dados de várias séries, disparando todas as requisições de uma vez
+        
+        Args:
+            series: Séries ou campeonatos ('serie_a', chave registrada ou idChampionship)
+            rodadas: Se deve incluir dados das rodadas, ou os números das
+                     rodadas desejadas (ex. range(20, 26))
+            times: Nomes exatos dos times cujas partidas devem ser incluídas
+            
+        Returns:
+            Dicionário indexado pela série, com os dados ou erro de cada uma
+        """
+        series = list(series)
+        recursos = ('tabela', 'rodadas') if rodadas is not False else ('tabela',)
+        chaves = [(serie, recurso) for serie in series for recurso in recursos]
+        
+        paginas = await asyncio.gather(
+            *(self._obter_pagina(serie, recurso) for serie, recurso in chaves),
+            return_exceptions=True
+        )
+        conteudos = dict(zip(chaves, paginas))
+        
+        resultado = {}
+        for serie in series:
+            try:
+                resultado[serie] = self._montar_serie(serie, conteudos, rodadas, times)
+            except Exception as e:
+                resultado[serie] = {'erro': str(e)}
+        
+        return resultado
+    
+    async def _obter_pagina(self, serie: str, recurso: str):
+        """Obtém o conteúdo de um recurso ('tabela' ou 'rodadas') de uma série"""
+        return await self.http_client.get_conteudo(obter_urls(serie)[recurso])
+    
+    def _montar_serie(self, serie: str, conteudos: Dict, rodadas: Union[bool, Iterable[int]],
+                      times: Optional[Iterable[str]] = None) -> Dict:
+        """Monta o resultado de uma série a partir das páginas já obtidas"""
+        tabela = self._parse(serie, 'tabela', conteudos, TabelaParser.parse_tabela)
+        
+        rodadas_data = None
+        if rodadas is not False:
+            filtro_rodadas, filtro_times = normalizar_filtros(
+                None if rodadas is True else rodadas, times
+            )
+            rodadas_data = self._parse(
+                serie, 'rodadas', conteudos,
+                lambda doc: RodadasParser.parse_rodadas(doc, rodadas=filtro_rodadas, times=filtro_times),
+                chave_filtros(filtro_rodadas, filtro_times)
+            )
+        
+        return montar_resultado(tabela, rodadas_data)
+    
+    def _parse(self, serie: str, recurso: str, conteudos: Dict, parser, sufixo_chave: str = ''):
+        """Faz o parsing de uma página obtida, reaproveitando o resultado se não mudou"""
+        conteudo = conteudos[(serie, recurso)]
+        if isinstance(conteudo, Exception):
+            raise conteudo
+        
+        texto, hash_pagina = conteudo
+        return self._memo.obter(
+            obter_urls(serie)[recurso] + sufixo_chave, hash_pagina, lambda: parser(criar_documento(texto))
+        )
+    
+    def salvar_json(self, dados: Dict, arquivo: str, compacto: Optional[bool] = None) -> bool:
+        """
+        Salva os dados em um arquivo JSON
+        
+        Args:
+            dados: Dados a serem salvos
+            arquivo: Nome do arquivo
+            compacto: Se True, grava sem indentação; se None, usa JSON_CONFIG['compacto']
+            
+        Returns:
+            True se salvou com sucesso, False caso contrário
+        """
+        return JSONUtils.salvar_e_informar(dados, arquivo, compacto)
+    
+    def close(self):
+        """Fecha o cliente HTTP (bloqueia até as requisições em andamento terminarem)"""
+        self.http_client.close()
+    
+    async def aclose(self):
+        """Fecha o cliente HTTP sem bloquear o event loop"""
+        await self.http_client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
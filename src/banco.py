@@ -0,0 +1,340 @@
+"""
+Armazenamento das coletas do Brasileirão em SQLite
+Cada coleta grava seus times e partidas em uma única transação; consultas históricas usam índices
+"""
+
+import sqlite3
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+from .models import DadosBrasileirao, Partida, Rodada, RodadaTipada, TabelaClassificacao, Time, TimeTipado
+from .utils import DataConverter, JSONUtils, FUSO_BRASILIA
+
+MomentoColeta = Union[datetime, date, str]
+
+CAMPOS_TIME = (
+    'nome', 'escudo', 'posicao', 'pontos', 'jogos', 'vitorias', 'empates', 'derrotas',
+    'gols_pro', 'gols_contra', 'saldo_gols', 'aproveitamento'
+)
+
+CAMPOS_PARTIDA = (
+    'partida', 'data', 'local', 'time_casa', 'time_fora', 'gols_casa', 'gols_fora', 'resultado_texto'
+)
+
+ESQUEMA = f"""
+CREATE TABLE IF NOT EXISTS coletas (
+    id INTEGER PRIMARY KEY,
+    campeonato TEXT NOT NULL,
+    coletado_em TEXT NOT NULL,
+    UNIQUE (campeonato, coletado_em)
+);
+
+CREATE TABLE IF NOT EXISTS times (
+    coleta_id INTEGER NOT NULL REFERENCES coletas (id) ON DELETE CASCADE,
+    ordem INTEGER NOT NULL,
+    {', '.join(f'{campo} TEXT NOT NULL' for campo in CAMPOS_TIME)}
+);
+CREATE INDEX IF NOT EXISTS idx_times_coleta ON times (coleta_id, ordem);
+CREATE INDEX IF NOT EXISTS idx_times_nome ON times (nome, coleta_id);
+
+CREATE TABLE IF NOT EXISTS rodadas (
+    coleta_id INTEGER NOT NULL REFERENCES coletas (id) ON DELETE CASCADE,
+    numero INTEGER NOT NULL,
+    rodada TEXT NOT NULL,
+    inicio TEXT NOT NULL,
+    rodada_atual INTEGER NOT NULL,
+    PRIMARY KEY (coleta_id, numero)
+);
+
+CREATE TABLE IF NOT EXISTS partidas (
+    coleta_id INTEGER NOT NULL REFERENCES coletas (id) ON DELETE CASCADE,
+    numero_rodada INTEGER NOT NULL,
+    ordem INTEGER NOT NULL,
+    {', '.join(f'{campo} TEXT NOT NULL' for campo in CAMPOS_PARTIDA)}
+);
+CREATE INDEX IF NOT EXISTS idx_partidas_rodada ON partidas (coleta_id, numero_rodada, ordem);
+CREATE INDEX IF NOT EXISTS idx_partidas_casa ON partidas (time_casa, coleta_id);
+CREATE INDEX IF NOT EXISTS idx_partidas_fora ON partidas (time_fora, coleta_id);
+"""
+
+def _texto_momento(valor: MomentoColeta, fim_do_dia: bool = False) -> str:
+    """
+    Momento em texto ISO comparável, no horário de Brasília
+    
+    Momentos com fuso são convertidos para FUSO_BRASILIA; momentos sem fuso
+    (e datas) já são considerados no horário de Brasília. Uma data vale pelo
+    dia todo se fim_do_dia.
+    """
+    if isinstance(valor, str):
+        valor = datetime.fromisoformat(valor) if 'T' in valor or ' ' in valor else date.fromisoformat(valor)
+    if not isinstance(valor, datetime):
+        valor = datetime.combine(valor, time.max if fim_do_dia else time())
+    if valor.tzinfo is not None:
+        valor = valor.astimezone(FUSO_BRASILIA)
+    return valor.replace(tzinfo=None).isoformat(timespec='seconds')
+
+class BancoSQLite:
+    """
+    Coletas de vários campeonatos em um arquivo SQLite
+    
+    Tabelas coletas, times, rodadas e partidas, com índices por campeonato e
+    momento da coleta, por time e por rodada. As consultas devolvem os modelos
+    (Time, Rodada, Partida) exatamente como foram coletados.
+    """
+    
+    def __init__(self, arquivo: Union[str, Path] = ':memory:'):
+        """
+        Abre (ou cria) o banco
+        
+        Args:
+            arquivo: Caminho do arquivo SQLite (':memory:' para um banco temporário)
+        """
+        if str(arquivo) != ':memory:':
+            Path(arquivo).parent.mkdir(parents=True, exist_ok=True)
+        self.conexao = sqlite3.connect(str(arquivo))
+        self.conexao.execute("PRAGMA foreign_keys = ON")
+        self.conexao.execute("PRAGMA journal_mode = WAL")
+        self.conexao.execute("PRAGMA synchronous = NORMAL")
+        self.conexao.executescript(ESQUEMA)
+    
+    def registrar(self, campeonato: str, dados: Union[DadosBrasileirao, Dict],
+                  coletado_em: Optional[datetime] = None) -> int:
+        """
+        Grava uma coleta completa em uma única transação
+        
+        Args:
+            campeonato: Chave do campeonato (ex. 'serie_b')
+            dados: DadosBrasileirao (de texto ou tipado) ou o dicionário de salvar_json
+            coletado_em: Momento da coleta (padrão: agora; com fuso, convertido para Brasília)
+            
+        Returns:
+            Id da coleta
+            
+        Raises:
+            Exception: Se a coleta já existir ou a gravação falhar (nada é gravado)
+        """
+        if not isinstance(dados, dict) and (
+            any(isinstance(t, TimeTipado) for t in (dados.tabela.times if dados.tabela else []))
+            or any(isinstance(r, RodadaTipada) for r in dados.rodadas or [])
+        ):
+            # Os modelos tipados são gravados no mesmo texto dos modelos coletados
+            dados = DataConverter.dados_brasileirao_to_dict(dados)
+        if isinstance(dados, dict):
+            dados = DataConverter.dados_brasileirao_from_dict(dados)
+        momento = _texto_momento(coletado_em or datetime.now(FUSO_BRASILIA))
+        
+        times = dados.tabela.times if dados.tabela else []
+        rodadas = dados.rodadas or []
+        numeros = [DataConverter.numero_rodada(r.rodada) or posicao for posicao, r in enumerate(rodadas, 1)]
+        
+        try:
+            with self.conexao:
+                coleta_id = self.conexao.execute(
+                    "INSERT INTO coletas (campeonato, coletado_em) VALUES (?, ?)", (campeonato, momento)
+                ).lastrowid
+                self.conexao.executemany(
+                    f"INSERT INTO times VALUES (?, ?, {', '.join('?' * len(CAMPOS_TIME))})",
+                    [(coleta_id, ordem) + tuple(getattr(t, campo) for campo in CAMPOS_TIME)
+                     for ordem, t in enumerate(times)]
+                )
+                self.conexao.executemany(
+                    "INSERT INTO rodadas VALUES (?, ?, ?, ?, ?)",
+                    [(coleta_id, numero, r.rodada, r.inicio, int(r.rodada_atual))
+                     for numero, r in zip(numeros, rodadas)]
+                )
+                self.conexao.executemany(
+                    f"INSERT INTO partidas VALUES (?, ?, ?, {', '.join('?' * len(CAMPOS_PARTIDA))})",
+                    [(coleta_id, numero, ordem) + tuple(getattr(p, campo) for campo in CAMPOS_PARTIDA)
+                     for numero, r in zip(numeros, rodadas) for ordem, p in enumerate(r.partidas)]
+                )
+        except sqlite3.Error as e:
+            raise Exception(f"Erro ao gravar coleta de {campeonato} em {momento}: {str(e)}")
+        
+        return coleta_id
+    
+    def coletas(self, campeonato: str) -> List[str]:
+        """Momentos das coletas de um campeonato, em ordem"""
+        return [linha[0] for linha in self.conexao.execute(
+            "SELECT coletado_em FROM coletas WHERE campeonato = ? ORDER BY coletado_em", (campeonato,)
+        )]
+    
+    def coleta(self, campeonato: str, momento: Optional[MomentoColeta] = None) -> Optional[Tuple[int, str]]:
+        """
+        Última coleta até um momento
+        
+        Args:
+            campeonato: Chave do campeonato
+            momento: Data (inclui o dia todo), datetime ou texto ISO; None usa a mais recente
+            
+        Returns:
+            Tupla (id, coletado_em), ou None se não houver coleta até o momento
+        """
+        limite = '9999' if momento is None else _texto_momento(momento, fim_do_dia=True)
+        linha = self.conexao.execute(
+            "SELECT id, coletado_em FROM coletas WHERE campeonato = ? AND coletado_em <= ? "
+            "ORDER BY coletado_em DESC LIMIT 1",
+            (campeonato, limite)
+        ).fetchone()
+        return tuple(linha) if linha else None
+    
+    def tabela(self, campeonato: str, momento: Optional[MomentoColeta] = None) -> Optional[TabelaClassificacao]:
+        """
+        Tabela de classificação como estava em um momento
+        
+        Args:
+            campeonato: Chave do campeonato
+            momento: Ver coleta
+            
+        Returns:
+            TabelaClassificacao da coleta, ou None se não houver coleta
+        """
+        coleta = self.coleta(campeonato, momento)
+        if coleta is None:
+            return None
+        linhas = self.conexao.execute(
+            f"SELECT {', '.join(CAMPOS_TIME)} FROM times WHERE coleta_id = ? ORDER BY ordem", (coleta[0],)
+        )
+        return TabelaClassificacao(times=[Time(*linha) for linha in linhas])
+    
+    def rodadas(self, campeonato: str, momento: Optional[MomentoColeta] = None,
+                numeros: Optional[List[int]] = None) -> List[Rodada]:
+        """
+        Rodadas e partidas como estavam em um momento
+        
+        Args:
+            campeonato: Chave do campeonato
+            momento: Ver coleta
+            numeros: Números das rodadas desejadas (None para todas)
+            
+        Returns:
+            Lista de Rodada em ordem (vazia se não houver coleta)
+        """
+        coleta = self.coleta(campeonato, momento)
+        if coleta is None:
+            return []
+        
+        parametros = [coleta[0]]
+        filtro_rodadas = filtro_partidas = ''
+        if numeros is not None:
+            marcadores = ', '.join('?' * len(numeros))
+            filtro_rodadas = f" AND numero IN ({marcadores})"
+            filtro_partidas = f" AND numero_rodada IN ({marcadores})"
+            parametros += list(numeros)
+        
+        rodadas: Dict[int, Rodada] = {}
+        for numero, titulo, inicio, atual in self.conexao.execute(
+            f"SELECT numero, rodada, inicio, rodada_atual FROM rodadas WHERE coleta_id = ?{filtro_rodadas} ORDER BY numero",
+            parametros
+        ):
+            rodadas[numero] = Rodada(rodada=titulo, inicio=inicio, rodada_atual=bool(atual), partidas=[])
+        
+        for linha in self.conexao.execute(
+            f"SELECT numero_rodada, {', '.join(CAMPOS_PARTIDA)} FROM partidas "
+            f"WHERE coleta_id = ?{filtro_partidas} ORDER BY numero_rodada, ordem",
+            parametros
+        ):
+            rodadas[linha[0]].partidas.append(Partida(*linha[1:]))
+        
+        return list(rodadas.values())
+    
+    def partidas_do_time(self, campeonato: str, nome: str, mando: Optional[str] = None,
+                         momento: Optional[MomentoColeta] = None) -> List[Tuple[int, Partida]]:
+        """
+        Partidas de um time como estavam em um momento
+        
+        Args:
+            campeonato: Chave do campeonato
+            nome: Nome exato do time
+            mando: 'casa' ou 'fora' para só um lado (None para todas)
+            momento: Ver coleta
+            
+        Returns:
+            Lista de tuplas (número da rodada, Partida), na ordem das rodadas
+            
+        Raises:
+            ValueError: Se o mando for inválido
+        """
+        if mando not in (None, 'casa', 'fora'):
+            raise ValueError(f"Mando inválido: {mando}")
+        coleta = self.coleta(campeonato, momento)
+        if coleta is None:
+            return []
+        
+        colunas = f"numero_rodada, ordem, {', '.join(CAMPOS_PARTIDA)}"
+        consultas = []
+        if mando in (None, 'casa'):
+            consultas.append(f"SELECT {colunas} FROM partidas WHERE time_casa = ? AND coleta_id = ?")
+        if mando in (None, 'fora'):
+            consultas.append(f"SELECT {colunas} FROM partidas WHERE time_fora = ? AND coleta_id = ?")
+        
+        linhas = self.conexao.execute(
+            ' UNION ALL '.join(consultas) + " ORDER BY numero_rodada, ordem",
+            (nome, coleta[0]) * len(consultas)
+        )
+        return [(linha[0], Partida(*linha[2:])) for linha in linhas]
+    
+    def historico_time(self, campeonato: str, nome: str) -> List[Tuple[str, Time]]:
+        """
+        Linha de um time na tabela em cada coleta
+        
+        Args:
+            campeonato: Chave do campeonato
+            nome: Nome exato do time
+            
+        Returns:
+            Lista de tuplas (coletado_em, Time) em ordem cronológica
+        """
+        linhas = self.conexao.execute(
+            f"SELECT c.coletado_em, {', '.join('t.' + campo for campo in CAMPOS_TIME)} "
+            "FROM times t JOIN coletas c ON c.id = t.coleta_id "
+            "WHERE t.nome = ? AND c.campeonato = ? ORDER BY c.coletado_em",
+            (nome, campeonato)
+        )
+        return [(linha[0], Time(*linha[1:])) for linha in linhas]
+    
+    def importar_pastas(self, diretorio: Union[str, Path], series: Tuple[str, ...] = ('serie_a', 'serie_b')) -> int:
+        """
+        Importa coletas no formato dados_coletados/<AAAA-MM-DD>/<serie>.json
+        
+        Coletas já presentes no banco são ignoradas.
+        
+        Args:
+            diretorio: Pasta com uma subpasta por data
+            series: Séries a importar
+            
+        Returns:
+            Número de coletas importadas
+        """
+        importadas = 0
+        for pasta in sorted(Path(diretorio).iterdir()):
+            try:
+                dia = date.fromisoformat(pasta.name)
+            except ValueError:
+                continue
+            for serie in series:
+                arquivo = pasta / f"{serie}.json"
+                momento = datetime.combine(dia, time())
+                if not arquivo.exists() or self._existe(serie, momento):
+                    continue
+                dados = JSONUtils.load_from_json(str(arquivo))
+                if dados is not None:
+                    self.registrar(serie, dados, momento)
+                    importadas += 1
+        return importadas
+    
+    def _existe(self, campeonato: str, momento: datetime) -> bool:
+        """Se já há coleta do campeonato exatamente neste momento"""
+        return self.conexao.execute(
+            "SELECT 1 FROM coletas WHERE campeonato = ? AND coletado_em = ?",
+            (campeonato, _texto_momento(momento))
+        ).fetchone() is not None
+    
+    def close(self):
+        """Fecha a conexão"""
+        self.conexao.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
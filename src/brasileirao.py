@@ -3,94 +3,324 @@ Classe principal do Brasileirão Python
 Orquestra a obtenção de dados usando os módulos especializados
 """
 
-from typing import Dict, Optional
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+from requests.adapters import HTTPAdapter
 from scrapers.http_client import HTTPClient
 from scrapers.parsers import TabelaParser, RodadasParser
+from scrapers.cache import ResponseCache, ParseMemo
+from scrapers.engines import criar_documento
 from .utils import DataConverter, JSONUtils
-from scrapers.config import URLS
-from .models import DadosBrasileirao
+from scrapers.campeonatos import obter_urls, Identificador
+from .models import DadosBrasileirao, TabelaClassificacao, Rodada, Partida
+
+# Funções compartilhadas com AsyncBrasileirao
+def normalizar_filtros(rodadas: Optional[Iterable[int]],
+                       times: Optional[Iterable[str]]):
+    """Materializa os filtros (que podem ser geradores) em frozensets"""
+    return (
+        frozenset(rodadas) if rodadas is not None else None,
+        frozenset(times) if times is not None else None
+    )
+
+def chave_filtros(rodadas: Optional[Iterable[int]], times: Optional[Iterable[str]],
+                  tipado: bool = False) -> str:
+    """Sufixo da chave de memoização que distingue os filtros e os modelos usados"""
+    if rodadas is None and times is None and not tipado:
+        return ''
+    partes = ['tipado'] if tipado else []
+    if rodadas is not None:
+        partes.append('rodadas=' + ','.join(str(n) for n in sorted(rodadas)))
+    if times is not None:
+        partes.append('times=' + ','.join(sorted(times)))
+    return '#' + '&'.join(partes)
+
+def montar_resultado(tabela: TabelaClassificacao,
+                     rodadas: Optional[List[Rodada]] = None) -> Dict:
+    """
+    Converte os modelos parseados no dicionário de resultado
+    
+    Args:
+        tabela: Tabela de classificação
+        rodadas: Rodadas da série (opcional)
+        
+    Returns:
+        Dicionário com dados da série
+    """
+    resultado = DataConverter.dados_brasileirao_to_dict(
+        DadosBrasileirao(tabela=tabela)
+    )
+    
+    if rodadas is not None:
+        resultado['rodadas'] = [DataConverter.rodada_to_dict(r) for r in rodadas]
+    
+    return resultado
 
 class Brasileirao:
     """Classe principal para obter dados do Brasileirão Série A e B"""
     
-    def __init__(self):
-        """Inicializa a classe com cliente HTTP"""
-        self.http_client = HTTPClient()
+    def __init__(self, cache: Optional[ResponseCache] = None):
+        """
+        Inicializa a classe com cliente HTTP
+        
+        Args:
+            cache: Cache de respostas para GET condicional (opcional)
+        """
+        self.http_client = HTTPClient(cache)
+        self._memo = ParseMemo()
     
-    def obter_dados_brasileirao_a(self, rodadas: bool = True) -> Dict:
+    def obter_dados_brasileirao_a(self, rodadas: Union[bool, Iterable[int]] = True,
+                                  times: Optional[Iterable[str]] = None) -> Dict:
         """
         Obtém dados do Brasileirão Série A
         
         Args:
-            rodadas: Se deve incluir dados das rodadas
+            rodadas: Se deve incluir dados das rodadas, ou os números das
+                     rodadas desejadas (ex. range(20, 26))
+            times: Nomes exatos dos times cujas partidas devem ser incluídas
             
         Returns:
             Dicionário com dados da Série A ou erro
         """
         try:
-            return self._obter_dados_serie('serie_a', rodadas)
+            return self._obter_dados_serie('serie_a', rodadas, times)
         except Exception as e:
             return {'erro': str(e)}
     
-    def obter_dados_brasileirao_b(self, rodadas: bool = True) -> Dict:
+    def obter_dados_brasileirao_b(self, rodadas: Union[bool, Iterable[int]] = True,
+                                  times: Optional[Iterable[str]] = None) -> Dict:
         """
         Obtém dados do Brasileirão Série B
         
         Args:
-            rodadas: Se deve incluir dados das rodadas
+            rodadas: Se deve incluir dados das rodadas, ou os números das
+                     rodadas desejadas (ex. range(20, 26))
+            times: Nomes exatos dos times cujas partidas devem ser incluídas
             
         Returns:
             Dicionário com dados da Série B ou erro
         """
         try:
-            return self._obter_dados_serie('serie_b', rodadas)
+            return self._obter_dados_serie('serie_b', rodadas, times)
         except Exception as e:
             return {'erro': str(e)}
     
-    def _obter_dados_serie(self, serie: str, rodadas: bool) -> Dict:
+    def coletar_varios(self, campeonatos: Iterable[Identificador], workers: int = 8,
+                       rodadas: Union[bool, Iterable[int]] = True) -> Dict[Identificador, Dict]:
         """
-        Método interno para obter dados de uma série específica
+        Obtém dados de vários campeonatos em paralelo
+        
+        As coletas rodam em um pool de threads e compartilham a sessão HTTP.
+        Durante a chamada, o pool de conexões da sessão é dimensionado para o
+        número de workers; os adapters anteriores são restaurados ao final.
         
         Args:
-            serie: Nome da série ('serie_a' ou 'serie_b')
-            rodadas: Se deve incluir rodadas
+            campeonatos: Chaves registradas ou idChampionship (ex. ['serie_a', 1438])
+            workers: Número de coletas simultâneas
+            rodadas: Se deve incluir dados das rodadas, ou os números das rodadas desejadas
             
         Returns:
-            Dicionário com dados da série
+            Dicionário indexado pelo campeonato, com os dados ou erro de cada um
+        """
+        campeonatos = list(campeonatos)
+        # Um gerador seria consumido pelo primeiro worker; materializa uma única vez
+        if not isinstance(rodadas, bool):
+            rodadas, _ = normalizar_filtros(rodadas, None)
+        
+        def coletar(campeonato: Identificador) -> Dict:
+            try:
+                return self._obter_dados_serie(campeonato, rodadas)
+            except Exception as e:
+                return {'erro': str(e)}
+        
+        session = self.http_client.session
+        anteriores = {prefixo: session.adapters[prefixo] for prefixo in ('https://', 'http://')}
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        for prefixo in anteriores:
+            session.mount(prefixo, adapter)
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='brasileirao-coleta') as executor:
+                return dict(zip(campeonatos, executor.map(coletar, campeonatos)))
+        finally:
+            for prefixo, anterior in anteriores.items():
+                session.mount(prefixo, anterior)
+            adapter.close()
+    
+    def obter_tabela(self, serie: str, tipado: bool = False) -> TabelaClassificacao:
+        """
+        Obtém a tabela de classificação de uma série
+        
+        Se a página não mudou desde a última chamada, devolve uma cópia da
+        tabela já parseada sem refazer o parsing (alterar a cópia não afeta
+        as próximas chamadas).
+        
+        Args:
+            serie: Série ou campeonato ('serie_a', chave registrada ou idChampionship)
+            tipado: Se deve gerar TimeTipado (campos numéricos) em vez de Time
+            
+        Returns:
+            TabelaClassificacao da série
+        """
+        return copy.deepcopy(self._tabela(serie, tipado))
+    
+    def obter_rodadas(self, serie: str, rodadas: Optional[Iterable[int]] = None,
+                      times: Optional[Iterable[str]] = None,
+                      tipado: bool = False) -> List[Rodada]:
+        """
+        Obtém as rodadas de uma série
+        
+        Se a página não mudou desde a última chamada com os mesmos filtros,
+        devolve uma cópia das rodadas já parseadas sem refazer o parsing.
+        
+        Args:
+            serie: Série ou campeonato ('serie_a', chave registrada ou idChampionship)
+            rodadas: Números das rodadas desejadas (None para todas)
+            times: Nomes exatos dos times desejados (None para todos)
+            tipado: Se deve gerar os modelos tipados (RodadaTipada, PartidaTipada)
+            
+        Returns:
+            Lista de Rodada da série
+        """
+        return copy.deepcopy(self._rodadas(serie, rodadas, times, tipado))
+    
+    def iter_rodadas(self, serie: str, rodadas: Optional[Iterable[int]] = None,
+                     times: Optional[Iterable[str]] = None,
+                     tipado: bool = False) -> Iterator[Rodada]:
+        """
+        Gera as rodadas de uma série à medida que são parseadas
+        
+        Se a página não mudou desde a última chamada de obter_rodadas ou
+        iter_rodadas com os mesmos filtros, gera cópias das rodadas já
+        parseadas. Uma geração consumida até o fim guarda o resultado para as
+        próximas chamadas; uma interrompida não guarda nada.
+        
+        Args:
+            serie: Série ou campeonato ('serie_a', chave registrada ou idChampionship)
+            rodadas: Números das rodadas desejadas (None para todas)
+            times: Nomes exatos dos times desejados (None para todos)
+            tipado: Se deve gerar os modelos tipados (RodadaTipada, PartidaTipada)
+            
+        Yields:
+            Rodada com suas partidas
+        """
+        rodadas, times = normalizar_filtros(rodadas, times)
+        url = obter_urls(serie)['rodadas']
+        texto, hash_pagina = self.http_client.get_conteudo(url)
+        
+        memoizado = self._memo.consultar(url + chave_filtros(rodadas, times, tipado), hash_pagina)
+        if memoizado is not None:
+            for rodada in memoizado:
+                yield copy.deepcopy(rodada)
+        else:
+            yield from self._iter_memoizando(texto, hash_pagina, url, rodadas, times, tipado)
+    
+    def iter_partidas(self, serie: str, rodadas: Optional[Iterable[int]] = None,
+                      times: Optional[Iterable[str]] = None,
+                      tipado: bool = False) -> Iterator[Partida]:
         """
-        urls = URLS[serie]
+        Gera as partidas de uma série à medida que são parseadas
         
-        tabela_soup = self.http_client.get_page(urls['tabela'])
-        tabela = TabelaParser.parse_tabela(tabela_soup)
+        Compartilha a memoização de obter_rodadas e iter_rodadas.
+        
+        Args:
+            serie: Série ou campeonato ('serie_a', chave registrada ou idChampionship)
+            rodadas: Números das rodadas desejadas (None para todas)
+            times: Nomes exatos dos times desejados (None para todos)
+            tipado: Se deve gerar os modelos tipados (RodadaTipada, PartidaTipada)
+            
+        Yields:
+            Partida, na ordem das rodadas
+        """
+        rodadas, times = normalizar_filtros(rodadas, times)
+        url = obter_urls(serie)['rodadas']
+        texto, hash_pagina = self.http_client.get_conteudo(url)
+        
+        memoizado = self._memo.consultar(url + chave_filtros(rodadas, times, tipado), hash_pagina)
+        if memoizado is not None:
+            for rodada in memoizado:
+                for partida in rodada.partidas:
+                    yield copy.deepcopy(partida)
+        else:
+            for rodada in self._iter_memoizando(texto, hash_pagina, url, rodadas, times, tipado):
+                yield from rodada.partidas
+    
+    def _iter_memoizando(self, texto: str, hash_pagina: str, url: str,
+                         rodadas: Optional[frozenset], times: Optional[frozenset],
+                         tipado: bool) -> Iterator[Rodada]:
+        """
+        Gera as rodadas parseadas e, se a geração chegar ao fim, as memoiza
         
-        resultado = DataConverter.dados_brasileirao_to_dict(
-            DadosBrasileirao(tabela=tabela)
+        O memo guarda cópias feitas antes de cada yield, então alterar as
+        rodadas geradas não afeta as próximas chamadas.
+        """
+        guardadas = []
+        for rodada in RodadasParser.iter_rodadas(criar_documento(texto), rodadas=rodadas, times=times, tipado=tipado):
+            guardadas.append(copy.deepcopy(rodada))
+            yield rodada
+        self._memo.obter(url + chave_filtros(rodadas, times, tipado), hash_pagina, lambda: guardadas)
+    
+    def _tabela(self, serie: str, tipado: bool = False) -> TabelaClassificacao:
+        """Tabela memoizada (compartilhada: não deve ser alterada)"""
+        return self._obter_parseado(
+            obter_urls(serie)['tabela'],
+            lambda doc: TabelaParser.parse_tabela(doc, tipado=tipado),
+            '#tipado' if tipado else ''
         )
+    
+    def _rodadas(self, serie: str, rodadas: Optional[Iterable[int]] = None,
+                 times: Optional[Iterable[str]] = None, tipado: bool = False) -> List[Rodada]:
+        """Rodadas memoizadas (compartilhadas: não devem ser alteradas)"""
+        rodadas, times = normalizar_filtros(rodadas, times)
+        return self._obter_parseado(
+            obter_urls(serie)['rodadas'],
+            lambda doc: RodadasParser.parse_rodadas(doc, rodadas=rodadas, times=times, tipado=tipado),
+            chave_filtros(rodadas, times, tipado)
+        )
+    
+    def _obter_parseado(self, url: str, parser: Callable, sufixo_chave: str = ''):
+        """Obtém uma página e faz o parsing apenas se o conteúdo mudou"""
+        texto, hash_pagina = self.http_client.get_conteudo(url)
+        return self._memo.obter(
+            url + sufixo_chave, hash_pagina, lambda: parser(criar_documento(texto))
+        )
+    
+    def _obter_dados_serie(self, serie: str, rodadas: Union[bool, Iterable[int]],
+                           times: Optional[Iterable[str]] = None) -> Dict:
+        """
+        Método interno para obter dados de uma série específica
         
-        if rodadas:
-            rodadas_soup = self.http_client.get_page(urls['rodadas'])
-            rodadas_data = RodadasParser.parse_rodadas(rodadas_soup)
-            resultado['rodadas'] = [DataConverter.rodada_to_dict(r) for r in rodadas_data]
+        Args:
+            serie: Série ou campeonato ('serie_a', chave registrada ou idChampionship)
+            rodadas: Se deve incluir rodadas, ou os números das rodadas desejadas
+            times: Nomes exatos dos times desejados (None para todos)
+            
+        Returns:
+            Dicionário com dados da série
+        """
+        # Os modelos só são lidos para montar o dicionário: dispensam a cópia
+        tabela = self._tabela(serie)
         
-        return resultado
+        rodadas_data = None
+        if rodadas is not False:
+            filtro_rodadas = None if rodadas is True else rodadas
+            rodadas_data = self._rodadas(serie, filtro_rodadas, times)
+        
+        return montar_resultado(tabela, rodadas_data)
     
-    def salvar_json(self, dados: Dict, arquivo: str) -> bool:
+    def salvar_json(self, dados: Dict, arquivo: str, compacto: Optional[bool] = None) -> bool:
         """
         Salva os dados em um arquivo JSON
         
         Args:
             dados: Dados a serem salvos
             arquivo: Nome do arquivo
+            compacto: Se True, grava sem indentação; se None, usa JSON_CONFIG['compacto']
             
         Returns:
             True se salvou com sucesso, False caso contrário
         """
-        if JSONUtils.save_to_json(dados, arquivo):
-            print(f"Dados salvos em: {arquivo}")
-            return True
-        else:
-            print(f"Erro ao salvar arquivo: {arquivo}")
-            return False
+        return JSONUtils.salvar_e_informar(dados, arquivo, compacto)
     
     def close(self):
         """Fecha o cliente HTTP"""
@@ -103,28 +333,32 @@ class Brasileirao:
         self.close()
 
 # Funções de conveniência para compatibilidade com a API original
-def obter_dados_brasileirao_a(rodadas: bool = True) -> Dict:
+def obter_dados_brasileirao_a(rodadas: Union[bool, Iterable[int]] = True,
+                              times: Optional[Iterable[str]] = None) -> Dict:
     """
     Função de conveniência para obter dados da Série A
     
     Args:
-        rodadas: Se deve incluir dados das rodadas
+        rodadas: Se deve incluir dados das rodadas, ou os números das rodadas desejadas
+        times: Nomes exatos dos times cujas partidas devem ser incluídas
         
     Returns:
         Dicionário com dados da Série A
     """
     with Brasileirao() as brasileirao:
-        return brasileirao.obter_dados_brasileirao_a(rodadas)
+        return brasileirao.obter_dados_brasileirao_a(rodadas, times)
 
-def obter_dados_brasileirao_b(rodadas: bool = True) -> Dict:
+def obter_dados_brasileirao_b(rodadas: Union[bool, Iterable[int]] = True,
+                              times: Optional[Iterable[str]] = None) -> Dict:
     """
     Função de conveniência para obter dados da Série B
     
     Args:
-        rodadas: Se deve incluir dados das rodadas
+        rodadas: Se deve incluir dados das rodadas, ou os números das rodadas desejadas
+        times: Nomes exatos dos times cujas partidas devem ser incluídas
         
     Returns:
         Dicionário com dados da Série B
     """
     with Brasileirao() as brasileirao:
-        return brasileirao.obter_dados_brasileirao_b(rodadas)
+        return brasileirao.obter_dados_brasileirao_b(rodadas, times)
@@ -0,0 +1,295 @@
+"""
+Classificação calculada a partir dos resultados das partidas
+Recalcula a tabela de forma vetorizada sobre ArraysTemporada (requer numpy)
+"""
+
+from typing import Dict, List, Optional, Tuple
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - numpy é uma dependência opcional
+    raise ImportError("MotorClassificacao requer numpy, que é opcional: pip install numpy") from e
+from .arrays import ArraysTemporada
+from .models import TabelaClassificacao, Time, TimeTipado
+from .utils import DataConverter
+
+# Colunas calculadas por time, na ordem em que são empilhadas na matriz de pesos
+ESTATISTICAS = ('vitorias', 'empates', 'derrotas', 'gols_pro', 'gols_contra')
+
+MANDOS = (None, 'casa', 'fora')
+
+# Campos comparados com a tabela coletada (ver Classificacao.conferir)
+CAMPOS_CONFERIDOS = ('posicao', 'pontos', 'jogos', 'vitorias', 'empates', 'derrotas',
+                     'gols_pro', 'gols_contra', 'saldo_gols')
+
+class Classificacao:
+    """
+    Resultado do cálculo: estatísticas por id de time e a ordem da tabela
+    
+    Os arrays têm forma (n_times,) para uma máscara ou (k, n_times) para k
+    máscaras; `ordem` traz os ids dos times do primeiro ao último colocado.
+    """
+    
+    __slots__ = ('times', 'pontos', 'jogos', 'vitorias', 'empates', 'derrotas',
+                 'gols_pro', 'gols_contra', 'ordem')
+    
+    def __init__(self, times: Tuple[str, ...], vitorias: np.ndarray, empates: np.ndarray,
+                 derrotas: np.ndarray, gols_pro: np.ndarray, gols_contra: np.ndarray,
+                 ordem: np.ndarray):
+        self.times = times
+        self.vitorias = vitorias
+        self.empates = empates
+        self.derrotas = derrotas
+        self.gols_pro = gols_pro
+        self.gols_contra = gols_contra
+        self.pontos = 3 * vitorias + empates
+        self.jogos = vitorias + empates + derrotas
+        self.ordem = ordem
+    
+    @property
+    def saldo_gols(self) -> np.ndarray:
+        """Saldo de gols por time"""
+        return self.gols_pro - self.gols_contra
+    
+    @property
+    def aproveitamento(self) -> np.ndarray:
+        """Aproveitamento por time, em % arredondado (0 sem jogos)"""
+        jogos = np.maximum(self.jogos, 1)
+        return np.rint(self.pontos * 100 / (jogos * 3)).astype(np.int32)
+    
+    @property
+    def posicoes(self) -> np.ndarray:
+        """Posição (1 = líder) de cada time, indexada pelo id"""
+        posicoes = np.empty_like(self.ordem)
+        colocacao = np.broadcast_to(np.arange(1, self.ordem.shape[-1] + 1, dtype=self.ordem.dtype),
+                                    self.ordem.shape)
+        np.put_along_axis(posicoes, self.ordem, colocacao, axis=-1)
+        return posicoes
+    
+    def para_tabela(self, escudos: Optional[Dict[str, str]] = None) -> TabelaClassificacao:
+        """
+        Converte em TabelaClassificacao de TimeTipado, em ordem de classificação
+        
+        Args:
+            escudos: URL do escudo por nome de time (opcional)
+            
+        Returns:
+            TabelaClassificacao com os times ordenados
+            
+        Raises:
+            ValueError: Se a classificação for de várias máscaras
+        """
+        if self.ordem.ndim != 1:
+            raise ValueError("para_tabela só converte a classificação de uma máscara")
+        
+        escudos = escudos or {}
+        saldo = self.saldo_gols
+        aproveitamento = self.aproveitamento
+        times = []
+        for posicao, id_time in enumerate(self.ordem.tolist(), 1):
+            nome = self.times[id_time]
+            times.append(TimeTipado(
+                nome=nome,
+                escudo=escudos.get(nome, ''),
+                posicao=posicao,
+                pontos=int(self.pontos[id_time]),
+                jogos=int(self.jogos[id_time]),
+                vitorias=int(self.vitorias[id_time]),
+                empates=int(self.empates[id_time]),
+                derrotas=int(self.derrotas[id_time]),
+                gols_pro=int(self.gols_pro[id_time]),
+                gols_contra=int(self.gols_contra[id_time]),
+                saldo_gols=int(saldo[id_time]),
+                aproveitamento=int(aproveitamento[id_time])
+            ))
+        return TabelaClassificacao(times=times)
+    
+    def conferir(self, tabela: TabelaClassificacao) -> List[str]:
+        """
+        Compara a classificação calculada com a tabela coletada
+        
+        Divergências indicam que o parsing das partidas ou da tabela mudou
+        (ou que a página ainda não refletiu um resultado).
+        
+        Args:
+            tabela: Tabela coletada (Time ou TimeTipado)
+            
+        Returns:
+            Lista de divergências em texto; vazia se tudo confere
+        """
+        calculada = {time.nome: time for time in self.para_tabela().times}
+        divergencias = []
+        
+        for time in tabela.times:
+            coletado = DataConverter.time_tipado(time) if isinstance(time, Time) else time
+            esperado = calculada.pop(coletado.nome, None)
+            if esperado is None:
+                divergencias.append(f"{coletado.nome}: time da tabela sem partidas calculadas")
+                continue
+            for campo in CAMPOS_CONFERIDOS:
+                valor_calculado = getattr(esperado, campo)
+                valor_coletado = getattr(coletado, campo)
+                if valor_calculado != valor_coletado:
+                    divergencias.append(
+                        f"{coletado.nome}: {campo} calculado {valor_calculado}, coletado {valor_coletado}"
+                    )
+        
+        for nome in calculada:
+            divergencias.append(f"{nome}: time calculado ausente da tabela")
+        
+        return divergencias
+
+class MotorClassificacao:
+    """
+    Calcula classificações de uma temporada a partir dos resultados
+    
+    Cada estatística é a soma, sobre as partidas da máscara, de um peso por
+    (partida, time). Os pesos das cinco estatísticas ficam empilhados em uma
+    matriz (n_partidas, 5 * n_times), e uma classificação é um único produto
+    máscara @ pesos; k máscaras viram um produto (k, n_partidas) @ pesos.
+    
+    Desempate: pontos, vitórias, saldo de gols, gols pró e confronto direto.
+    O regulamento da CBF só usa o confronto direto em empates entre dois
+    clubes; empates de três ou mais seguem para os cartões vermelhos, os
+    amarelos e o sorteio. Cartões não são coletados, então esses critérios
+    não são implementados: empates de três ou mais clubes, e de dois que
+    também empatam no confronto direto, ficam em ordem alfabética.
+    """
+    
+    def __init__(self, arrays: ArraysTemporada):
+        """
+        Prepara as matrizes de pesos da temporada
+        
+        Args:
+            arrays: Partidas da temporada
+        """
+        self.arrays = arrays
+        self._pesos: Dict[Optional[str], np.ndarray] = {}
+        # Rank alfabético dos nomes, último critério de desempate
+        self._rank_nomes = np.argsort(np.argsort(np.array(arrays.times, dtype=object)))
+    
+    def calcular(self, mascara: Optional[np.ndarray] = None,
+                 mando: Optional[str] = None) -> Classificacao:
+        """
+        Calcula a classificação considerando apenas as partidas da máscara
+        
+        Args:
+            mascara: Máscara booleana (n_partidas,) ou (k, n_partidas); None usa
+                     todas as partidas jogadas. Partidas sem placar são ignoradas
+            mando: 'casa' ou 'fora' para contar só os jogos como mandante ou
+                   visitante (None para todos)
+                   
+        Returns:
+            Classificacao com uma tabela por máscara
+            
+        Raises:
+            ValueError: Se o mando ou a forma da máscara forem inválidos
+        """
+        if mando not in MANDOS:
+            raise ValueError(f"Mando inválido: {mando}")
+        
+        n_partidas, n_times = len(self.arrays), self.arrays.n_times
+        if mascara is None:
+            mascara = np.ones(n_partidas, dtype=bool)
+        mascara = np.asarray(mascara, dtype=bool)
+        if mascara.shape[-1] != n_partidas or mascara.ndim > 2:
+            raise ValueError(f"Máscara com forma {mascara.shape}, esperado (k, {n_partidas})")
+        
+        # Pesos são exatos em float64 e o produto usa BLAS
+        totais = mascara.astype(np.float64) @ self._matriz_pesos(mando)
+        totais = totais.astype(np.int32).reshape(mascara.shape[:-1] + (len(ESTATISTICAS), n_times))
+        vitorias, empates, derrotas, gols_pro, gols_contra = np.moveaxis(totais, -2, 0)
+        
+        pontos = 3 * vitorias + empates
+        ordem = self._ordenar(pontos, vitorias, gols_pro - gols_contra, gols_pro)
+        ordem = self._desempatar_confronto_direto(ordem, pontos, vitorias, gols_pro - gols_contra,
+                                                  gols_pro, mascara, mando)
+        
+        return Classificacao(self.arrays.times, vitorias, empates, derrotas, gols_pro, gols_contra, ordem)
+    
+    def ate_rodada(self, rodada: int, mando: Optional[str] = None) -> Classificacao:
+        """Classificação com as partidas jogadas até a rodada informada (inclusive)"""
+        return self.calcular(self.arrays.rodada <= rodada, mando)
+    
+    def _matriz_pesos(self, mando: Optional[str]) -> np.ndarray:
+        """Matriz (n_partidas, 5 * n_times) com o peso de cada partida em cada estatística"""
+        if mando in self._pesos:
+            return self._pesos[mando]
+        
+        a = self.arrays
+        n_partidas, n_times = len(a), a.n_times
+        jogada = a.jogada
+        vitoria_casa = jogada & (a.gols_casa > a.gols_fora)
+        vitoria_fora = jogada & (a.gols_casa < a.gols_fora)
+        empate = jogada & (a.gols_casa == a.gols_fora)
+        gols_casa = np.where(jogada, a.gols_casa, 0)
+        gols_fora = np.where(jogada, a.gols_fora, 0)
+        
+        # Valor da estatística para o mandante e para o visitante de cada partida
+        lados = []
+        if mando != 'fora':
+            lados.append((a.casa, (vitoria_casa, empate, vitoria_fora, gols_casa, gols_fora)))
+        if mando != 'casa':
+            lados.append((a.fora, (vitoria_fora, empate, vitoria_casa, gols_fora, gols_casa)))
+        
+        pesos = np.zeros((n_partidas, len(ESTATISTICAS), n_times), dtype=np.float64)
+        linhas = np.arange(n_partidas)
+        for ids, valores in lados:
+            for coluna, valor in enumerate(valores):
+                pesos[linhas, coluna, ids] += valor
+        
+        pesos = pesos.reshape(n_partidas, len(ESTATISTICAS) * n_times)
+        self._pesos[mando] = pesos
+        return pesos
+    
+    def _ordenar(self, pontos: np.ndarray, vitorias: np.ndarray, saldo: np.ndarray,
+                 gols_pro: np.ndarray) -> np.ndarray:
+        """Ordena pelos critérios numéricos e, por último, pelo nome"""
+        rank_nomes = np.broadcast_to(self._rank_nomes, pontos.shape)
+        # lexsort usa a última chave como a principal
+        return np.lexsort((rank_nomes, -gols_pro, -saldo, -vitorias, -pontos), axis=-1)
+    
+    def _desempatar_confronto_direto(self, ordem: np.ndarray, pontos: np.ndarray, vitorias: np.ndarray,
+                                     saldo: np.ndarray, gols_pro: np.ndarray, mascara: np.ndarray,
+                                     mando: Optional[str]) -> np.ndarray:
+        """Aplica o confronto direto aos empates entre exatamente dois clubes (como a CBF)"""
+        chaves = np.stack([pontos, vitorias, saldo, gols_pro], axis=-1)
+        ordenadas = np.take_along_axis(chaves, ordem[..., None], axis=-2)
+        iguais = (ordenadas[..., 1:, :] == ordenadas[..., :-1, :]).all(axis=-1)
+        if not iguais.any():
+            return ordem
+        
+        ordem = ordem.copy()
+        ordem_2d = ordem.reshape(-1, ordem.shape[-1])
+        iguais_2d = iguais.reshape(-1, iguais.shape[-1])
+        mascara_2d = np.broadcast_to(mascara, ordem.shape[:-1] + mascara.shape[-1:]).reshape(-1, mascara.shape[-1])
+        
+        for linha, posicao in zip(*np.nonzero(iguais_2d)):
+            # Só empates de dois: vizinhos de fora não podem estar empatados
+            antes = posicao > 0 and iguais_2d[linha, posicao - 1]
+            depois = posicao + 1 < iguais_2d.shape[1] and iguais_2d[linha, posicao + 1]
+            if antes or depois:
+                continue
+            
+            primeiro, segundo = ordem_2d[linha, posicao], ordem_2d[linha, posicao + 1]
+            if self._pontos_confronto(segundo, primeiro, mascara_2d[linha], mando) > \
+                    self._pontos_confronto(primeiro, segundo, mascara_2d[linha], mando):
+                ordem_2d[linha, posicao], ordem_2d[linha, posicao + 1] = segundo, primeiro
+        
+        return ordem
+    
+    def _pontos_confronto(self, time: int, adversario: int, mascara: np.ndarray,
+                          mando: Optional[str]) -> int:
+        """Pontos de um time nas partidas contra o adversário dentro da máscara"""
+        a = self.arrays
+        validas = mascara & a.jogada
+        em_casa = validas & (a.casa == time) & (a.fora == adversario)
+        fora = validas & (a.fora == time) & (a.casa == adversario)
+        if mando == 'casa':
+            fora = np.zeros_like(fora)
+        elif mando == 'fora':
+            em_casa = np.zeros_like(em_casa)
+        
+        saldo_casa = a.gols_casa[em_casa].astype(np.int32) - a.gols_fora[em_casa]
+        saldo_fora = a.gols_fora[fora].astype(np.int32) - a.gols_casa[fora]
+        saldos = np.concatenate([saldo_casa, saldo_fora])
+        return int(3 * (saldos > 0).sum() + (saldos == 0).sum())
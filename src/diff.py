@@ -0,0 +1,301 @@
+"""
+Comparação entre snapshots do Brasileirão
+Emite eventos tipados com o que mudou entre duas coletas
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from .models import DadosBrasileirao, Partida, Rodada, RodadaTipada
+from .utils import DataConverter, DateUtils, FUSO_BRASILIA
+
+@dataclass
+class Evento:
+    """Base dos eventos emitidos pela comparação de snapshots"""
+
+@dataclass
+class EventoPartida(Evento):
+    """Base dos eventos de uma partida, identificada por temporada, rodada e confronto"""
+    rodada: int
+    time_casa: str
+    time_fora: str
+    temporada: Optional[int]
+
+@dataclass
+class GolMarcado(EventoPartida):
+    """Um time marcou gol(s) desde o snapshot anterior"""
+    time: str
+    gols: int
+    gols_casa: int
+    gols_fora: int
+
+@dataclass
+class PlacarCorrigido(EventoPartida):
+    """O placar diminuiu ou foi apagado (ex. gol anulado)"""
+    gols_casa_anterior: str
+    gols_fora_anterior: str
+    gols_casa: str
+    gols_fora: str
+
+@dataclass
+class PartidaEncerrada(EventoPartida):
+    """A partida terminou (ver DateUtils.partida_encerrada)"""
+    gols_casa: int
+    gols_fora: int
+
+@dataclass
+class PartidaRemarcada(EventoPartida):
+    """O horário ou o local da partida mudou"""
+    data_anterior: str
+    data: str
+    local_anterior: str
+    local: str
+
+@dataclass
+class PartidaAdicionada(EventoPartida):
+    """A partida apareceu na rodada (ex. jogo adiado remarcado para ela)"""
+    data: str
+    local: str
+
+@dataclass
+class PartidaRemovida(EventoPartida):
+    """A partida saiu da rodada (ex. jogo adiado movido para outra)"""
+    data: str
+    local: str
+
+@dataclass
+class PosicaoAlterada(Evento):
+    """Um time mudou de posição na tabela"""
+    time: str
+    posicao_anterior: int
+    posicao: int
+
+ChavePartida = Tuple[int, str, str]
+
+# Rodadas iniciadas há até este tempo podem ter partidas encerrando mesmo sem mudar de conteúdo
+JANELA_RODADA = timedelta(days=7)
+
+class ComparadorSnapshots:
+    """Compara snapshots e entrega os eventos aos inscritos"""
+    
+    def __init__(self):
+        self._inscritos: List[Tuple[Type[Evento], Callable[[Evento], None]]] = []
+    
+    def inscrever(self, tipo: Type[Evento], callback: Callable[[Evento], None]):
+        """
+        Registra um callback para um tipo de evento (e seus subtipos)
+        
+        Args:
+            tipo: Classe do evento, ex. GolMarcado (Evento recebe todos)
+            callback: Função chamada com cada evento
+        """
+        self._inscritos.append((tipo, callback))
+    
+    def processar(self, anterior: Optional[DadosBrasileirao], atual: DadosBrasileirao,
+                  agora: Optional[datetime] = None,
+                  agora_anterior: Optional[datetime] = None) -> List[Evento]:
+        """
+        Compara os snapshots e publica os eventos aos inscritos
+        
+        Args:
+            anterior: Snapshot anterior (None na primeira coleta)
+            atual: Snapshot atual
+            agora: Horário da coleta atual
+            agora_anterior: Horário da coleta anterior
+            
+        Returns:
+            Eventos emitidos
+        """
+        eventos = [] if anterior is None else self.comparar(anterior, atual, agora, agora_anterior)
+        for evento in eventos:
+            for tipo, callback in self._inscritos:
+                if isinstance(evento, tipo):
+                    callback(evento)
+        return eventos
+    
+    @staticmethod
+    def comparar(anterior: DadosBrasileirao, atual: DadosBrasileirao,
+                 agora: Optional[datetime] = None,
+                 agora_anterior: Optional[datetime] = None) -> List[Evento]:
+        """
+        Compara dois snapshots e retorna os eventos de mudança
+        
+        Rodadas são casadas pelo número (RodadaTipada.numero ou o do título,
+        ex. '12ª rodada'), não pela posição na lista; rodadas presentes em
+        só um dos snapshots são ignoradas. Uma rodada que é o mesmo objeto
+        (como devolvido pela memoização de parsing) ou tem a mesma impressão
+        digital (DadosBrasileirao.impressoes) é pulada sem olhar suas
+        partidas, a menos que esteja em andamento (pode ter partidas
+        encerrando sem mudança de placar). As impressões que faltarem são
+        calculadas uma vez e guardadas no próprio snapshot, então um snapshot
+        comparado de novo (como anterior da coleta seguinte) não é
+        percorrido outra vez; por isso ele não deve ser alterado depois.
+        
+        Aceita modelos de texto ou tipados: rodadas tipadas são convertidas
+        para texto antes de comparar, então placares e datas dos eventos
+        seguem o formato de Partida.
+        
+        Args:
+            anterior: Snapshot anterior
+            atual: Snapshot atual
+            agora: Horário da coleta atual (padrão: agora)
+            agora_anterior: Horário da coleta anterior (padrão: o mesmo de agora)
+            
+        Returns:
+            Eventos em ordem: partidas por rodada, depois posições na tabela
+        """
+        agora = agora or datetime.now(FUSO_BRASILIA)
+        agora_anterior = agora_anterior or agora
+        
+        eventos: List[Evento] = []
+        rodadas_anteriores = dict(_numeradas(anterior.rodadas or []))
+        impressoes_anteriores = _impressoes(anterior)
+        impressoes = _impressoes(atual)
+        
+        for numero, rodada in _numeradas(atual.rodadas or []):
+            rodada_anterior = rodadas_anteriores.get(numero)
+            if rodada_anterior is None:
+                continue
+            inalterada = rodada_anterior is rodada or impressoes_anteriores[numero] == impressoes[numero]
+            if inalterada and not ComparadorSnapshots._em_andamento(rodada, agora, agora_anterior):
+                continue
+            eventos.extend(ComparadorSnapshots._comparar_rodada(
+                numero, _como_texto(rodada_anterior), _como_texto(rodada), agora, agora_anterior
+            ))
+        
+        eventos.extend(ComparadorSnapshots._comparar_tabela(anterior, atual))
+        return eventos
+    
+    @staticmethod
+    def _comparar_rodada(numero: int, anterior: Rodada, atual: Rodada,
+                         agora: datetime, agora_anterior: datetime) -> List[Evento]:
+        """Compara as partidas de uma rodada, casadas pelo confronto (inclusões e remoções no fim)"""
+        partidas_anteriores: Dict[ChavePartida, Partida] = {
+            (numero, p.time_casa, p.time_fora): p for p in anterior.partidas
+        }
+        
+        inicio = DateUtils.parse_inicio_rodada(atual.inicio)
+        temporada = inicio.year if inicio else None
+        
+        eventos: List[Evento] = []
+        for partida in atual.partidas:
+            chave = (numero, partida.time_casa, partida.time_fora)
+            partida_anterior = partidas_anteriores.pop(chave, None)
+            if partida_anterior is None:
+                eventos.append(PartidaAdicionada(
+                    *chave, temporada=temporada, data=partida.data, local=partida.local
+                ))
+                continue
+            
+            if partida_anterior != partida:
+                eventos.extend(ComparadorSnapshots._comparar_partida(chave, temporada, partida_anterior, partida))
+            
+            if (DateUtils.partida_encerrada(partida, atual.inicio, agora)
+                    and not DateUtils.partida_encerrada(partida_anterior, anterior.inicio, agora_anterior)):
+                eventos.append(PartidaEncerrada(
+                    *chave, temporada=temporada,
+                    gols_casa=int(partida.gols_casa), gols_fora=int(partida.gols_fora)
+                ))
+        
+        for chave, partida in partidas_anteriores.items():
+            eventos.append(PartidaRemovida(
+                *chave, temporada=temporada, data=partida.data, local=partida.local
+            ))
+        
+        return eventos
+    
+    @staticmethod
+    def _em_andamento(rodada: Union[Rodada, RodadaTipada], agora: datetime, agora_anterior: datetime) -> bool:
+        """Verifica se a rodada começou perto do intervalo entre as duas coletas"""
+        if isinstance(rodada, RodadaTipada):
+            inicio = rodada.inicio
+        else:
+            inicio = DateUtils.parse_inicio_rodada(rodada.inicio)
+        if inicio is None:
+            return False
+        return (agora_anterior - JANELA_RODADA).date() <= inicio <= agora.date()
+    
+    @staticmethod
+    def _comparar_partida(chave: ChavePartida, temporada: Optional[int],
+                          anterior: Partida, atual: Partida) -> List[Evento]:
+        """Compara horário, local e placar de uma partida"""
+        eventos: List[Evento] = []
+        
+        if anterior.data != atual.data or anterior.local != atual.local:
+            eventos.append(PartidaRemarcada(
+                *chave, temporada=temporada,
+                data_anterior=anterior.data, data=atual.data,
+                local_anterior=anterior.local, local=atual.local
+            ))
+        
+        if (anterior.gols_casa, anterior.gols_fora) == (atual.gols_casa, atual.gols_fora):
+            return eventos
+        
+        gols_casa_anterior = _gols(anterior.gols_casa)
+        gols_fora_anterior = _gols(anterior.gols_fora)
+        gols_casa = _gols(atual.gols_casa)
+        gols_fora = _gols(atual.gols_fora)
+        
+        if (atual.gols_casa == '' or atual.gols_fora == ''
+                or gols_casa < gols_casa_anterior or gols_fora < gols_fora_anterior):
+            eventos.append(PlacarCorrigido(
+                *chave, temporada=temporada,
+                gols_casa_anterior=anterior.gols_casa, gols_fora_anterior=anterior.gols_fora,
+                gols_casa=atual.gols_casa, gols_fora=atual.gols_fora
+            ))
+            return eventos
+        
+        for time, gols in ((atual.time_casa, gols_casa - gols_casa_anterior),
+                           (atual.time_fora, gols_fora - gols_fora_anterior)):
+            if gols > 0:
+                eventos.append(GolMarcado(
+                    *chave, temporada=temporada, time=time, gols=gols, gols_casa=gols_casa, gols_fora=gols_fora
+                ))
+        
+        return eventos
+    
+    @staticmethod
+    def _comparar_tabela(anterior: DadosBrasileirao, atual: DadosBrasileirao) -> List[Evento]:
+        """Compara as posições dos times, casados pelo nome"""
+        posicoes_anteriores = {t.nome: t.posicao for t in anterior.tabela.times}
+        
+        eventos: List[Evento] = []
+        for time in atual.tabela.times:
+            posicao_anterior = posicoes_anteriores.get(time.nome)
+            if posicao_anterior is None:
+                continue
+            # Snapshots de texto ('3') e tipados (3) podem ser comparados entre si
+            posicao_anterior, posicao = int(posicao_anterior), int(time.posicao)
+            if posicao_anterior == posicao:
+                continue
+            eventos.append(PosicaoAlterada(
+                time=time.nome, posicao_anterior=posicao_anterior, posicao=posicao
+            ))
+        return eventos
+
+def _numeradas(rodadas: Iterable[Union[Rodada, RodadaTipada]]) -> Iterator[Tuple[int, Union[Rodada, RodadaTipada]]]:
+    """Rodadas com seu número (o do título; a posição só se o título não tiver número)"""
+    for posicao, rodada in enumerate(rodadas, 1):
+        if isinstance(rodada, RodadaTipada):
+            yield rodada.numero, rodada
+        else:
+            yield DataConverter.numero_rodada(rodada.rodada) or posicao, rodada
+
+def _impressoes(dados: DadosBrasileirao) -> Dict[int, str]:
+    """Impressões das rodadas do snapshot por número, calculando (e guardando) as que faltam"""
+    if dados.impressoes is None:
+        dados.impressoes = {}
+    faltantes = {n: r for n, r in _numeradas(dados.rodadas or []) if n not in dados.impressoes}
+    for numero, rodada in faltantes.items():
+        dados.impressoes[numero] = DataConverter.impressao_rodada(rodada)
+    return dados.impressoes
+
+def _como_texto(rodada: Union[Rodada, RodadaTipada]) -> Rodada:
+    """Rodada com modelos de texto (RodadaTipada é convertida)"""
+    if isinstance(rodada, RodadaTipada):
+        return DataConverter.rodada_from_dict(DataConverter.rodada_to_dict(rodada))
+    return rodada
+
+def _gols(texto: str) -> int:
+    """Converte o placar em texto para inteiro ('' vale 0, jogo sem gols ainda)"""
+    return int(texto) if texto else 0
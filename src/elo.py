@@ -0,0 +1,300 @@
+"""
+Ratings Elo dos times do Brasileirão
+Inicializados por uma temporada e atualizados em O(1) a cada partida encerrada
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from .diff import EventoPartida, PartidaEncerrada, PlacarCorrigido
+from .models import Partida, PartidaTipada, Rodada, RodadaTipada
+from .serializacao import codificar, decodificar, gravar_atomico
+from .utils import DataConverter, DateUtils
+
+RATING_INICIAL = 1500.0
+
+# Campos do arquivo gravado por RatingsElo.salvar
+CAMPOS_ESTADO = ('k', 'vantagem_casa', 'fator_margem', 'rating_inicial', 'campeonato', 'ratings', 'ajustes')
+
+def _numero(valor) -> bool:
+    """Se o valor JSON é um número (bool não conta)"""
+    return isinstance(valor, (int, float)) and not isinstance(valor, bool)
+
+class RatingsElo:
+    """
+    Ratings Elo com vantagem de mando e fator de margem de gols
+    
+    O ajuste de cada partida fica registrado, então reprocessar a mesma
+    partida não tem efeito e uma correção de placar troca só o ajuste dela.
+    O sistema é de soma zero: o que o mandante ganha, o visitante perde.
+    """
+    
+    def __init__(self, k: float = 20.0, vantagem_casa: float = 60.0, fator_margem: bool = True,
+                 rating_inicial: float = RATING_INICIAL, campeonato: str = ''):
+        """
+        Args:
+            k: Fator K (tamanho máximo do ajuste por partida, sem margem)
+            vantagem_casa: Pontos de rating somados ao mandante no cálculo da expectativa
+            fator_margem: Se vitórias por mais gols ajustam mais (fórmula do World Football Elo)
+            rating_inicial: Rating de um time ainda sem partidas
+            campeonato: Campeonato padrão das partidas aplicadas (ex. 'serie_b')
+        """
+        self.k = k
+        self.vantagem_casa = vantagem_casa
+        self.fator_margem = fator_margem
+        self.rating_inicial = rating_inicial
+        self.campeonato = campeonato
+        self.ratings: Dict[str, float] = {}
+        # Ajuste aplicado ao mandante em cada partida, por DataConverter.id_partida
+        self.ajustes: Dict[str, float] = {}
+    
+    @classmethod
+    def de_rodadas(cls, rodadas: Iterable[Union[Rodada, RodadaTipada]],
+                   agora: Optional[datetime] = None, **parametros) -> 'RatingsElo':
+        """
+        Inicializa os ratings com as partidas já jogadas, em ordem cronológica
+        (ver DateUtils.partidas_em_ordem)
+        
+        Args:
+            rodadas: Rodadas da temporada (de texto ou tipadas)
+            agora: Se informado, ignora partidas ainda em andamento nesse horário
+                   (ver DateUtils.partida_encerrada)
+            **parametros: Parâmetros do construtor (k, vantagem_casa, ...)
+            
+        Returns:
+            RatingsElo com todas as partidas encerradas aplicadas
+        """
+        elo = cls(**parametros)
+        for numero, temporada, partida in DateUtils.partidas_em_ordem(rodadas, agora):
+            elo.atualizar(partida, numero, temporada)
+        
+        return elo
+    
+    def rating(self, time: str) -> float:
+        """Rating atual de um time (rating_inicial se ainda não jogou)"""
+        return self.ratings.get(time, self.rating_inicial)
+    
+    def expectativa(self, time_casa: str, time_fora: str) -> float:
+        """
+        Resultado esperado do mandante (1 vitória, 0.5 empate, 0 derrota)
+        
+        Args:
+            time_casa: Mandante
+            time_fora: Visitante
+            
+        Returns:
+            Expectativa entre 0 e 1
+        """
+        diferenca = self.rating(time_casa) + self.vantagem_casa - self.rating(time_fora)
+        return 1 / (10 ** (-diferenca / 400) + 1)
+    
+    def ajuste(self, time_casa: str, time_fora: str, gols_casa: int, gols_fora: int) -> float:
+        """
+        Pontos que o mandante ganharia com o placar, sem alterar os ratings
+        
+        Args:
+            time_casa: Mandante
+            time_fora: Visitante
+            gols_casa: Gols do mandante
+            gols_fora: Gols do visitante
+            
+        Returns:
+            Ajuste do mandante (o visitante recebe o negativo)
+        """
+        resultado = 1.0 if gols_casa > gols_fora else 0.5 if gols_casa == gols_fora else 0.0
+        return self.k * self._multiplicador_margem(abs(gols_casa - gols_fora)) * (
+            resultado - self.expectativa(time_casa, time_fora)
+        )
+    
+    def _multiplicador_margem(self, margem: int) -> float:
+        """Multiplicador do K pela diferença de gols"""
+        if not self.fator_margem or margem <= 1:
+            return 1.0
+        if margem == 2:
+            return 1.5
+        return (11 + margem) / 8
+    
+    def atualizar(self, partida: Union[Partida, PartidaTipada], rodada: int,
+                  temporada: Optional[int] = None) -> bool:
+        """
+        Aplica o resultado de uma partida encerrada, em O(1)
+        
+        Args:
+            partida: Partida com placar
+            rodada: Número da rodada da partida
+            temporada: Ano da temporada (ver DateUtils.partidas_em_ordem)
+            
+        Returns:
+            True se os ratings mudaram; False se a partida não tem placar
+            ou já foi aplicada
+        """
+        if isinstance(partida, PartidaTipada):
+            gols_casa, gols_fora = partida.gols_casa, partida.gols_fora
+        else:
+            gols_casa = DataConverter.para_gols(partida.gols_casa)
+            gols_fora = DataConverter.para_gols(partida.gols_fora)
+        
+        if gols_casa is None or gols_fora is None:
+            return False
+        return self.registrar_resultado(partida.time_casa, partida.time_fora, gols_casa, gols_fora,
+                                        rodada, temporada)
+    
+    def registrar_resultado(self, time_casa: str, time_fora: str, gols_casa: int, gols_fora: int,
+                            rodada: int, temporada: Optional[int] = None, corrigir: bool = False,
+                            campeonato: Optional[str] = None) -> bool:
+        """
+        Aplica o placar final de uma partida
+        
+        A partida é identificada por campeonato, temporada, rodada e confronto
+        (DataConverter.id_partida): o returno e o mesmo confronto em outra
+        temporada ou campeonato são partidas novas.
+        
+        Args:
+            time_casa: Mandante
+            time_fora: Visitante
+            gols_casa: Gols do mandante
+            gols_fora: Gols do visitante
+            rodada: Número da rodada
+            temporada: Ano da temporada
+            corrigir: Se a partida já foi aplicada, desfaz o ajuste anterior e
+                      aplica o novo placar (sem recalcular as partidas seguintes)
+            campeonato: Campeonato da partida (None usa self.campeonato)
+            
+        Returns:
+            True se os ratings mudaram
+        """
+        chave = DataConverter.id_partida(
+            time_casa, time_fora, rodada, temporada, self.campeonato if campeonato is None else campeonato
+        )
+        if chave in self.ajustes:
+            if not corrigir:
+                return False
+            self._aplicar(time_casa, time_fora, -self.ajustes.pop(chave))
+        
+        ajuste = self.ajuste(time_casa, time_fora, gols_casa, gols_fora)
+        self._aplicar(time_casa, time_fora, ajuste)
+        self.ajustes[chave] = ajuste
+        return True
+    
+    def _aplicar(self, time_casa: str, time_fora: str, ajuste: float):
+        """Soma o ajuste ao mandante e subtrai do visitante"""
+        self.ratings[time_casa] = self.rating(time_casa) + ajuste
+        self.ratings[time_fora] = self.rating(time_fora) - ajuste
+    
+    def processar_evento(self, evento: EventoPartida) -> bool:
+        """
+        Atualiza os ratings a partir de um evento de ComparadorSnapshots
+        
+        PartidaEncerrada aplica o placar final; PlacarCorrigido de uma
+        partida já aplicada troca o ajuste pelo do novo placar. Pode ser
+        inscrito diretamente: comparador.inscrever(EventoPartida, elo.processar_evento).
+        
+        Args:
+            evento: Evento de partida
+            
+        Returns:
+            True se os ratings mudaram
+        """
+        if isinstance(evento, PartidaEncerrada):
+            return self.registrar_resultado(evento.time_casa, evento.time_fora, evento.gols_casa,
+                                            evento.gols_fora, evento.rodada, evento.temporada)
+        
+        if isinstance(evento, PlacarCorrigido):
+            chave = DataConverter.id_partida(
+                evento.time_casa, evento.time_fora, evento.rodada, evento.temporada, self.campeonato
+            )
+            gols_casa = DataConverter.para_gols(evento.gols_casa)
+            gols_fora = DataConverter.para_gols(evento.gols_fora)
+            if chave not in self.ajustes or gols_casa is None or gols_fora is None:
+                return False
+            return self.registrar_resultado(evento.time_casa, evento.time_fora, gols_casa, gols_fora,
+                                            evento.rodada, evento.temporada, corrigir=True)
+        
+        return False
+    
+    def projetar(self, time_casa: str, time_fora: str, gols_casa: int, gols_fora: int) -> Dict[str, float]:
+        """
+        Ratings dos dois times se a partida terminasse com o placar atual
+        
+        Útil durante o jogo (a cada GolMarcado) sem alterar os ratings.
+        
+        Returns:
+            Dicionário {time: rating projetado}
+        """
+        ajuste = self.ajuste(time_casa, time_fora, gols_casa, gols_fora)
+        return {
+            time_casa: self.rating(time_casa) + ajuste,
+            time_fora: self.rating(time_fora) - ajuste
+        }
+    
+    def ranking(self) -> List[Tuple[str, float]]:
+        """Times ordenados do maior para o menor rating"""
+        return sorted(self.ratings.items(), key=lambda item: (-item[1], item[0]))
+    
+    def salvar(self, arquivo: str):
+        """
+        Grava parâmetros, ratings e ajustes em JSON (escrita atômica)
+        
+        Args:
+            arquivo: Caminho do arquivo
+        """
+        estado = {
+            'k': self.k,
+            'vantagem_casa': self.vantagem_casa,
+            'fator_margem': self.fator_margem,
+            'rating_inicial': self.rating_inicial,
+            'campeonato': self.campeonato,
+            'ratings': self.ratings,
+            'ajustes': self.ajustes
+        }
+        
+        gravar_atomico(arquivo, codificar(estado, compacto=False))
+    
+    @classmethod
+    def carregar(cls, arquivo: str) -> Optional['RatingsElo']:
+        """
+        Lê ratings gravados por salvar
+        
+        Args:
+            arquivo: Caminho do arquivo
+            
+        Returns:
+            RatingsElo restaurado, ou None se o arquivo não existir
+            
+        Raises:
+            ValueError: Se o arquivo não for um JSON no formato gravado por salvar
+        """
+        try:
+            with open(arquivo, 'rb') as f:
+                conteudo = f.read()
+        except FileNotFoundError:
+            return None
+        
+        estado = decodificar(conteudo)
+        cls._validar_estado(estado, arquivo)
+        elo = cls(estado['k'], estado['vantagem_casa'], estado['fator_margem'], estado['rating_inicial'],
+                  estado['campeonato'])
+        elo.ratings = {time: float(valor) for time, valor in estado['ratings'].items()}
+        elo.ajustes = {chave: float(valor) for chave, valor in estado['ajustes'].items()}
+        return elo
+    
+    @staticmethod
+    def _validar_estado(estado, arquivo: str):
+        """Confere campos e tipos do estado gravado por salvar"""
+        if not isinstance(estado, dict):
+            raise ValueError(f"Ratings Elo inválidos em {arquivo}: esperado um objeto JSON")
+        
+        faltando = [campo for campo in CAMPOS_ESTADO if campo not in estado]
+        if faltando:
+            raise ValueError(f"Ratings Elo inválidos em {arquivo}: faltam {', '.join(faltando)}")
+        
+        for campo in ('k', 'vantagem_casa', 'rating_inicial'):
+            if not _numero(estado[campo]):
+                raise ValueError(f"Ratings Elo inválidos em {arquivo}: {campo} deve ser numérico")
+        if not isinstance(estado['fator_margem'], bool):
+            raise ValueError(f"Ratings Elo inválidos em {arquivo}: fator_margem deve ser booleano")
+        if not isinstance(estado['campeonato'], str):
+            raise ValueError(f"Ratings Elo inválidos em {arquivo}: campeonato deve ser texto")
+        for campo in ('ratings', 'ajustes'):
+            valores = estado[campo]
+            if not isinstance(valores, dict) or not all(_numero(v) for v in valores.values()):
+                raise ValueError(f"Ratings Elo inválidos em {arquivo}: {campo} deve mapear nomes a números")
@@ -0,0 +1,309 @@
+"""
+Histórico de snapshots do Brasileirão
+Guarda uma coleta base e, a cada nova coleta, só o que mudou (por time, rodada e partida)
+"""
+
+import copy
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from .serializacao import codificar, decodificar, gravar_atomico
+from .utils import DataConverter, FUSO_BRASILIA
+
+# Formato dos nomes dos arquivos de delta (ordenável e válido em qualquer sistema)
+FORMATO_ARQUIVO = '%Y-%m-%dT%H-%M-%S'
+
+MomentoColeta = Union[datetime, date, str]
+
+class _Estado:
+    """Snapshot indexado por nome do time, número da rodada e confronto"""
+    
+    __slots__ = ('chaves', 'times', 'rodadas', 'outros')
+    
+    def __init__(self):
+        # Chaves da raiz, na ordem original ('tabela', 'rodadas' e eventuais outras)
+        self.chaves: List[str] = []
+        self.times: Dict[str, Dict] = {}
+        self.rodadas: Dict[int, Tuple[Dict, Dict[str, Dict]]] = {}
+        self.outros: Dict[str, Any] = {}
+    
+    @classmethod
+    def de_dados(cls, dados: Dict) -> '_Estado':
+        """
+        Indexa um snapshot no formato de salvar_json
+        
+        Rodadas são indexadas pelo número do título ('12ª rodada'; a posição
+        se o título não tiver número), como em BancoSnapshots.
+        
+        Raises:
+            ValueError: Se duas rodadas tiverem o mesmo número
+        """
+        estado = cls()
+        estado.chaves = list(dados)
+        for chave, valor in dados.items():
+            if chave not in ('tabela', 'rodadas'):
+                estado.outros[chave] = copy.deepcopy(valor)
+        for time_ in dados.get('tabela', []):
+            estado.times[time_['nome']] = dict(time_)
+        for posicao, rodada in enumerate(dados.get('rodadas', []), 1):
+            numero = DataConverter.numero_rodada(rodada.get('rodada', '')) or posicao
+            if numero in estado.rodadas:
+                raise ValueError(f"Rodada {numero} repetida no snapshot: {rodada.get('rodada')!r}")
+            campos = {k: v for k, v in rodada.items() if k != 'partidas'}
+            partidas = {}
+            for partida in rodada.get('partidas', []):
+                partidas[_chave_partida(partida, partidas)] = dict(partida)
+            estado.rodadas[numero] = (campos, partidas)
+        return estado
+    
+    def para_dados(self) -> Dict:
+        """Volta ao formato de salvar_json"""
+        dados = {}
+        for chave in self.chaves:
+            if chave == 'tabela':
+                dados[chave] = [dict(time_) for time_ in self.times.values()]
+            elif chave == 'rodadas':
+                dados[chave] = [
+                    {**campos, 'partidas': [dict(partida) for partida in partidas.values()]}
+                    for campos, partidas in self.rodadas.values()
+                ]
+            else:
+                dados[chave] = copy.deepcopy(self.outros[chave])
+        return dados
+    
+    def diferenca(self, novo: '_Estado') -> Dict:
+        """
+        Delta que transforma este estado no novo
+        
+        Só entram times, campos de rodada e partidas alterados; as listas de
+        ordem aparecem apenas quando a ordem (ou o conjunto) mudou. Rodadas
+        ficam pelo número (texto no JSON, como toda chave de objeto).
+        """
+        delta: Dict[str, Any] = {}
+        
+        outros = {k: v for k, v in novo.outros.items() if self.outros.get(k) != v}
+        if outros:
+            delta['outros'] = outros
+        if self.chaves != novo.chaves:
+            delta['chaves'] = novo.chaves
+        
+        times = {nome: t for nome, t in novo.times.items() if self.times.get(nome) != t}
+        if times:
+            delta['tabela'] = times
+        if list(self.times) != list(novo.times):
+            delta['ordem_tabela'] = list(novo.times)
+        
+        rodadas = {}
+        for numero, (campos, partidas) in novo.rodadas.items():
+            campos_antigos, partidas_antigas = self.rodadas.get(numero, ({}, {}))
+            mudancas: Dict[str, Any] = {k: v for k, v in campos.items() if campos_antigos.get(k) != v}
+            alteradas = {chave: p for chave, p in partidas.items() if partidas_antigas.get(chave) != p}
+            if alteradas:
+                mudancas['partidas'] = alteradas
+            if list(partidas_antigas) != list(partidas) or list(campos_antigos) != list(campos):
+                mudancas['ordem_partidas'] = list(partidas)
+                mudancas['ordem_campos'] = list(campos)
+            if mudancas:
+                rodadas[str(numero)] = mudancas
+        if rodadas:
+            delta['rodadas'] = rodadas
+        if list(self.rodadas) != list(novo.rodadas):
+            delta['ordem_rodadas'] = list(novo.rodadas)
+        
+        return delta
+    
+    def aplicar(self, delta: Dict):
+        """Aplica um delta gerado por diferenca"""
+        self.outros.update(copy.deepcopy(delta.get('outros', {})))
+        if 'chaves' in delta:
+            self.chaves = list(delta['chaves'])
+        
+        self.times.update(delta.get('tabela', {}))
+        if 'ordem_tabela' in delta:
+            self.times = {nome: self.times[nome] for nome in delta['ordem_tabela']}
+        
+        for chave, mudancas in delta.get('rodadas', {}).items():
+            numero = int(chave)
+            campos, partidas = self.rodadas.get(numero, ({}, {}))
+            campos = {**campos, **{k: v for k, v in mudancas.items() if k not in _CHAVES_RODADA}}
+            partidas = {**partidas, **mudancas.get('partidas', {})}
+            if 'ordem_partidas' in mudancas:
+                partidas = {chave: partidas[chave] for chave in mudancas['ordem_partidas']}
+                campos = {k: campos[k] for k in mudancas['ordem_campos']}
+            self.rodadas[numero] = (campos, partidas)
+        if 'ordem_rodadas' in delta:
+            self.rodadas = {numero: self.rodadas[numero] for numero in delta['ordem_rodadas']}
+
+_CHAVES_RODADA = ('partidas', 'ordem_partidas', 'ordem_campos')
+
+def _chave_partida(partida: Dict, existentes: Dict) -> str:
+    """Chave da partida na rodada ('Casa x Fora'; repetições ganham sufixo)"""
+    chave = f"{partida.get('time_casa', '')} x {partida.get('time_fora', '')}"
+    base, n = chave, 1
+    while chave in existentes:
+        n += 1
+        chave = f"{base} #{n}"
+    return chave
+
+def _momento(valor: Optional[MomentoColeta], fim_do_dia: bool = True) -> Optional[str]:
+    """
+    Converte um momento no nome de arquivo equivalente, no horário de Brasília
+    
+    Momentos com fuso são convertidos para FUSO_BRASILIA; momentos sem fuso
+    (e datas) já são considerados no horário de Brasília. Uma data vale pelo
+    dia todo se fim_do_dia.
+    """
+    if valor is None:
+        return None
+    if isinstance(valor, str):
+        valor = datetime.fromisoformat(valor) if 'T' in valor or ' ' in valor else date.fromisoformat(valor)
+    if not isinstance(valor, datetime):
+        valor = datetime.combine(valor, time.max if fim_do_dia else time())
+    if valor.tzinfo is not None:
+        valor = valor.astimezone(FUSO_BRASILIA)
+    return valor.strftime(FORMATO_ARQUIVO)
+
+class HistoricoSnapshots:
+    """
+    Histórico de coletas com deltas por time, rodada e partida
+    
+    Estrutura em disco, por série:
+        <diretorio>/<serie>/base.json               primeira coleta completa
+        <diretorio>/<serie>/deltas/<momento>.json   só o que mudou em cada coleta
+    
+    Coletas sem mudanças não geram arquivo. Qualquer coleta anterior é
+    reconstruída aplicando os deltas sobre a base.
+    """
+    
+    def __init__(self, diretorio: Union[str, Path]):
+        """
+        Args:
+            diretorio: Pasta raiz do histórico
+        """
+        self.diretorio = Path(diretorio)
+        # Última coleta de cada série, mantida para calcular o próximo delta
+        self._ultimo: Dict[str, Tuple[str, _Estado]] = {}
+    
+    def _pasta(self, serie: str) -> Path:
+        return self.diretorio / serie
+    
+    def momentos(self, serie: str) -> List[str]:
+        """
+        Momentos das coletas armazenadas, em ordem
+        
+        Args:
+            serie: Série (ex. 'serie_b')
+            
+        Returns:
+            Lista de momentos no formato FORMATO_ARQUIVO; vazia se não houver base
+        """
+        base = self._pasta(serie) / 'base.json'
+        if not base.exists():
+            return []
+        momentos = [decodificar(base.read_bytes())['coletado_em']]
+        pasta_deltas = self._pasta(serie) / 'deltas'
+        if pasta_deltas.exists():
+            momentos += sorted(arquivo.stem for arquivo in pasta_deltas.glob('*.json'))
+        return momentos
+    
+    def _reconstruir_estado(self, serie: str, ate: Optional[str]) -> Optional[Tuple[str, _Estado]]:
+        """Aplica os deltas até o momento pedido (None = último)"""
+        base = self._pasta(serie) / 'base.json'
+        if not base.exists():
+            return None
+        
+        conteudo = decodificar(base.read_bytes())
+        momento = conteudo['coletado_em']
+        if ate is not None and momento > ate:
+            return None
+        
+        estado = _Estado.de_dados(conteudo['dados'])
+        pasta_deltas = self._pasta(serie) / 'deltas'
+        if pasta_deltas.exists():
+            for arquivo in sorted(pasta_deltas.glob('*.json')):
+                if ate is not None and arquivo.stem > ate:
+                    break
+                estado.aplicar(decodificar(arquivo.read_bytes()))
+                momento = arquivo.stem
+        return momento, estado
+    
+    def reconstruir(self, serie: str, ate: Optional[MomentoColeta] = None) -> Optional[Dict]:
+        """
+        Reconstrói o snapshot de uma série como estava em um momento
+        
+        Args:
+            serie: Série (ex. 'serie_b')
+            ate: Data (inclui o dia todo), datetime ou texto ISO; None usa a última coleta
+            
+        Returns:
+            Snapshot no formato de salvar_json, ou None se não houver coleta até o momento
+        """
+        resultado = self._reconstruir_estado(serie, _momento(ate))
+        return resultado[1].para_dados() if resultado else None
+    
+    def registrar(self, serie: str, dados: Dict, coletado_em: Optional[datetime] = None) -> Optional[str]:
+        """
+        Registra uma coleta, gravando só o que mudou desde a anterior
+        
+        Args:
+            serie: Série (ex. 'serie_b')
+            dados: Snapshot no formato de salvar_json ('tabela' e 'rodadas')
+            coletado_em: Momento da coleta (padrão: agora, no horário de Brasília; com
+                         fuso, é convertido para ele); deve ser posterior à última
+                         
+        Returns:
+            Caminho do arquivo gravado, ou None se nada mudou
+            
+        Raises:
+            ValueError: Se a coleta for anterior (ou igual) à última registrada, ou
+                        se duas rodadas do snapshot tiverem o mesmo número
+        """
+        momento = _momento(coletado_em or datetime.now(FUSO_BRASILIA), fim_do_dia=False)
+        novo = _Estado.de_dados(dados)
+        pasta = self._pasta(serie)
+        
+        if serie not in self._ultimo:
+            ultimo = self._reconstruir_estado(serie, None)
+            if ultimo is not None:
+                self._ultimo[serie] = ultimo
+        
+        if serie not in self._ultimo:
+            arquivo = pasta / 'base.json'
+            gravar_atomico(arquivo, codificar({'coletado_em': momento, 'dados': dados}, compacto=True))
+        else:
+            momento_anterior, anterior = self._ultimo[serie]
+            if momento <= momento_anterior:
+                raise ValueError(f"Coleta de {momento} não é posterior à última ({momento_anterior})")
+            delta = anterior.diferenca(novo)
+            if not delta:
+                return None
+            arquivo = pasta / 'deltas' / f"{momento}.json"
+            gravar_atomico(arquivo, codificar(delta, compacto=True))
+        
+        self._ultimo[serie] = (momento, novo)
+        return str(arquivo)
+    
+    def importar_pastas(self, diretorio: Union[str, Path], series: Tuple[str, ...] = ('serie_a', 'serie_b')) -> int:
+        """
+        Importa coletas antigas no formato dados_coletados/<AAAA-MM-DD>/<serie>.json
+        
+        Args:
+            diretorio: Pasta com uma subpasta por data
+            series: Séries a importar
+            
+        Returns:
+            Número de coletas que geraram base ou delta
+        """
+        importadas = 0
+        for pasta in sorted(Path(diretorio).iterdir()):
+            try:
+                dia = date.fromisoformat(pasta.name)
+            except ValueError:
+                continue
+            for serie in series:
+                arquivo = pasta / f"{serie}.json"
+                if arquivo.exists() and self.registrar(
+                    serie, decodificar(arquivo.read_bytes()), datetime.combine(dia, time())
+                ):
+                    importadas += 1
+        return importadas
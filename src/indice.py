@@ -0,0 +1,171 @@
+"""
+Índices de uma temporada do Brasileirão
+Times e locais internados em ids, com as partidas indexadas por time, rodada e data
+"""
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Union
+from .models import Partida, PartidaTipada, Rodada, RodadaTipada
+from .utils import DataConverter, DateUtils
+
+PartidaQualquer = Union[Partida, PartidaTipada]
+
+class IndiceTemporada:
+    """
+    Partidas de uma temporada com índices pré-calculados
+    
+    Cada nome de time e de local é guardado uma única vez e recebe um id;
+    os índices guardam só os ids. `partidas` são os próprios modelos
+    recebidos, sem cópia nem alteração: os nomes já chegam internados pelo
+    parser e por DataConverter.partida_from_dict. Consultas por time e por
+    rodada custam O(k) no número de partidas devolvidas e consultas por data
+    usam busca binária sobre as partidas ordenadas pelo horário.
+    """
+    
+    def __init__(self, rodadas: Iterable[Union[Rodada, RodadaTipada]]):
+        """
+        Monta os índices a partir das rodadas (de texto ou tipadas)
+        
+        Args:
+            rodadas: Rodadas da temporada com suas partidas
+        """
+        self.times: List[str] = []
+        self.ids_times: Dict[str, int] = {}
+        self.locais: List[str] = []
+        self.ids_locais: Dict[str, int] = {}
+        
+        self.partidas: List[PartidaQualquer] = []
+        self.casa = array('H')
+        self.fora = array('H')
+        self.local = array('H')
+        self.rodada = array('H')
+        self.data: List[Optional[datetime]] = []
+        
+        self.por_time: List[List[int]] = []
+        self.por_time_casa: List[List[int]] = []
+        self.por_time_fora: List[List[int]] = []
+        self.por_rodada: Dict[int, List[int]] = {}
+        
+        for posicao, rodada in enumerate(rodadas, 1):
+            if isinstance(rodada, RodadaTipada):
+                numero = rodada.numero
+            else:
+                numero = DataConverter.numero_rodada(rodada.rodada) or posicao
+            
+            for partida in rodada.partidas:
+                self._adicionar(partida, rodada, numero)
+        
+        # Partidas com horário, ordenadas (as sem horário ficam fora deste índice)
+        self.por_data: List[int] = sorted(
+            (i for i, data in enumerate(self.data) if data is not None),
+            key=lambda i: (self.data[i], i)
+        )
+        self.datas_ordenadas: List[datetime] = [self.data[i] for i in self.por_data]
+    
+    def _internar(self, nome: str, nomes: List[str], ids: Dict[str, int]) -> int:
+        """Id de um nome, registrando-o na primeira ocorrência"""
+        id_nome = ids.get(nome)
+        if id_nome is None:
+            id_nome = ids[nome] = len(nomes)
+            nomes.append(sys.intern(nome))
+        return id_nome
+    
+    def _id_time(self, nome: str) -> int:
+        """Id de um time, criando suas listas de partidas se for novo"""
+        id_time = self._internar(nome, self.times, self.ids_times)
+        if id_time == len(self.por_time):
+            self.por_time.append([])
+            self.por_time_casa.append([])
+            self.por_time_fora.append([])
+        return id_time
+    
+    def _adicionar(self, partida: PartidaQualquer, rodada: Union[Rodada, RodadaTipada], numero: int):
+        """Registra uma partida em todos os índices"""
+        indice = len(self.partidas)
+        casa = self._id_time(partida.time_casa)
+        fora = self._id_time(partida.time_fora)
+        
+        local = self._internar(partida.local, self.locais, self.ids_locais)
+        
+        if isinstance(partida, PartidaTipada):
+            data = partida.data
+        else:
+            data = DateUtils.parse_data_partida(partida.data, rodada.inicio)
+        
+        self.partidas.append(partida)
+        self.casa.append(casa)
+        self.fora.append(fora)
+        self.local.append(local)
+        self.rodada.append(numero)
+        self.data.append(data)
+        
+        self.por_time[casa].append(indice)
+        self.por_time[fora].append(indice)
+        self.por_time_casa[casa].append(indice)
+        self.por_time_fora[fora].append(indice)
+        self.por_rodada.setdefault(numero, []).append(indice)
+    
+    def __len__(self) -> int:
+        return len(self.partidas)
+    
+    def id_time(self, nome: str) -> int:
+        """
+        Id de um time pelo nome exato
+        
+        Raises:
+            KeyError: Se o time não estiver na temporada
+        """
+        return self.ids_times[nome]
+    
+    def indices_do_time(self, nome: str, mando: Optional[str] = None) -> List[int]:
+        """
+        Índices das partidas de um time, na ordem das rodadas
+        
+        Args:
+            nome: Nome exato do time
+            mando: 'casa' ou 'fora' para só um lado (None para todas)
+            
+        Returns:
+            Lista de índices em `partidas`
+            
+        Raises:
+            KeyError: Se o time não estiver na temporada
+            ValueError: Se o mando for inválido
+        """
+        id_time = self.id_time(nome)
+        if mando is None:
+            return self.por_time[id_time]
+        if mando == 'casa':
+            return self.por_time_casa[id_time]
+        if mando == 'fora':
+            return self.por_time_fora[id_time]
+        raise ValueError(f"Mando inválido: {mando}")
+    
+    def partidas_do_time(self, nome: str, mando: Optional[str] = None) -> List[PartidaQualquer]:
+        """Partidas de um time (ver indices_do_time)"""
+        return [self.partidas[i] for i in self.indices_do_time(nome, mando)]
+    
+    def partidas_da_rodada(self, numero: int) -> List[PartidaQualquer]:
+        """Partidas de uma rodada ([] se a rodada não existir)"""
+        return [self.partidas[i] for i in self.por_rodada.get(numero, [])]
+    
+    def indices_entre(self, inicio: datetime, fim: datetime) -> List[int]:
+        """
+        Índices das partidas com início no intervalo [inicio, fim], em ordem cronológica
+        
+        Args:
+            inicio: Início do intervalo (com fuso)
+            fim: Fim do intervalo (com fuso)
+            
+        Returns:
+            Lista de índices em `partidas`
+        """
+        return self.por_data[bisect_left(self.datas_ordenadas, inicio):
+                             bisect_right(self.datas_ordenadas, fim)]
+    
+    def partidas_entre(self, inicio: datetime, fim: datetime) -> List[PartidaQualquer]:
+        """Partidas com início no intervalo [inicio, fim] (ver indices_entre)"""
+        return [self.partidas[i] for i in self.indices_entre(inicio, fim)]
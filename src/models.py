@@ -3,8 +3,8 @@ Modelos de dados e tipos para o projeto Brasileirão
 """
 
 from typing import List, Dict, Optional, Union
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime
 
 @dataclass
 class Time:
@@ -42,16 +42,73 @@ class Rodada:
     rodada_atual: bool
     partidas: List[Partida]
 
+@dataclass
+class TimeTipado:
+    """Time da tabela com campos numéricos (aproveitamento em %, sem o sinal)"""
+    __slots__ = (
+        'nome', 'escudo', 'posicao', 'pontos', 'jogos', 'vitorias', 'empates', 'derrotas',
+        'gols_pro', 'gols_contra', 'saldo_gols', 'aproveitamento'
+    )
+    nome: str
+    escudo: str
+    posicao: int
+    pontos: int
+    jogos: int
+    vitorias: int
+    empates: int
+    derrotas: int
+    gols_pro: int
+    gols_contra: int
+    saldo_gols: int
+    aproveitamento: int
+
+@dataclass
+class PartidaTipada:
+    """Partida com placar numérico (None antes do jogo) e horário em datetime"""
+    __slots__ = ('partida', 'data', 'data_texto', 'local', 'time_casa', 'time_fora', 'gols_casa', 'gols_fora')
+    partida: str
+    data: Optional[datetime]
+    data_texto: str
+    local: str
+    time_casa: str
+    time_fora: str
+    gols_casa: Optional[int]
+    gols_fora: Optional[int]
+    
+    @property
+    def resultado_texto(self) -> str:
+        """Resultado no mesmo formato de Partida.resultado_texto"""
+        gols_casa = '' if self.gols_casa is None else self.gols_casa
+        gols_fora = '' if self.gols_fora is None else self.gols_fora
+        return f"{self.time_casa} {gols_casa} x {gols_fora} {self.time_fora}"
+
+@dataclass
+class RodadaTipada:
+    """Rodada com número e data de início parseados"""
+    __slots__ = ('numero', 'rodada', 'inicio', 'rodada_atual', 'partidas')
+    numero: int
+    rodada: str
+    inicio: Optional[date]
+    rodada_atual: bool
+    partidas: List[PartidaTipada]
+
 @dataclass
 class TabelaClassificacao:
     """Modelo para tabela de classificação"""
-    times: List[Time]
+    times: List[Union[Time, TimeTipado]]
 
 @dataclass
 class DadosBrasileirao:
-    """Modelo para dados completos do Brasileirão"""
+    """
+    Modelo para dados completos do Brasileirão
+    
+    impressoes guarda a impressão digital de cada rodada (número da rodada ->
+    DataConverter.impressao_rodada), preenchida por quem monta o snapshot ou
+    pela primeira comparação (ver src.diff); não entra na igualdade.
+    """
     tabela: TabelaClassificacao
-    rodadas: Optional[List[Rodada]] = None
+    rodadas: Optional[List[Union[Rodada, RodadaTipada]]] = None
+    impressoes: Optional[Dict[int, str]] = field(default=None, compare=False, repr=False)
 
 # Tipos para compatibilidade
 TimeDict = Dict[str, str]
@@ -0,0 +1,356 @@
+"""
+Serialização JSON do projeto Brasileirão
+Usa orjson ou ujson quando instalados e cai para o módulo json da biblioteca padrão;
+grava arquivos de forma atômica e lê arrays grandes item a item
+"""
+
+import json
+import os
+import re
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterator, Optional, TextIO, Tuple, Union
+from scrapers.config import JSON_CONFIG
+
+BACKENDS = ('orjson', 'ujson', 'json')
+
+# Caracteres lidos por vez pelo leitor incremental
+TAMANHO_BLOCO = 1 << 16
+
+_ESPACOS = ' \t\n\r'
+
+# Varredura do leitor incremental: delimitadores fora de strings, fim de string e fim de escalar
+_ESTRUTURA = re.compile(r'["\[\]{}]')
+_STRING = re.compile(r'["\\]')
+_FIM_ESCALAR = re.compile(r'[ \t\n\r,\]}:]')
+
+@lru_cache(maxsize=None)
+def backends_disponiveis() -> Tuple[str, ...]:
+    """Lista os backends JSON instalados, do mais rápido para o mais lento"""
+    disponiveis = []
+    try:
+        import orjson  # noqa: F401
+        disponiveis.append('orjson')
+    except ImportError:
+        pass
+    try:
+        import ujson  # noqa: F401
+        disponiveis.append('ujson')
+    except ImportError:
+        pass
+    disponiveis.append('json')
+    return tuple(disponiveis)
+
+def resolver_backend(backend: Optional[str] = None) -> str:
+    """
+    Resolve qual backend usar
+    
+    Args:
+        backend: Backend desejado ('auto', 'orjson', 'ujson' ou 'json').
+                 Se None, usa JSON_CONFIG['backend']
+                 
+    Returns:
+        Nome do backend que será usado; cai para 'json' se o backend
+        pedido não estiver instalado
+    """
+    backend = backend or JSON_CONFIG['backend']
+    disponiveis = backends_disponiveis()
+    
+    if backend == 'auto':
+        return disponiveis[0]
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend JSON desconhecido: {backend}")
+    
+    return backend if backend in disponiveis else 'json'
+
+def codificar(dados: Any, compacto: Optional[bool] = None, backend: Optional[str] = None) -> bytes:
+    """
+    Serializa dados em JSON UTF-8
+    
+    Todos os backends produzem o mesmo texto: caracteres não ASCII sem
+    escape e, fora do modo compacto, indentação de 2 espaços.
+    
+    Args:
+        dados: Dados a serializar
+        compacto: Se True, omite indentação e espaços; se None, usa JSON_CONFIG['compacto']
+        backend: Backend a usar (ver resolver_backend)
+        
+    Returns:
+        JSON codificado em UTF-8
+    """
+    if compacto is None:
+        compacto = JSON_CONFIG['compacto']
+    backend = resolver_backend(backend)
+    
+    if backend == 'orjson':
+        import orjson
+        opcoes = orjson.OPT_NON_STR_KEYS
+        if not compacto:
+            opcoes |= orjson.OPT_INDENT_2
+        return orjson.dumps(dados, option=opcoes)
+    
+    if backend == 'ujson':
+        import ujson
+        # Separadores explícitos: os padrões do ujson não coincidem com os do json
+        if compacto:
+            texto = ujson.dumps(dados, ensure_ascii=False, escape_forward_slashes=False,
+                                separators=(',', ':'))
+        else:
+            texto = ujson.dumps(dados, ensure_ascii=False, escape_forward_slashes=False,
+                                indent=2, separators=(',', ': '))
+    elif compacto:
+        texto = json.dumps(dados, ensure_ascii=False, separators=(',', ':'))
+    else:
+        texto = json.dumps(dados, ensure_ascii=False, indent=2)
+    return texto.encode('utf-8')
+
+def decodificar(conteudo: Union[bytes, str], backend: Optional[str] = None) -> Any:
+    """
+    Lê um documento JSON
+    
+    Args:
+        conteudo: JSON em bytes (UTF-8) ou texto
+        backend: Backend a usar (ver resolver_backend)
+        
+    Returns:
+        Dados decodificados
+    """
+    backend = resolver_backend(backend)
+    
+    if backend == 'orjson':
+        import orjson
+        return orjson.loads(conteudo)
+    if backend == 'ujson':
+        import ujson
+        return ujson.loads(conteudo)
+    return json.loads(conteudo)
+
+def gravar_atomico(arquivo: Union[str, Path], conteudo: bytes):
+    """
+    Grava um arquivo de forma atômica
+    
+    O conteúdo vai para um temporário na mesma pasta, é sincronizado em disco
+    (fsync) e só então substitui o destino com os.replace. Uma queda no meio
+    da gravação deixa o arquivo anterior intacto, nunca um arquivo truncado.
+    
+    Args:
+        arquivo: Caminho do arquivo de destino
+        conteudo: Bytes a gravar
+        
+    Raises:
+        OSError: Se a gravação falhar (o temporário é removido)
+    """
+    caminho = Path(arquivo)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    # Nome único na mesma pasta (os.replace não atravessa sistemas de arquivos);
+    # criado com a umask do processo, como um open() comum
+    temporario = caminho.parent / f".{caminho.name}.{uuid.uuid4().hex[:12]}.tmp"
+    fd = os.open(str(temporario), os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(conteudo)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+    except BaseException:
+        try:
+            os.unlink(temporario)
+        except OSError:
+            pass
+        raise
+    
+    # Sincroniza a pasta para que a troca de nomes também sobreviva a uma queda
+    if hasattr(os, 'O_DIRECTORY'):
+        fd_pasta = os.open(str(caminho.parent), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd_pasta)
+        finally:
+            os.close(fd_pasta)
+
+class _LeitorIncremental:
+    """
+    Buffer de texto sobre um arquivo, lido em blocos sob demanda
+    
+    Antes de decodificar, o fim de cada valor é localizado por uma varredura
+    que guarda a profundidade e se está dentro de uma string; a varredura
+    continua de onde parou quando chega um bloco novo. Assim cada caractere
+    é varrido uma vez e cada valor é decodificado uma única vez, já completo.
+    """
+    
+    def __init__(self, arquivo: TextIO, tamanho_bloco: int):
+        self.arquivo = arquivo
+        self.tamanho_bloco = tamanho_bloco
+        self.buffer = ''
+        self.pos = 0
+        self.fim = False
+        self.decoder = json.JSONDecoder()
+        # (posição relativa a pos, profundidade, dentro de string) da varredura em curso
+        self._varredura = (0, 0, False)
+    
+    def ler_mais(self) -> bool:
+        """Acrescenta um bloco ao buffer, descartando o que já foi consumido"""
+        if self.fim:
+            return False
+        bloco = self.arquivo.read(self.tamanho_bloco)
+        if not bloco:
+            self.fim = True
+            return False
+        self.buffer = self.buffer[self.pos:] + bloco
+        self.pos = 0
+        return True
+    
+    def proximo(self) -> str:
+        """Pula espaços e retorna o próximo caractere sem consumi-lo ('' no fim do arquivo)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _ESPACOS:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.ler_mais():
+                return ''
+    
+    def esperar(self, caractere: str):
+        """Consome o caractere esperado"""
+        encontrado = self.proximo()
+        if encontrado != caractere:
+            raise ValueError(f"JSON inválido: esperado {caractere!r}, encontrado {encontrado!r}")
+        self.pos += 1
+    
+    def _fim_valor(self) -> Optional[int]:
+        """
+        Continua a varredura do valor que começa em pos
+        
+        Returns:
+            Posição logo após o valor, ou None se ele ainda não está completo no buffer
+        """
+        buffer = self.buffer
+        if buffer[self.pos] not in '{["':
+            # Escalar (número, true, false, null): termina no próximo delimitador;
+            # no fim do bloco pode continuar no seguinte, a menos que o arquivo tenha acabado
+            encontrado = _FIM_ESCALAR.search(buffer, self.pos)
+            if encontrado is not None:
+                return encontrado.start()
+            return len(buffer) if self.fim else None
+        
+        relativa, profundidade, em_string = self._varredura
+        i = self.pos + relativa
+        while True:
+            if em_string:
+                encontrado = _STRING.search(buffer, i)
+                if encontrado is None:
+                    i = len(buffer)
+                    break
+                if encontrado.group() == '\\':
+                    if encontrado.end() >= len(buffer):
+                        # O caractere escapado está no próximo bloco
+                        i = encontrado.start()
+                        break
+                    i = encontrado.end() + 1
+                    continue
+                em_string = False
+                i = encontrado.end()
+                if profundidade == 0:
+                    return i
+            else:
+                encontrado = _ESTRUTURA.search(buffer, i)
+                if encontrado is None:
+                    i = len(buffer)
+                    break
+                i = encontrado.end()
+                caractere = encontrado.group()
+                if caractere == '"':
+                    em_string = True
+                elif caractere in '[{':
+                    profundidade += 1
+                else:
+                    profundidade -= 1
+                    if profundidade <= 0:
+                        return i
+        
+        self._varredura = (i - self.pos, profundidade, em_string)
+        return None
+    
+    def _delimitar(self) -> int:
+        """Lê blocos até o próximo valor estar completo e retorna a posição logo após ele"""
+        if not self.proximo():
+            raise ValueError("JSON inválido: fim inesperado do arquivo")
+        self._varredura = (0, 0, False)
+        while True:
+            fim = self._fim_valor()
+            if fim is not None:
+                return fim
+            if not self.ler_mais():
+                fim = self._fim_valor()
+                if fim is None:
+                    raise ValueError("JSON inválido: fim inesperado do arquivo")
+                return fim
+    
+    def valor(self) -> Any:
+        """Decodifica o próximo valor, uma única vez e só depois de completo"""
+        fim = self._delimitar()
+        valor, final = self.decoder.raw_decode(self.buffer, self.pos)
+        if final != fim:
+            raise ValueError(f"JSON inválido: conteúdo inesperado após o valor: {self.buffer[final:fim + 1]!r}")
+        self.pos = fim
+        return valor
+    
+    def pular(self):
+        """Avança sobre o próximo valor sem decodificá-lo"""
+        self.pos = self._delimitar()
+    
+    def itens_array(self, decodificar: bool = True) -> Iterator[Any]:
+        """Decodifica um array item a item (ou só avança sobre os itens, gerando None)"""
+        self.esperar('[')
+        if self.proximo() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.valor() if decodificar else self.pular()
+            if self.proximo() == ',':
+                self.pos += 1
+            else:
+                self.esperar(']')
+                return
+
+def iter_itens(arquivo: Union[str, Path], chave: str, encoding: str = 'utf-8',
+               tamanho_bloco: int = TAMANHO_BLOCO) -> Iterator[Any]:
+    """
+    Percorre os itens de um array do objeto raiz sem carregar o arquivo inteiro
+    
+    A memória usada fica limitada ao maior item, não ao tamanho do arquivo.
+    As demais chaves são puladas item a item, sem decodificar os valores.
+    
+    Args:
+        arquivo: Caminho do arquivo JSON (objeto na raiz)
+        chave: Chave do array a percorrer (ex. 'rodadas')
+        encoding: Encoding do arquivo
+        tamanho_bloco: Caracteres lidos por vez
+        
+    Yields:
+        Itens do array, já decodificados
+        
+    Raises:
+        ValueError: Se o JSON for inválido
+    """
+    with open(arquivo, 'r', encoding=encoding) as f:
+        leitor = _LeitorIncremental(f, tamanho_bloco)
+        leitor.esperar('{')
+        if leitor.proximo() == '}':
+            return
+        while True:
+            nome = leitor.valor()
+            leitor.esperar(':')
+            if leitor.proximo() == '[':
+                if nome == chave:
+                    yield from leitor.itens_array()
+                    return
+                for _ in leitor.itens_array(decodificar=False):
+                    pass
+            else:
+                leitor.pular()
+            if leitor.proximo() == ',':
+                leitor.pos += 1
+            else:
+                leitor.esperar('}')
+                return
@@ -0,0 +1,268 @@
+"""
+Simulação Monte Carlo do restante de uma temporada do Brasileirão
+Estima probabilidades de título, acesso, rebaixamento e posição final (requer numpy)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - numpy é uma dependência opcional
+    raise ImportError("SimuladorTemporada requer numpy, que é opcional: pip install numpy") from e
+from .arrays import ArraysTemporada
+from .classificacao import MotorClassificacao
+
+# Placar máximo por time considerado no sorteio; a cauda é somada a ele
+MAX_GOLS = 7
+
+# Resolução do sorteio: cada partida usa uma tabela de 2**14 quantis do placar
+# (cabe no cache; placares com probabilidade < 1/16384 podem não ser sorteados)
+BITS_SORTEIO = 14
+
+# Pesos da chave de ordenação (pontos, vitórias, saldo, gols pró); cada
+# componente cabe no intervalo deixado pelo peso seguinte e a chave é exata em float64
+_PESO_GOLS_PRO = 1.0
+_PESO_SALDO = 2.0 ** 9
+_PESO_VITORIAS = 2.0 ** 20
+_PESO_PONTOS = 2.0 ** 27
+
+class ResultadoSimulacao:
+    """Contagem de posições finais por time ao longo das temporadas simuladas"""
+    
+    def __init__(self, times: Tuple[str, ...], contagem_posicoes: np.ndarray, n_temporadas: int,
+                 acesso: int, rebaixamento: int):
+        """
+        Args:
+            times: Nomes dos times, indexados pelo id
+            contagem_posicoes: Matriz (n_times, n_times): temporadas em que o
+                               time i terminou na posição j + 1
+            n_temporadas: Número de temporadas simuladas
+            acesso: Tamanho da zona de acesso (G4)
+            rebaixamento: Tamanho da zona de rebaixamento (Z4)
+        """
+        self.times = times
+        self.contagem_posicoes = contagem_posicoes
+        self.n_temporadas = n_temporadas
+        self.acesso = acesso
+        self.rebaixamento = rebaixamento
+    
+    @property
+    def probabilidades_posicao(self) -> np.ndarray:
+        """Matriz (n_times, n_times) com a probabilidade de cada posição final"""
+        return self.contagem_posicoes / max(self.n_temporadas, 1)
+    
+    @property
+    def titulo(self) -> np.ndarray:
+        """Probabilidade de título por time"""
+        return self.probabilidades_posicao[:, 0]
+    
+    @property
+    def probabilidade_acesso(self) -> np.ndarray:
+        """Probabilidade de terminar no G4 (acesso na Série B)"""
+        return self.probabilidades_posicao[:, :self.acesso].sum(axis=1)
+    
+    @property
+    def probabilidade_rebaixamento(self) -> np.ndarray:
+        """Probabilidade de terminar na zona de rebaixamento"""
+        return self.probabilidades_posicao[:, -self.rebaixamento:].sum(axis=1)
+    
+    def por_time(self) -> Dict[str, Dict]:
+        """
+        Probabilidades por nome de time, ordenadas pela posição média
+        
+        Returns:
+            Dicionário {time: {'titulo', 'acesso', 'rebaixamento', 'posicao_media', 'posicoes'}}
+        """
+        probabilidades = self.probabilidades_posicao
+        posicao_media = probabilidades @ np.arange(1, len(self.times) + 1)
+        titulo, acesso, rebaixamento = self.titulo, self.probabilidade_acesso, self.probabilidade_rebaixamento
+        
+        return {
+            self.times[i]: {
+                'titulo': float(titulo[i]),
+                'acesso': float(acesso[i]),
+                'rebaixamento': float(rebaixamento[i]),
+                'posicao_media': float(posicao_media[i]),
+                'posicoes': probabilidades[i].tolist()
+            }
+            for i in np.argsort(posicao_media, kind='stable')
+        }
+
+class SimuladorTemporada:
+    """
+    Simula as partidas restantes e acumula a classificação final
+    
+    Os gols de cada time seguem uma Poisson com força de ataque e defesa
+    estimadas pelos jogos já disputados (com mando de campo). O placar de
+    cada partida é sorteado em uma tabela de quantis pré-calculada e os
+    critérios de classificação (pontos, vitórias, saldo e gols pró) são
+    codificados em uma única chave, somada por time com um produto
+    matricial. O confronto direto não é simulado. As temporadas são
+    divididas entre processos.
+    """
+    
+    def __init__(self, arrays: ArraysTemporada, acesso: int = 4, rebaixamento: int = 4,
+                 jogos_prior: float = 5.0):
+        """
+        Prepara as taxas de gols das partidas restantes
+        
+        Args:
+            arrays: Partidas da temporada (as sem placar são simuladas)
+            acesso: Tamanho do G4 (acesso na Série B; Libertadores na Série A)
+            rebaixamento: Tamanho da zona de rebaixamento
+            jogos_prior: Jogos "médios" somados a cada time ao estimar as forças,
+                         para que poucos jogos não gerem taxas extremas
+        """
+        self.arrays = arrays
+        self.acesso = acesso
+        self.rebaixamento = rebaixamento
+        self.restantes = arrays.restantes()
+        self.taxa_casa, self.taxa_fora = self._estimar_taxas(jogos_prior)
+        
+        atual = MotorClassificacao(arrays).calcular()
+        # Último critério: ordem alfabética, como em MotorClassificacao (a fração
+        # < 1 somada pelo rank do nome não altera os demais critérios)
+        rank_nomes = np.argsort(np.argsort(np.array(arrays.times, dtype=object)))
+        self.chave_atual = (_chave(atual.pontos, atual.vitorias, atual.saldo_gols, atual.gols_pro)
+                            + (arrays.n_times - rank_nomes) / (arrays.n_times + 1))
+    
+    def _estimar_taxas(self, jogos_prior: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Gols esperados do mandante e do visitante em cada partida restante"""
+        a = self.arrays
+        jogada = a.jogada
+        n_times = a.n_times
+        
+        # Sem jogos (ou sem gols) usa médias típicas do campeonato
+        media_casa = a.gols_casa[jogada].mean() if jogada.any() else 1.3
+        media_fora = a.gols_fora[jogada].mean() if jogada.any() else 1.0
+        media_casa, media_fora = max(media_casa, 0.1), max(media_fora, 0.1)
+        
+        def forca(ids: np.ndarray, gols: np.ndarray, media: float) -> np.ndarray:
+            """Razão entre os gols do time e a média, puxada para 1 por jogos_prior"""
+            soma = np.bincount(ids[jogada], weights=gols[jogada], minlength=n_times)
+            jogos = np.bincount(ids[jogada], minlength=n_times)
+            return (soma + jogos_prior * media) / ((jogos + jogos_prior) * media)
+        
+        ataque_casa = forca(a.casa, a.gols_casa, media_casa)
+        defesa_casa = forca(a.casa, a.gols_fora, media_fora)
+        ataque_fora = forca(a.fora, a.gols_fora, media_fora)
+        defesa_fora = forca(a.fora, a.gols_casa, media_casa)
+        
+        casa, fora = a.casa[self.restantes], a.fora[self.restantes]
+        return (media_casa * ataque_casa[casa] * defesa_fora[fora],
+                media_fora * ataque_fora[fora] * defesa_casa[casa])
+    
+    def simular(self, n_temporadas: int = 100_000, workers: Optional[int] = None,
+                semente: Optional[int] = None, tamanho_lote: int = 20_000) -> ResultadoSimulacao:
+        """
+        Simula o restante da temporada várias vezes
+        
+        Args:
+            n_temporadas: Número de temporadas simuladas
+            workers: Processos usados (None usa todos os núcleos; 1 roda no processo atual)
+            semente: Semente para resultados reproduzíveis
+            tamanho_lote: Temporadas por lote vetorizado (limita a memória)
+            
+        Returns:
+            ResultadoSimulacao com a contagem de posições finais
+        """
+        workers = workers or os.cpu_count() or 1
+        workers = max(1, min(workers, n_temporadas))
+        
+        parametros = (
+            self.taxa_casa, self.taxa_fora, self.arrays.casa[self.restantes],
+            self.arrays.fora[self.restantes], self.chave_atual, tamanho_lote
+        )
+        sementes = np.random.SeedSequence(semente).spawn(workers)
+        tamanhos = [n_temporadas // workers + (i < n_temporadas % workers) for i in range(workers)]
+        
+        if workers == 1:
+            contagens = [_simular_temporadas(parametros, sementes[0], n_temporadas)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                contagens = list(executor.map(
+                    _simular_temporadas, [parametros] * workers, sementes, tamanhos
+                ))
+        
+        return ResultadoSimulacao(
+            self.arrays.times, sum(contagens), n_temporadas, self.acesso, self.rebaixamento
+        )
+
+def _chave(pontos: np.ndarray, vitorias: np.ndarray, saldo: np.ndarray, gols_pro: np.ndarray) -> np.ndarray:
+    """Chave numérica cuja ordem decrescente é a ordem da tabela"""
+    return (pontos * _PESO_PONTOS + vitorias * _PESO_VITORIAS + saldo * _PESO_SALDO
+            + gols_pro * _PESO_GOLS_PRO).astype(np.float64)
+
+def _tabela_placares(taxa_casa: np.ndarray, taxa_fora: np.ndarray) -> np.ndarray:
+    """
+    Tabela (n_partidas, 2**BITS_SORTEIO) do índice do placar para cada quantil
+    
+    O índice codifica gols_casa * (MAX_GOLS + 1) + gols_fora.
+    """
+    gols = np.arange(MAX_GOLS + 1)
+    fatoriais = np.cumprod(np.maximum(gols, 1))
+    
+    def poisson(taxas: np.ndarray) -> np.ndarray:
+        probabilidades = np.exp(-taxas)[:, None] * taxas[:, None] ** gols / fatoriais
+        probabilidades[:, -1] += 1 - probabilidades.sum(axis=1)  # cauda no placar máximo
+        return probabilidades
+    
+    conjunta = poisson(taxa_casa)[:, :, None] * poisson(taxa_fora)[:, None, :]
+    acumulada = np.cumsum(conjunta.reshape(len(taxa_casa), (MAX_GOLS + 1) ** 2), axis=1)
+    quantis = (np.arange(2 ** BITS_SORTEIO) + 0.5) / 2 ** BITS_SORTEIO
+    
+    tabela = np.empty((len(taxa_casa), len(quantis)), dtype=np.uint8)
+    for i, linha in enumerate(acumulada):
+        tabela[i] = np.minimum(np.searchsorted(linha, quantis), linha.size - 1)
+    return tabela
+
+def _simular_temporadas(parametros: Tuple, semente: np.random.SeedSequence, n_temporadas: int) -> np.ndarray:
+    """
+    Simula temporadas em lotes e conta as posições finais (roda em um processo do pool)
+    
+    Returns:
+        Matriz (n_times, n_times) de contagens
+    """
+    taxa_casa, taxa_fora, casa, fora, chave_atual, tamanho_lote = parametros
+    n_times = len(chave_atual)
+    n_partidas = len(casa)
+    contagem = np.zeros(n_times * n_times, dtype=np.int64)
+    rng = np.random.default_rng(semente)
+    
+    # Chave somada ao mandante e ao visitante para cada placar
+    placar_casa, placar_fora = np.divmod(np.arange((MAX_GOLS + 1) ** 2), MAX_GOLS + 1)
+    pontos_casa = np.select([placar_casa > placar_fora, placar_casa == placar_fora], [3, 1], 0)
+    pontos_fora = np.select([placar_fora > placar_casa, placar_casa == placar_fora], [3, 1], 0)
+    chave_placar = np.stack([
+        _chave(pontos_casa, pontos_casa == 3, placar_casa - placar_fora, placar_casa),
+        _chave(pontos_fora, pontos_fora == 3, placar_fora - placar_casa, placar_fora)
+    ], axis=1)
+    
+    # Coluna 2i é o mandante da partida i e 2i + 1 o visitante; o produto pela
+    # matriz de incidência soma a chave de cada time em todas as suas partidas
+    incidencia = np.zeros((2 * n_partidas, n_times))
+    incidencia[2 * np.arange(n_partidas), casa] = 1
+    incidencia[2 * np.arange(n_partidas) + 1, fora] = 1
+    
+    tabela = _tabela_placares(taxa_casa, taxa_fora).ravel()
+    deslocamento = np.arange(n_partidas, dtype=np.int32) << BITS_SORTEIO
+    
+    posicoes = np.arange(n_times)
+    
+    restantes = n_temporadas
+    while restantes > 0:
+        lote = min(tamanho_lote, restantes)
+        restantes -= lote
+        
+        quantis = rng.integers(0, 2 ** BITS_SORTEIO, size=(lote, n_partidas), dtype=np.int32)
+        quantis += deslocamento
+        placares = tabela.take(quantis)
+        chaves = chave_placar.take(placares, axis=0).reshape(lote, 2 * n_partidas) @ incidencia
+        chaves += chave_atual
+        
+        # ordem[:, p] é o id do time na posição p + 1
+        ordem = np.argsort(-chaves, axis=1)
+        contagem += np.bincount((ordem * n_times + posicoes).ravel(), minlength=n_times * n_times)
+    
+    return contagem.reshape(n_times, n_times)
@@ -0,0 +1,172 @@
+"""
+Consultas sobre uma temporada do Brasileirão
+Respostas por hash e busca binária sobre índices montados uma única vez
+"""
+
+from bisect import bisect_left
+from datetime import date, datetime, time as hora
+from typing import Dict, List, Optional, Tuple, Union
+from .indice import IndiceTemporada, PartidaQualquer
+from .models import DadosBrasileirao, DadosBrasileiraoDict, Rodada, RodadaTipada, Time, TimeTipado
+from .utils import DataConverter, FUSO_BRASILIA
+
+class Temporada:
+    """
+    Consultas de uma temporada: partidas por time, confrontos, rodadas,
+    próximos jogos, jogos por período e posições na tabela
+    
+    Todos os índices são montados no construtor; as consultas custam O(1)
+    ou O(log n) mais o tamanho da resposta.
+    """
+    
+    def __init__(self, dados: DadosBrasileirao):
+        """
+        Monta os índices da temporada
+        
+        Args:
+            dados: Tabela e rodadas (modelos de texto ou tipados)
+        """
+        self.dados = dados
+        rodadas = dados.rodadas or []
+        self.indice = IndiceTemporada(rodadas)
+        
+        self._rodadas: Dict[int, Union[Rodada, RodadaTipada]] = {}
+        for posicao, rodada in enumerate(rodadas, 1):
+            if isinstance(rodada, RodadaTipada):
+                numero = rodada.numero
+            else:
+                numero = DataConverter.numero_rodada(rodada.rodada) or posicao
+            self._rodadas[numero] = rodada
+        
+        self._times: Dict[str, Union[Time, TimeTipado]] = {time.nome: time for time in dados.tabela.times}
+        self._posicoes: Dict[str, int] = {
+            time.nome: DataConverter.para_inteiro(str(time.posicao)) for time in dados.tabela.times
+        }
+        
+        # (id mandante, id visitante) -> índices das partidas, na ordem das rodadas
+        self._confrontos: Dict[Tuple[int, int], List[int]] = {}
+        for i, chave in enumerate(zip(self.indice.casa, self.indice.fora)):
+            self._confrontos.setdefault(chave, []).append(i)
+        
+        # Por time: partidas com horário ordenadas, e as ainda sem placar
+        # (primeiro as com horário, em ordem de data; depois as sem, na ordem das rodadas)
+        self._datas_time: List[List[datetime]] = [[] for _ in self.indice.times]
+        self._indices_datados_time: List[List[int]] = [[] for _ in self.indice.times]
+        self._pendentes_time: List[List[int]] = [[] for _ in self.indice.times]
+        for i in self.indice.por_data:
+            for id_time in (self.indice.casa[i], self.indice.fora[i]):
+                self._datas_time[id_time].append(self.indice.data[i])
+                self._indices_datados_time[id_time].append(i)
+                if not self._jogada(self.indice.partidas[i]):
+                    self._pendentes_time[id_time].append(i)
+        for id_time, indices in enumerate(self.indice.por_time):
+            self._pendentes_time[id_time].extend(
+                i for i in indices
+                if self.indice.data[i] is None and not self._jogada(self.indice.partidas[i])
+            )
+    
+    @classmethod
+    def de_dict(cls, dados: DadosBrasileiraoDict) -> 'Temporada':
+        """Monta a temporada a partir do dicionário salvo em JSON"""
+        return cls(DataConverter.dados_brasileirao_from_dict(dados))
+    
+    @staticmethod
+    def _jogada(partida: PartidaQualquer) -> bool:
+        """Se a partida já tem placar"""
+        return partida.gols_casa not in ('', None) and partida.gols_fora not in ('', None)
+    
+    def partidas_do_time(self, nome: str, mando: Optional[str] = None) -> List[PartidaQualquer]:
+        """
+        Partidas de um time, na ordem das rodadas
+        
+        Args:
+            nome: Nome exato do time
+            mando: 'casa' ou 'fora' para só um lado (None para todas)
+            
+        Returns:
+            Lista de partidas ([] se o time não estiver na temporada)
+        """
+        if nome not in self.indice.ids_times:
+            return []
+        return self.indice.partidas_do_time(nome, mando)
+    
+    def confronto(self, time_a: str, time_b: str) -> List[PartidaQualquer]:
+        """
+        Partidas entre dois times: primeiro com time_a mandante, depois time_b
+        
+        Args:
+            time_a: Nome exato de um time
+            time_b: Nome exato do outro time
+            
+        Returns:
+            Partidas com time_a mandante e depois com time_b, cada grupo na
+            ordem das rodadas (turno e returno, mais jogos extras se houver)
+        """
+        ids = self.indice.ids_times
+        if time_a not in ids or time_b not in ids:
+            return []
+        a, b = ids[time_a], ids[time_b]
+        return [self.indice.partidas[i]
+                for chave in ((a, b), (b, a)) for i in self._confrontos.get(chave, [])]
+    
+    def rodada(self, numero: int) -> Optional[Union[Rodada, RodadaTipada]]:
+        """Rodada pelo número (1 a 38), ou None se não existir"""
+        return self._rodadas.get(numero)
+    
+    def proximos_jogos(self, nome: str, k: int = 5,
+                       agora: Optional[datetime] = None) -> List[PartidaQualquer]:
+        """
+        Próximas partidas de um time
+        
+        Args:
+            nome: Nome exato do time
+            k: Número máximo de partidas
+            agora: Horário de referência (com fuso); se None, devolve as
+                   partidas ainda sem placar: as com horário em ordem de data
+                   e, depois delas, as ainda sem data na ordem das rodadas
+                   
+        Returns:
+            Até k partidas; com agora, as que começam a partir dele, em ordem
+            cronológica
+        """
+        id_time = self.indice.ids_times.get(nome)
+        if id_time is None:
+            return []
+        
+        if agora is None:
+            indices = self._pendentes_time[id_time][:k]
+        else:
+            inicio = bisect_left(self._datas_time[id_time], self._com_fuso(agora))
+            indices = self._indices_datados_time[id_time][inicio:inicio + k]
+        return [self.indice.partidas[i] for i in indices]
+    
+    def jogos_entre(self, data_ini: Union[date, datetime],
+                    data_fim: Union[date, datetime]) -> List[PartidaQualquer]:
+        """
+        Partidas com início no período, em ordem cronológica
+        
+        Args:
+            data_ini: Início (date conta desde 00h00; sem fuso é horário de Brasília)
+            data_fim: Fim, inclusive (date conta até o fim do dia)
+            
+        Returns:
+            Lista de partidas
+        """
+        if not isinstance(data_ini, datetime):
+            data_ini = datetime.combine(data_ini, hora.min)
+        if not isinstance(data_fim, datetime):
+            data_fim = datetime.combine(data_fim, hora.max)
+        return self.indice.partidas_entre(self._com_fuso(data_ini), self._com_fuso(data_fim))
+    
+    def posicao(self, nome: str) -> Optional[int]:
+        """Posição do time na tabela coletada, ou None se não estiver nela"""
+        return self._posicoes.get(nome)
+    
+    def time(self, nome: str) -> Optional[Union[Time, TimeTipado]]:
+        """Linha do time na tabela coletada, ou None se não estiver nela"""
+        return self._times.get(nome)
+    
+    @staticmethod
+    def _com_fuso(momento: datetime) -> datetime:
+        """Interpreta horários sem fuso como horário de Brasília"""
+        return momento if momento.tzinfo is not None else momento.replace(tzinfo=FUSO_BRASILIA)
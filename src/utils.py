@@ -3,62 +3,173 @@ Utilitários para o projeto Brasileirão
 Funções para JSON, formatação e conversões
 """
 
-import json
-from typing import Dict, Any, Union
+import codecs
+import hashlib
+import re
+import sys
+from datetime import datetime, date, time, timedelta, timezone
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 from .models import (
-    Time, Partida, Rodada, TabelaClassificacao, DadosBrasileirao,
+    Time, Partida, Rodada, TabelaClassificacao, DadosBrasileirao, TimeTipado, PartidaTipada, RodadaTipada,
     TimeDict, PartidaDict, RodadaDict, TabelaDict, DadosBrasileiraoDict
 )
+from .serializacao import codificar, decodificar, gravar_atomico, iter_itens
+
+# Horário de Brasília (sem horário de verão desde 2019), usado pelas páginas da TRRSF
+FUSO_BRASILIA = timezone(timedelta(hours=-3))
+
+# Duração provável de uma partida, com intervalo e acréscimos
+DURACAO_PARTIDA = timedelta(minutes=130)
+
+_DATA_PARTIDA = re.compile(r'(\d{1,2})/(\d{1,2})(?:\s+(\d{1,2})h(\d{2})?)?')
+
+_NUMERO_RODADA = re.compile(r'\d+')
+
+# Campos de Partida repetidos entre partidas e coletas, internados ao carregar
+_CAMPOS_INTERNADOS = frozenset(('partida', 'local', 'time_casa', 'time_fora', 'resultado_texto'))
 
 class JSONUtils:
     """Utilitários para manipulação de JSON"""
     
     @staticmethod
-    def save_to_json(data: Union[Dict, Any], filename: str, encoding: str = 'utf-8') -> bool:
+    def save_to_json(data: Union[Dict, Any], filename: str, encoding: str = 'utf-8',
+                     compacto: Optional[bool] = None, backend: Optional[str] = None) -> bool:
         """
         Salva dados em um arquivo JSON
         
+        A gravação é atômica: o arquivo anterior só é substituído depois que o
+        novo conteúdo está inteiro em disco.
+        
         Args:
             data: Dados a serem salvos
             filename: Nome do arquivo
             encoding: Encoding do arquivo
+            compacto: Se True, grava sem indentação; se None, usa JSON_CONFIG['compacto']
+            backend: Backend JSON ('auto', 'orjson', 'ujson' ou 'json'); se None, usa JSON_CONFIG
             
         Returns:
             True se salvou com sucesso, False caso contrário
         """
         try:
-            with open(filename, 'w', encoding=encoding) as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            conteudo = codificar(data, compacto, backend)
+            if codecs.lookup(encoding).name != 'utf-8':
+                conteudo = conteudo.decode('utf-8').encode(encoding)
+            gravar_atomico(filename, conteudo)
             return True
         except Exception as e:
             print(f"Erro ao salvar arquivo JSON: {str(e)}")
             return False
     
     @staticmethod
-    def load_from_json(filename: str, encoding: str = 'utf-8') -> Union[Dict, None]:
+    def salvar_e_informar(data: Union[Dict, Any], filename: str, compacto: Optional[bool] = None) -> bool:
         """
-        Carrega dados de um arquivo JSON
+        Salva dados em JSON (ver save_to_json) e informa o resultado no console
+        
+        Usado por Brasileirao.salvar_json e AsyncBrasileirao.salvar_json.
+        
+        Args:
+            data: Dados a serem salvos
+            filename: Nome do arquivo
+            compacto: Se True, grava sem indentação; se None, usa JSON_CONFIG['compacto']
+            
+        Returns:
+            True se salvou com sucesso, False caso contrário
+        """
+        if JSONUtils.save_to_json(data, filename, compacto=compacto):
+            print(f"Dados salvos em: {filename}")
+            return True
+        else:
+            print(f"Erro ao salvar arquivo: {filename}")
+            return False
+    
+    @staticmethod
+    def load_from_json(filename: str, encoding: str = 'utf-8', backend: Optional[str] = None) -> Union[Dict, None]:
+        """
+        Carrega dados de um arquivo JSON (indentado ou compacto)
         
         Args:
             filename: Nome do arquivo
             encoding: Encoding do arquivo
+            backend: Backend JSON ('auto', 'orjson', 'ujson' ou 'json'); se None, usa JSON_CONFIG
             
         Returns:
             Dados carregados ou None em caso de erro
         """
         try:
-            with open(filename, 'r', encoding=encoding) as f:
-                return json.load(f)
+            with open(filename, 'rb') as f:
+                conteudo = f.read()
+            if codecs.lookup(encoding).name != 'utf-8':
+                conteudo = conteudo.decode(encoding)
+            return decodificar(conteudo, backend)
         except Exception as e:
             print(f"Erro ao carregar arquivo JSON: {str(e)}")
             return None
+    
+    @staticmethod
+    def iter_from_json(filename: str, chave: str, encoding: str = 'utf-8') -> Iterator[Any]:
+        """
+        Percorre os itens de um array do arquivo sem carregá-lo inteiro
+        
+        Args:
+            filename: Nome do arquivo (objeto JSON na raiz)
+            chave: Chave do array (ex. 'tabela' ou 'rodadas')
+            encoding: Encoding do arquivo
+            
+        Yields:
+            Itens do array, um por vez
+            
+        Raises:
+            Exception: Se o arquivo não puder ser lido ou o JSON for inválido
+        """
+        try:
+            yield from iter_itens(filename, chave, encoding)
+        except (OSError, ValueError) as e:
+            raise Exception(f"Erro ao ler arquivo JSON: {str(e)}")
+    
+    @staticmethod
+    def iter_rodadas(filename: str, tipado: bool = False,
+                     encoding: str = 'utf-8') -> Iterator[Union[Rodada, RodadaTipada]]:
+        """
+        Lê as rodadas de um snapshot uma a uma, com memória limitada a uma rodada
+        
+        Args:
+            filename: Arquivo salvo por salvar_json (com a chave 'rodadas')
+            tipado: Se True, gera RodadaTipada
+            encoding: Encoding do arquivo
+            
+        Yields:
+            Rodada (ou RodadaTipada) na ordem do arquivo
+        """
+        for dados in JSONUtils.iter_from_json(filename, 'rodadas', encoding):
+            rodada = DataConverter.rodada_from_dict(dados)
+            yield DataConverter.rodada_tipada(rodada) if tipado else rodada
+    
+    @staticmethod
+    def iter_partidas(filename: str, tipado: bool = False,
+                      encoding: str = 'utf-8') -> Iterator[Tuple[int, Union[Partida, PartidaTipada]]]:
+        """
+        Lê as partidas de um snapshot uma rodada por vez
+        
+        Args:
+            filename: Arquivo salvo por salvar_json (com a chave 'rodadas')
+            tipado: Se True, gera PartidaTipada
+            encoding: Encoding do arquivo
+            
+        Yields:
+            Tuplas (número da rodada, partida) na ordem do arquivo
+        """
+        for posicao, rodada in enumerate(JSONUtils.iter_rodadas(filename, tipado, encoding), 1):
+            numero = rodada.numero if tipado else DataConverter.numero_rodada(rodada.rodada) or posicao
+            yield from ((numero, partida) for partida in rodada.partidas)
 
 class DataConverter:
     """Conversor entre modelos e dicionários"""
     
     @staticmethod
-    def time_to_dict(time: Time) -> TimeDict:
-        """Converte modelo Time para dicionário"""
+    def time_to_dict(time: Union[Time, TimeTipado]) -> TimeDict:
+        """Converte modelo Time (ou TimeTipado) para dicionário"""
+        if isinstance(time, TimeTipado):
+            return DataConverter._time_tipado_to_dict(time)
         return {
             'nome': time.nome,
             'escudo': time.escudo,
@@ -75,8 +186,10 @@ class DataConverter:
         }
     
     @staticmethod
-    def partida_to_dict(partida: Partida) -> PartidaDict:
-        """Converte modelo Partida para dicionário"""
+    def partida_to_dict(partida: Union[Partida, PartidaTipada]) -> PartidaDict:
+        """Converte modelo Partida (ou PartidaTipada) para dicionário"""
+        if isinstance(partida, PartidaTipada):
+            return DataConverter._partida_tipada_to_dict(partida)
         return {
             'partida': partida.partida,
             'data': partida.data,
@@ -89,15 +202,35 @@ class DataConverter:
         }
     
     @staticmethod
-    def rodada_to_dict(rodada: Rodada) -> RodadaDict:
-        """Converte modelo Rodada para dicionário"""
+    def rodada_to_dict(rodada: Union[Rodada, RodadaTipada]) -> RodadaDict:
+        """Converte modelo Rodada (ou RodadaTipada) para dicionário"""
+        inicio = rodada.inicio
+        if isinstance(rodada, RodadaTipada):
+            inicio = inicio.strftime('%d/%m/%Y') if inicio is not None else ''
         return {
             'rodada': rodada.rodada,
-            'inicio': rodada.inicio,
+            'inicio': inicio,
             'rodada_atual': rodada.rodada_atual,
             'partidas': [DataConverter.partida_to_dict(p) for p in rodada.partidas]
         }
     
+    @staticmethod
+    def impressao_rodada(rodada: Union[Rodada, RodadaTipada]) -> str:
+        """
+        Impressão digital do conteúdo de uma rodada
+        
+        Rodada e RodadaTipada com o mesmo conteúdo têm a mesma impressão,
+        então snapshots de texto e tipados podem ser comparados por ela.
+        
+        Args:
+            rodada: Rodada de texto ou tipada
+            
+        Returns:
+            Hash hexadecimal do conteúdo
+        """
+        conteudo = repr(DataConverter.rodada_to_dict(rodada)).encode('utf-8')
+        return hashlib.blake2b(conteudo, digest_size=16).hexdigest()
+    
     @staticmethod
     def tabela_to_dict(tabela: TabelaClassificacao) -> TabelaDict:
         """Converte modelo TabelaClassificacao para dicionário"""
@@ -114,6 +247,179 @@ class DataConverter:
             resultado['rodadas'] = [DataConverter.rodada_to_dict(r) for r in dados.rodadas]
         
         return resultado
+    
+    @staticmethod
+    def time_from_dict(dados: TimeDict) -> Time:
+        """Converte dicionário em modelo Time"""
+        return Time(**{campo: dados[campo] for campo in Time.__dataclass_fields__})
+    
+    @staticmethod
+    def partida_from_dict(dados: PartidaDict) -> Partida:
+        """Converte dicionário em modelo Partida (nomes, local e textos internados)"""
+        return Partida(**{
+            campo: sys.intern(dados[campo]) if campo in _CAMPOS_INTERNADOS else dados[campo]
+            for campo in Partida.__dataclass_fields__
+        })
+    
+    @staticmethod
+    def rodada_from_dict(dados: RodadaDict) -> Rodada:
+        """Converte dicionário em modelo Rodada"""
+        return Rodada(
+            rodada=dados['rodada'],
+            inicio=dados['inicio'],
+            rodada_atual=dados['rodada_atual'],
+            partidas=[DataConverter.partida_from_dict(p) for p in dados['partidas']]
+        )
+    
+    @staticmethod
+    def dados_brasileirao_from_dict(dados: DadosBrasileiraoDict) -> DadosBrasileirao:
+        """Converte dicionário (ex. um JSON salvo) em modelo DadosBrasileirao"""
+        rodadas = None
+        if 'rodadas' in dados:
+            rodadas = [DataConverter.rodada_from_dict(r) for r in dados['rodadas']]
+        
+        return DadosBrasileirao(
+            tabela=TabelaClassificacao(times=[DataConverter.time_from_dict(t) for t in dados.get('tabela', [])]),
+            rodadas=rodadas
+        )
+    
+    @staticmethod
+    def _time_tipado_to_dict(time: TimeTipado) -> TimeDict:
+        """Dicionário de strings de um TimeTipado, igual ao de Time"""
+        return {
+            'nome': time.nome,
+            'escudo': time.escudo,
+            'posicao': str(time.posicao),
+            'pontos': str(time.pontos),
+            'jogos': str(time.jogos),
+            'vitorias': str(time.vitorias),
+            'empates': str(time.empates),
+            'derrotas': str(time.derrotas),
+            'gols_pro': str(time.gols_pro),
+            'gols_contra': str(time.gols_contra),
+            'saldo_gols': str(time.saldo_gols),
+            'aproveitamento': f"{time.aproveitamento}%"
+        }
+    
+    @staticmethod
+    def _partida_tipada_to_dict(partida: PartidaTipada) -> PartidaDict:
+        """Dicionário de strings de uma PartidaTipada, igual ao de Partida"""
+        return {
+            'partida': partida.partida,
+            'data': partida.data_texto,
+            'local': partida.local,
+            'time_casa': partida.time_casa,
+            'time_fora': partida.time_fora,
+            'gols_casa': '' if partida.gols_casa is None else str(partida.gols_casa),
+            'gols_fora': '' if partida.gols_fora is None else str(partida.gols_fora),
+            'resultado_texto': partida.resultado_texto
+        }
+    
+    @staticmethod
+    def para_inteiro(texto: str) -> int:
+        """Converte um número da página ('12', '+3', '61%') em int ('' vira 0)"""
+        texto = texto.strip().rstrip('%')
+        return int(texto) if texto else 0
+    
+    @staticmethod
+    def para_gols(texto: str) -> Optional[int]:
+        """Converte o placar de um time em int (None se a partida não aconteceu)"""
+        texto = texto.strip()
+        return int(texto) if texto else None
+    
+    @staticmethod
+    def id_partida(time_casa: str, time_fora: str, rodada: int, temporada: Optional[int] = None,
+                   campeonato: str = '') -> str:
+        """
+        Identidade de uma partida entre coletas, temporadas e campeonatos
+        
+        O confronto sozinho se repete (returno, outras temporadas, copas);
+        campeonato, temporada e rodada o tornam único.
+        
+        Args:
+            time_casa: Mandante
+            time_fora: Visitante
+            rodada: Número da rodada
+            temporada: Ano da temporada (None se desconhecido)
+            campeonato: Chave do campeonato (ex. 'serie_b'; vazio se não houver)
+            
+        Returns:
+            Texto 'campeonato/temporada/rodada/Casa x Fora'
+        """
+        return f"{campeonato}/{temporada if temporada is not None else ''}/{rodada}/{time_casa} x {time_fora}"
+    
+    @staticmethod
+    def numero_rodada(titulo: str) -> Optional[int]:
+        """Número de uma rodada a partir do título ('1ª rodada' -> 1), ou None"""
+        match = _NUMERO_RODADA.search(titulo)
+        return int(match.group()) if match else None
+    
+    @staticmethod
+    def time_tipado(time: Time) -> TimeTipado:
+        """Converte Time em TimeTipado"""
+        return TimeTipado(
+            nome=time.nome,
+            escudo=time.escudo,
+            posicao=DataConverter.para_inteiro(time.posicao),
+            pontos=DataConverter.para_inteiro(time.pontos),
+            jogos=DataConverter.para_inteiro(time.jogos),
+            vitorias=DataConverter.para_inteiro(time.vitorias),
+            empates=DataConverter.para_inteiro(time.empates),
+            derrotas=DataConverter.para_inteiro(time.derrotas),
+            gols_pro=DataConverter.para_inteiro(time.gols_pro),
+            gols_contra=DataConverter.para_inteiro(time.gols_contra),
+            saldo_gols=DataConverter.para_inteiro(time.saldo_gols),
+            aproveitamento=DataConverter.para_inteiro(time.aproveitamento)
+        )
+    
+    @staticmethod
+    def partida_tipada(partida: Partida, inicio_rodada: str) -> PartidaTipada:
+        """Converte Partida em PartidaTipada (o ano da data vem do início da rodada)"""
+        return PartidaTipada(
+            partida=partida.partida,
+            data=DateUtils.parse_data_partida(partida.data, inicio_rodada),
+            data_texto=partida.data,
+            local=partida.local,
+            time_casa=partida.time_casa,
+            time_fora=partida.time_fora,
+            gols_casa=DataConverter.para_gols(partida.gols_casa),
+            gols_fora=DataConverter.para_gols(partida.gols_fora)
+        )
+    
+    @staticmethod
+    def rodada_tipada(rodada: Rodada, numero: Optional[int] = None) -> RodadaTipada:
+        """Converte Rodada em RodadaTipada (numero None lê o número do título, ex. '1ª rodada')"""
+        if numero is None:
+            numero = DataConverter.numero_rodada(rodada.rodada) or 0
+        return RodadaTipada(
+            numero=numero,
+            rodada=rodada.rodada,
+            inicio=DateUtils.parse_inicio_rodada(rodada.inicio),
+            rodada_atual=rodada.rodada_atual,
+            partidas=[DataConverter.partida_tipada(p, rodada.inicio) for p in rodada.partidas]
+        )
+    
+    @staticmethod
+    def dados_tipados(dados: DadosBrasileirao) -> DadosBrasileirao:
+        """
+        Converte os modelos de texto de DadosBrasileirao nos modelos tipados
+        
+        Útil para dados carregados de JSON (ver dados_brasileirao_from_dict).
+        
+        Args:
+            dados: Dados com Time, Rodada e Partida
+            
+        Returns:
+            DadosBrasileirao com TimeTipado, RodadaTipada e PartidaTipada
+        """
+        rodadas = None
+        if dados.rodadas is not None:
+            rodadas = [DataConverter.rodada_tipada(r) for r in dados.rodadas]
+        
+        return DadosBrasileirao(
+            tabela=TabelaClassificacao(times=[DataConverter.time_tipado(t) for t in dados.tabela.times]),
+            rodadas=rodadas
+        )
 
 class FormatUtils:
     """Utilitários para formatação de dados"""
@@ -165,3 +471,134 @@ class FormatUtils:
                 return str(saldo)
         except ValueError:
             return "0"
+
+class DateUtils:
+    """Utilitários para as datas das rodadas e partidas"""
+    
+    @staticmethod
+    def parse_inicio_rodada(inicio: str) -> Optional[date]:
+        """
+        Converte a data de início de uma rodada ('dd/mm/aaaa')
+        
+        Args:
+            inicio: Data no formato da Rodada
+            
+        Returns:
+            Data ou None se o texto for inválido
+        """
+        try:
+            return datetime.strptime(inicio, '%d/%m/%Y').date()
+        except (TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def parse_data_partida(data: str, inicio_rodada: str) -> Optional[datetime]:
+        """
+        Converte o horário de uma partida ('Sex 04/04 19h00') em datetime
+        
+        O ano vem da data de início da rodada; partidas em janeiro de uma
+        rodada iniciada em dezembro ficam no ano seguinte.
+        
+        Args:
+            data: Texto da data da partida
+            inicio_rodada: Data de início da rodada ('dd/mm/aaaa')
+            
+        Returns:
+            Datetime no horário de Brasília, ou None se não houver dia e hora
+        """
+        inicio = DateUtils.parse_inicio_rodada(inicio_rodada)
+        if inicio is None:
+            return None
+        return DateUtils.data_partida_na_rodada(data, inicio)
+    
+    @staticmethod
+    def data_partida_na_rodada(data: str, inicio: date) -> Optional[datetime]:
+        """
+        Como parse_data_partida, com o início da rodada já convertido em date
+        
+        Args:
+            data: Texto da data da partida ('Sex 04/04 19h00')
+            inicio: Data de início da rodada
+            
+        Returns:
+            Datetime no horário de Brasília, ou None se não houver dia e hora
+        """
+        match = _DATA_PARTIDA.search(data or '')
+        if not match or match.group(3) is None:
+            return None
+        
+        dia, mes, hora = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        minuto = int(match.group(4) or 0)
+        ano = inicio.year + 1 if mes < inicio.month - 6 else inicio.year
+        
+        try:
+            return datetime(ano, mes, dia, hora, minuto, tzinfo=FUSO_BRASILIA)
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def partida_encerrada(partida: Union[Partida, PartidaTipada], inicio_rodada: str, agora: datetime) -> bool:
+        """
+        Verifica se uma partida já terminou
+        
+        As páginas não informam o status do jogo; uma partida é considerada
+        encerrada quando tem placar e já passou DURACAO_PARTIDA do início.
+        
+        Args:
+            partida: Partida a verificar
+            inicio_rodada: Data de início da rodada ('dd/mm/aaaa')
+            agora: Horário de referência (com fuso)
+            
+        Returns:
+            True se a partida terminou
+        """
+        if partida.gols_casa in ('', None) or partida.gols_fora in ('', None):
+            return False
+        if isinstance(partida, PartidaTipada):
+            inicio = partida.data
+        else:
+            inicio = DateUtils.parse_data_partida(partida.data, inicio_rodada)
+        return inicio is not None and agora >= inicio + DURACAO_PARTIDA
+    
+    @staticmethod
+    def partidas_em_ordem(rodadas: Iterable[Union[Rodada, RodadaTipada]], agora: Optional[datetime] = None
+                          ) -> Iterator[Tuple[int, Optional[int], Union[Partida, PartidaTipada]]]:
+        """
+        Gera as partidas em ordem cronológica, com o número da rodada e a temporada
+        
+        Jogos adiados entram na data em que foram disputados, não na rodada
+        original; partidas sem horário ficam no início da rodada.
+        
+        Args:
+            rodadas: Rodadas da temporada (de texto ou tipadas)
+            agora: Se informado, gera apenas as partidas já encerradas nesse
+                   horário (ver partida_encerrada)
+                   
+        Yields:
+            (número da rodada, temporada, partida); a temporada é o ano de
+            início da rodada (None se a rodada não tiver data)
+        """
+        partidas: List[Tuple[datetime, int, int, Optional[int], Union[Partida, PartidaTipada]]] = []
+        
+        for posicao, rodada in enumerate(rodadas, 1):
+            if isinstance(rodada, RodadaTipada):
+                numero = rodada.numero
+                texto_inicio = rodada.inicio.strftime('%d/%m/%Y') if rodada.inicio else ''
+            else:
+                numero = DataConverter.numero_rodada(rodada.rodada) or posicao
+                texto_inicio = rodada.inicio
+            inicio = DateUtils.parse_inicio_rodada(texto_inicio)
+            temporada = inicio.year if inicio else None
+            padrao = datetime.combine(inicio or date.max, time(), FUSO_BRASILIA)
+            
+            for partida in rodada.partidas:
+                if agora is not None and not DateUtils.partida_encerrada(partida, texto_inicio, agora):
+                    continue
+                if isinstance(partida, PartidaTipada):
+                    data = partida.data
+                else:
+                    data = DateUtils.parse_data_partida(partida.data, texto_inicio)
+                partidas.append((data or padrao, len(partidas), numero, temporada, partida))
+        
+        for _, _, numero, temporada, partida in sorted(partidas, key=lambda item: item[:2]):
+            yield numero, temporada, partida
@@ -0,0 +1,26 @@
+"""
+Configuração dos testes: torna o projeto importável e expõe os dados coletados
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+RAIZ = Path(__file__).parent.parent
+sys.path.insert(0, str(RAIZ))
+
+DIRETORIO_DADOS = RAIZ / "dados_coletados"
+
+@pytest.fixture(scope='session')
+def dados_serie_b_dict():
+    """Snapshot completo da Série B coletado em 2025-09-09 (dicionário)"""
+    with open(DIRETORIO_DADOS / "2025-09-09" / "serie_b.json", 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+@pytest.fixture
+def dados_serie_b(dados_serie_b_dict):
+    """Mesmo snapshot convertido em DadosBrasileirao (novo a cada teste)"""
+    from src.utils import DataConverter
+    return DataConverter.dados_brasileirao_from_dict(dados_serie_b_dict)
@@ -0,0 +1,122 @@
+"""
+Testes do agendador de coletas (sem rede: o Brasileirao é substituído)
+"""
+
+import copy
+from datetime import datetime
+
+from src.agendador import AgendadorColetas
+from src.diff import ComparadorSnapshots
+from src.utils import DataConverter, FUSO_BRASILIA
+
+class BrasileiraoFalso:
+    """Devolve as rodadas guardadas, filtradas pelo número como a página real"""
+    
+    def __init__(self, dados):
+        self.dados = dados
+        self.pedidos_rodadas = []
+        self.pedidos_tabela = 0
+    
+    def obter_rodadas(self, serie, rodadas=None):
+        self.pedidos_rodadas.append(None if rodadas is None else list(rodadas))
+        return [
+            r for r in self.dados.rodadas
+            if rodadas is None or DataConverter.numero_rodada(r.rodada) in rodadas
+        ]
+    
+    def obter_tabela(self, serie):
+        self.pedidos_tabela += 1
+        return self.dados.tabela
+    
+    def close(self):
+        pass
+
+class Relogio:
+    def __init__(self, agora):
+        self.agora = agora
+    
+    def __call__(self):
+        return self.agora
+
+def _agendador(dados, agora):
+    relogio = Relogio(agora)
+    brasileirao = BrasileiraoFalso(dados)
+    return AgendadorColetas('serie_b', brasileirao=brasileirao, relogio=relogio), brasileirao, relogio
+
+def _encerrar_rodada(rodada):
+    for partida in rodada.partidas:
+        partida.gols_casa, partida.gols_fora = '1', '0'
+
+def test_primeira_coleta_marca_rodadas_encerradas(dados_serie_b):
+    agendador, brasileirao, _ = _agendador(dados_serie_b, datetime(2025, 9, 10, 12, tzinfo=FUSO_BRASILIA))
+    
+    rodadas = agendador.coletar()
+    
+    assert rodadas == dados_serie_b.rodadas
+    assert agendador.encerradas == set(range(1, 26))
+    assert brasileirao.pedidos_rodadas == [None]
+    assert brasileirao.pedidos_tabela == 1
+    assert agendador.total_requisicoes == 2
+
+def test_coletas_seguintes_so_pedem_rodadas_pendentes(dados_serie_b):
+    agendador, brasileirao, relogio = _agendador(dados_serie_b, datetime(2025, 9, 10, 12, tzinfo=FUSO_BRASILIA))
+    agendador.coletar()
+    encerrada = agendador.rodadas[10]
+    
+    agendador.coletar()
+    assert brasileirao.pedidos_rodadas[-1] == list(range(26, 39))
+    # Nada mudou: a tabela não é buscada de novo e as rodadas encerradas não são reprocessadas
+    assert brasileirao.pedidos_tabela == 1
+    assert agendador.rodadas[10] is encerrada
+    
+    _encerrar_rodada(dados_serie_b.rodadas[25])
+    relogio.agora = datetime(2025, 9, 17, 12, tzinfo=FUSO_BRASILIA)
+    agendador.coletar()
+    assert brasileirao.pedidos_tabela == 2
+    assert 26 in agendador.encerradas
+    assert 27 not in agendador.encerradas
+    
+    agendador.coletar()
+    assert brasileirao.pedidos_rodadas[-1] == list(range(27, 39))
+
+def test_sem_pendentes_nao_faz_requisicao(dados_serie_b):
+    for rodada in dados_serie_b.rodadas:
+        _encerrar_rodada(rodada)
+    agendador, brasileirao, _ = _agendador(dados_serie_b, datetime(2026, 1, 1, tzinfo=FUSO_BRASILIA))
+    
+    agendador.coletar()
+    assert agendador.encerradas == set(range(1, 39))
+    requisicoes = agendador.total_requisicoes
+    
+    assert agendador.coletar() == dados_serie_b.rodadas
+    assert agendador.total_requisicoes == requisicoes
+    assert len(brasileirao.pedidos_rodadas) == 1
+
+def test_rodadas_guardadas_pelo_numero_do_titulo(dados_serie_b):
+    agendador, brasileirao, _ = _agendador(dados_serie_b, datetime(2025, 9, 10, 12, tzinfo=FUSO_BRASILIA))
+    agendador.coletar()
+    rodada_26 = agendador.rodadas[26]
+    
+    # A 26ª rodada some da página: as seguintes não podem ocupar o lugar dela
+    dados_serie_b.rodadas = [r for r in dados_serie_b.rodadas if r.rodada != '26ª rodada']
+    agendador.coletar()
+    
+    assert agendador.rodadas[26] is rodada_26
+    assert all(agendador.rodadas[n].rodada == f"{n}ª rodada" for n in range(1, 39))
+
+def test_snapshot_traz_impressoes_das_rodadas(dados_serie_b):
+    agendador, _, relogio = _agendador(dados_serie_b, datetime(2025, 9, 10, 12, tzinfo=FUSO_BRASILIA))
+    agendador.coletar()
+    anterior = agendador.snapshot()
+    
+    # Um novo parsing gera novos objetos para a rodada que mudou
+    rodada = dados_serie_b.rodadas[25] = copy.deepcopy(dados_serie_b.rodadas[25])
+    rodada.partidas[0].gols_casa, rodada.partidas[0].gols_fora = '1', '0'
+    relogio.agora = datetime(2025, 9, 12, 20, tzinfo=FUSO_BRASILIA)
+    agendador.coletar()
+    atual = agendador.snapshot()
+    
+    assert set(atual.impressoes) == set(range(1, 39))
+    assert atual.impressoes[26] != anterior.impressoes[26]
+    eventos = ComparadorSnapshots.comparar(anterior, atual, relogio.agora)
+    assert [type(e).__name__ for e in eventos] == ['GolMarcado']
@@ -0,0 +1,43 @@
+"""
+Testes dos agregados por time
+"""
+
+from src.agregados import AgregadosTimes
+from src.models import Partida
+
+def _partida(casa, fora, gols_casa, gols_fora):
+    return Partida(f"{casa} x {fora}", '', '', casa, fora, str(gols_casa), str(gols_fora), '')
+
+def test_totais_batem_com_a_tabela(dados_serie_b):
+    agregados = AgregadosTimes.de_rodadas(dados_serie_b.rodadas, campeonato='serie_b')
+    for time in dados_serie_b.tabela.times:
+        agregado = agregados[time.nome]
+        assert str(agregado.geral.pontos) == time.pontos
+        assert str(agregado.geral.jogos) == time.jogos
+        assert str(agregado.geral.gols_pro) == time.gols_pro
+        assert agregado.casa.jogos + agregado.fora.jogos == agregado.geral.jogos
+
+def test_mesma_partida_contada_uma_vez():
+    agregados = AgregadosTimes()
+    assert agregados.registrar(_partida('A', 'B', 1, 0), 1, 2025)
+    assert not agregados.registrar(_partida('A', 'B', 1, 0), 1, 2025)
+    assert agregados['A'].geral.jogos == 1
+
+def test_reencontro_em_outra_rodada_ou_temporada_e_contado():
+    agregados = AgregadosTimes(tamanho_forma=3, campeonato='serie_b')
+    assert agregados.registrar(_partida('A', 'B', 1, 0), 1, 2025)
+    assert agregados.registrar(_partida('A', 'B', 2, 0), 20, 2025)
+    assert agregados.registrar(_partida('A', 'B', 0, 0), 1, 2026)
+    assert agregados.registrar(_partida('A', 'B', 0, 1), 1, 2025, campeonato='copa_do_brasil')
+    
+    a = agregados['A']
+    assert a.casa.jogos == 4
+    assert a.adversarios['B'].jogos == 4
+    assert list(a.forma) == ['V', 'E', 'D']
+    assert a.maior_sequencia_vitorias == 2
+    assert a.gols_por_rodada[1] == (1, 1)
+
+def test_partida_sem_placar_ignorada():
+    agregados = AgregadosTimes()
+    assert not agregados.registrar(Partida('A x B', '', '', 'A', 'B', '', '', ''), 1, 2025)
+    assert agregados.times == {}
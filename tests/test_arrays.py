@@ -0,0 +1,78 @@
+"""
+Testes da representação colunar da temporada
+"""
+
+import subprocess
+import sys
+from datetime import timezone
+
+import pytest
+
+from conftest import RAIZ
+
+np = pytest.importorskip('numpy')
+
+from src.arrays import ArraysTemporada  # noqa: E402
+from src.utils import DataConverter, DateUtils  # noqa: E402
+
+def _partidas(dados):
+    for posicao, rodada in enumerate(dados.rodadas, 1):
+        for partida in rodada.partidas:
+            yield DataConverter.numero_rodada(rodada.rodada) or posicao, rodada, partida
+
+def test_ids_seguem_a_tabela(dados_serie_b):
+    arrays = ArraysTemporada.de_dados(dados_serie_b)
+    
+    assert arrays.times == tuple(t.nome for t in dados_serie_b.tabela.times)
+    assert len(arrays) == 380 and arrays.n_times == 20
+    for i, (numero, _, partida) in enumerate(_partidas(dados_serie_b)):
+        assert arrays.times[arrays.casa[i]] == partida.time_casa
+        assert arrays.times[arrays.fora[i]] == partida.time_fora
+        assert arrays.rodada[i] == numero
+    assert arrays.id_time('Remo') == arrays.times.index('Remo')
+    assert arrays.mascara_time('Remo').sum() == 38
+
+def test_placares_e_mascara_de_jogadas(dados_serie_b):
+    arrays = ArraysTemporada.de_dados(dados_serie_b)
+    
+    for i, (_, _, partida) in enumerate(_partidas(dados_serie_b)):
+        jogada = partida.gols_casa != '' and partida.gols_fora != ''
+        assert arrays.jogada[i] == jogada
+        if jogada:
+            assert (arrays.gols_casa[i], arrays.gols_fora[i]) == (int(partida.gols_casa), int(partida.gols_fora))
+        else:
+            assert arrays.gols_casa[i] == 0 and arrays.gols_fora[i] == 0
+    assert list(arrays.restantes()) == [i for i in range(len(arrays)) if not arrays.jogada[i]]
+
+def test_horarios_em_utc(dados_serie_b):
+    arrays = ArraysTemporada.de_dados(dados_serie_b)
+    assert arrays.horario.dtype == np.dtype('datetime64[s]')
+    
+    for i, (_, rodada, partida) in enumerate(_partidas(dados_serie_b)):
+        inicio = DateUtils.parse_data_partida(partida.data, rodada.inicio)
+        if inicio is None:
+            assert np.isnat(arrays.horario[i])
+            continue
+        esperado = np.datetime64(inicio.astimezone(timezone.utc).replace(tzinfo=None), 's')
+        assert arrays.horario[i] == esperado
+    
+    # Volta Redonda x Criciúma, sexta 12/09/2025 19h00 em Brasília = 22h00 UTC
+    i = next(i for i, (n, _, p) in enumerate(_partidas(dados_serie_b)) if n == 26)
+    assert arrays.horario[i] == np.datetime64('2025-09-12T22:00:00')
+
+def test_texto_e_tipado_geram_os_mesmos_arrays(dados_serie_b):
+    texto = ArraysTemporada.de_dados(dados_serie_b)
+    tipado = ArraysTemporada.de_dados(DataConverter.dados_tipados(dados_serie_b))
+    
+    assert texto.times == tipado.times
+    for coluna in ('casa', 'fora', 'gols_casa', 'gols_fora', 'jogada', 'rodada', 'horario'):
+        assert np.array_equal(getattr(texto, coluna), getattr(tipado, coluna)), coluna
+
+def test_sem_numpy_o_erro_explica_a_dependencia():
+    codigo = "import sys; sys.modules['numpy'] = None; import src.arrays"
+    resultado = subprocess.run(
+        [sys.executable, "-c", codigo], cwd=str(RAIZ),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True
+    )
+    assert resultado.returncode != 0
+    assert "pip install numpy" in resultado.stderr
@@ -0,0 +1,54 @@
+"""
+Testes do cliente HTTP assíncrono (sem rede: as requisições são substituídas)
+"""
+
+import asyncio
+import time
+
+from scrapers.async_http_client import AsyncHTTPClient
+
+def _cliente_lento(atraso):
+    cliente = AsyncHTTPClient(max_concorrencia=2)
+    
+    def get_conteudo(url):
+        time.sleep(atraso)
+        return url, 'hash'
+    cliente.http_client.get_conteudo = get_conteudo
+    return cliente
+
+def test_requisicoes_rodam_em_paralelo_no_loop_atual():
+    async def principal():
+        async with _cliente_lento(0.2) as cliente:
+            inicio = time.perf_counter()
+            resultados = await asyncio.gather(cliente.get_conteudo('a'), cliente.get_conteudo('b'))
+            return resultados, time.perf_counter() - inicio
+    
+    resultados, duracao = asyncio.run(principal())
+    assert resultados == [('a', 'hash'), ('b', 'hash')]
+    assert duracao < 0.35
+
+def test_fechar_nao_bloqueia_o_event_loop():
+    async def principal():
+        cliente = _cliente_lento(0.3)
+        marcas = []
+        
+        async def relogio():
+            while True:
+                marcas.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+        
+        pendente = asyncio.ensure_future(cliente.get_conteudo('a'))
+        await asyncio.sleep(0.05)
+        tarefa = asyncio.ensure_future(relogio())
+        inicio = time.perf_counter()
+        async with cliente:
+            pass
+        fim = time.perf_counter()
+        tarefa.cancel()
+        await pendente
+        return [m for m in marcas if inicio < m < fim], fim - inicio
+    
+    marcas_durante, duracao = asyncio.run(principal())
+    # O shutdown esperou a requisição pendente enquanto o loop seguia rodando
+    assert duracao > 0.15
+    assert len(marcas_durante) >= 5
@@ -0,0 +1,86 @@
+"""
+Testes do armazenamento em SQLite
+"""
+
+import copy
+import shutil
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from conftest import DIRETORIO_DADOS
+from src.banco import BancoSQLite
+
+SERIE = 'serie_b'
+
+@pytest.fixture
+def banco():
+    with BancoSQLite() as banco:
+        yield banco
+
+def test_tabela_e_rodadas_ida_e_volta(banco, dados_serie_b):
+    banco.registrar(SERIE, dados_serie_b, datetime(2025, 9, 9, 12))
+    assert banco.tabela(SERIE) == dados_serie_b.tabela
+    assert banco.rodadas(SERIE) == dados_serie_b.rodadas
+    assert banco.rodadas(SERIE, numeros=[25, 26]) == dados_serie_b.rodadas[24:26]
+    assert banco.tabela('serie_a') is None
+    assert banco.tabela(SERIE, date(2025, 9, 8)) is None
+
+def test_registrar_aceita_dicionario(banco, dados_serie_b_dict, dados_serie_b):
+    banco.registrar(SERIE, dados_serie_b_dict, datetime(2025, 9, 9))
+    assert banco.rodadas(SERIE) == dados_serie_b.rodadas
+    with pytest.raises(Exception):
+        banco.registrar(SERIE, dados_serie_b_dict, datetime(2025, 9, 9))
+
+def test_partidas_do_time_por_mando(banco, dados_serie_b):
+    banco.registrar(SERIE, dados_serie_b, datetime(2025, 9, 9))
+    time = dados_serie_b.tabela.times[0].nome
+    esperadas = [
+        (numero, partida)
+        for numero, rodada in enumerate(dados_serie_b.rodadas, start=1)
+        for partida in rodada.partidas
+        if time in (partida.time_casa, partida.time_fora)
+    ]
+    
+    todas = banco.partidas_do_time(SERIE, time)
+    assert todas == esperadas
+    assert len(todas) == 38
+    casa = banco.partidas_do_time(SERIE, time, 'casa')
+    fora = banco.partidas_do_time(SERIE, time, 'fora')
+    assert all(p.time_casa == time for _, p in casa)
+    assert all(p.time_fora == time for _, p in fora)
+    assert sorted(casa + fora, key=lambda item: item[0]) == todas
+    with pytest.raises(ValueError):
+        banco.partidas_do_time(SERIE, time, 'neutro')
+
+def test_historico_time_e_consulta_por_momento(banco, dados_serie_b_dict):
+    segunda = copy.deepcopy(dados_serie_b_dict)
+    segunda['tabela'][0]['pontos'] = '99'
+    nome = segunda['tabela'][0]['nome']
+    banco.registrar(SERIE, dados_serie_b_dict, datetime(2025, 9, 9, 10))
+    banco.registrar(SERIE, segunda, datetime(2025, 9, 10, 10))
+    
+    historico = banco.historico_time(SERIE, nome)
+    assert [momento for momento, _ in historico] == ['2025-09-09T10:00:00', '2025-09-10T10:00:00']
+    assert [t.pontos for _, t in historico] == [dados_serie_b_dict['tabela'][0]['pontos'], '99']
+    assert banco.tabela(SERIE, date(2025, 9, 9)).times[0].pontos != '99'
+    assert banco.tabela(SERIE, '2025-09-10T10:00:00').times[0].pontos == '99'
+
+def test_momento_com_fuso_convertido_para_brasilia(banco, dados_serie_b):
+    # 02:00 UTC do dia 10 ainda é dia 9 em Brasília
+    banco.registrar(SERIE, dados_serie_b, datetime(2025, 9, 10, 2, tzinfo=timezone.utc))
+    assert banco.coletas(SERIE) == ['2025-09-09T23:00:00']
+    assert banco.tabela(SERIE, date(2025, 9, 9)) is not None
+    assert banco.coleta(SERIE, datetime(2025, 9, 10, 1, 59, tzinfo=timezone.utc)) is None
+    assert banco.coleta(SERIE, datetime(2025, 9, 9, 20, tzinfo=timezone(timedelta(hours=-3)))) is None
+
+def test_importar_pastas_ignora_coletas_existentes(banco, tmp_path):
+    for dia in ('2025-09-09', '2025-09-10'):
+        (tmp_path / dia).mkdir()
+        shutil.copy(DIRETORIO_DADOS / '2025-09-09' / 'serie_b.json', tmp_path / dia / 'serie_b.json')
+    (tmp_path / 'outra').mkdir()
+    
+    assert banco.importar_pastas(tmp_path) == 2
+    assert banco.importar_pastas(tmp_path) == 0
+    assert banco.coletas(SERIE) == ['2025-09-09T00:00:00', '2025-09-10T00:00:00']
+    assert banco.coletas('serie_a') == []
@@ -0,0 +1,147 @@
+"""
+Testes da coleta de vários campeonatos e da versão assíncrona (sem rede: as páginas são substituídas)
+"""
+
+import asyncio
+import threading
+
+from src.brasileirao import Brasileirao
+
+def _brasileirao_falso():
+    brasileirao = Brasileirao()
+    recebidos = {}
+    lock = threading.Lock()
+    
+    def obter_dados_serie(serie, rodadas, times=None):
+        with lock:
+            recebidos[serie] = rodadas
+        adapter = brasileirao.http_client.session.get_adapter('https://exemplo.com')
+        return {'pool': adapter._pool_maxsize}
+    brasileirao._obter_dados_serie = obter_dados_serie
+    return brasileirao, recebidos
+
+def test_gerador_de_rodadas_chega_inteiro_a_todos_os_workers():
+    brasileirao, recebidos = _brasileirao_falso()
+    with brasileirao:
+        brasileirao.coletar_varios(['serie_a', 'serie_b', 1439], workers=2,
+                                   rodadas=(n for n in range(20, 26)))
+    assert set(recebidos) == {'serie_a', 'serie_b', 1439}
+    assert all(rodadas == frozenset(range(20, 26)) for rodadas in recebidos.values())
+
+def test_pool_dimensionado_so_durante_a_coleta():
+    brasileirao, recebidos = _brasileirao_falso()
+    with brasileirao:
+        session = brasileirao.http_client.session
+        anteriores = dict(session.adapters)
+        resultado = brasileirao.coletar_varios(['serie_a', 'serie_b'], workers=5, rodadas=False)
+        
+        assert resultado == {'serie_a': {'pool': 5}, 'serie_b': {'pool': 5}}
+        assert recebidos == {'serie_a': False, 'serie_b': False}
+        assert dict(session.adapters) == anteriores
+
+def test_coletas_rodam_ao_mesmo_tempo_e_resultados_ficam_por_campeonato():
+    brasileirao = Brasileirao()
+    campeonatos = ['serie_a', 'serie_b', 1439, '1436:5']
+    # Só passa se todas as coletas estiverem em andamento simultaneamente
+    barreira = threading.Barrier(len(campeonatos), timeout=5)
+    
+    def obter_dados_serie(serie, rodadas, times=None):
+        barreira.wait()
+        if serie == 1439:
+            raise Exception("Erro ao obter dados: 404")
+        return {'campeonato': serie, 'thread': threading.current_thread().name}
+    brasileirao._obter_dados_serie = obter_dados_serie
+    
+    with brasileirao:
+        resultado = brasileirao.coletar_varios(campeonatos, workers=len(campeonatos), rodadas=False)
+    
+    assert list(resultado) == campeonatos
+    assert resultado[1439] == {'erro': "Erro ao obter dados: 404"}
+    for campeonato in ('serie_a', 'serie_b', '1436:5'):
+        assert resultado[campeonato]['campeonato'] == campeonato
+    threads = {resultado[c]['thread'] for c in ('serie_a', 'serie_b', '1436:5')}
+    assert len(threads) == 3
+
+def test_versao_assincrona_monta_o_mesmo_resultado(dados_serie_b_dict):
+    from scripts.benchmark_parsers import gerar_html_rodadas, gerar_html_tabela
+    from scrapers.campeonatos import obter_urls
+    from src.async_brasileirao import AsyncBrasileirao
+    
+    urls = obter_urls('serie_b')
+    paginas = {
+        urls['tabela']: (gerar_html_tabela(dados_serie_b_dict['tabela']), 'h1'),
+        urls['rodadas']: (gerar_html_rodadas(dados_serie_b_dict['rodadas']), 'h2'),
+    }
+    
+    with Brasileirao() as brasileirao:
+        brasileirao.http_client.get_conteudo = paginas.__getitem__
+        sincrono = brasileirao.obter_dados_brasileirao_b(rodadas=range(24, 27), times=['Remo'])
+    
+    async def principal():
+        async with AsyncBrasileirao(max_concorrencia=2) as brasileirao:
+            brasileirao.http_client.http_client.get_conteudo = paginas.__getitem__
+            return await brasileirao.obter_dados(['serie_b'], rodadas=range(24, 27), times=['Remo'])
+    
+    assincrono = asyncio.run(principal())['serie_b']
+    assert 'erro' not in sincrono
+    assert assincrono == sincrono
+    assert [r['rodada'] for r in sincrono['rodadas']] == ['24ª rodada', '25ª rodada', '26ª rodada']
+    assert all(len(r['partidas']) == 1 for r in sincrono['rodadas'])
+
+def test_resultados_memoizados_sao_copias(dados_serie_b_dict):
+    from scripts.benchmark_parsers import gerar_html_rodadas, gerar_html_tabela
+    from scrapers.campeonatos import obter_urls
+    
+    urls = obter_urls('serie_b')
+    paginas = {
+        urls['tabela']: (gerar_html_tabela(dados_serie_b_dict['tabela']), 'h1'),
+        urls['rodadas']: (gerar_html_rodadas(dados_serie_b_dict['rodadas']), 'h2'),
+    }
+    
+    with Brasileirao() as brasileirao:
+        brasileirao.http_client.get_conteudo = paginas.__getitem__
+        rodadas = brasileirao.obter_rodadas('serie_b', rodadas=[26])
+        tabela = brasileirao.obter_tabela('serie_b')
+        rodadas[0].partidas[0].gols_casa = '9'
+        rodadas[0].partidas.clear()
+        tabela.times.pop()
+        
+        assert len(brasileirao._memo) == 2
+        de_novo = brasileirao.obter_rodadas('serie_b', rodadas=[26])
+        assert len(de_novo[0].partidas) == 10 and de_novo[0].partidas[0].gols_casa == ''
+        assert len(brasileirao.obter_tabela('serie_b').times) == 20
+        
+        gerada = next(brasileirao.iter_rodadas('serie_b', rodadas=[26]))
+        gerada.partidas.clear()
+        assert len(brasileirao.obter_rodadas('serie_b', rodadas=[26])[0].partidas) == 10
+        assert len(brasileirao._memo) == 2
+
+def test_geradores_filtram_e_memoizam_so_a_geracao_completa(dados_serie_b_dict, monkeypatch):
+    from scripts.benchmark_parsers import gerar_html_rodadas
+    from scrapers.campeonatos import obter_urls
+    from src import brasileirao as modulo
+    
+    paginas = {obter_urls('serie_b')['rodadas']: (gerar_html_rodadas(dados_serie_b_dict['rodadas']), 'h')}
+    
+    with Brasileirao() as brasileirao:
+        brasileirao.http_client.get_conteudo = paginas.__getitem__
+        
+        # Interrompida na primeira rodada: nada é memoizado
+        gerador = brasileirao.iter_rodadas('serie_b', rodadas=range(20, 23), times=['Remo'])
+        assert next(gerador).rodada == '20ª rodada'
+        gerador.close()
+        assert len(brasileirao._memo) == 0
+        
+        partidas = list(brasileirao.iter_partidas('serie_b', rodadas=range(20, 23), times=['Remo']))
+        assert len(partidas) == 3 and all('Remo' in (p.time_casa, p.time_fora) for p in partidas)
+        partidas[0].gols_casa = '9'
+        assert len(brasileirao._memo) == 1
+        
+        # As próximas chamadas com os mesmos filtros não refazem o parsing
+        monkeypatch.setattr(modulo, 'criar_documento', None)
+        rodadas = brasileirao.obter_rodadas('serie_b', rodadas=[22, 21, 20], times={'Remo'})
+        assert [r.rodada for r in rodadas] == ['20ª rodada', '21ª rodada', '22ª rodada']
+        assert [r.partidas[0] for r in rodadas] == list(
+            brasileirao.iter_partidas('serie_b', rodadas=range(20, 23), times=['Remo'])
+        )
+        assert rodadas[0].partidas[0].gols_casa != '9'
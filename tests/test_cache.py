@@ -0,0 +1,37 @@
+"""
+Testes da memoização de parsing
+"""
+
+from scrapers.cache import ParseMemo, hash_conteudo
+from scrapers.config import CACHE_CONFIG
+
+def test_reaproveita_enquanto_o_conteudo_nao_muda():
+    memo = ParseMemo()
+    chamadas = []
+    
+    def parse():
+        chamadas.append(1)
+        return object()
+    
+    primeiro = memo.obter('url', hash_conteudo('a'), parse)
+    assert memo.obter('url', hash_conteudo('a'), parse) is primeiro
+    assert memo.obter('url', hash_conteudo('b'), parse) is not primeiro
+    assert len(chamadas) == 2
+    assert len(memo) == 1
+
+def test_limite_descarta_o_menos_usado():
+    memo = ParseMemo(max_entradas=3)
+    for i in range(3):
+        memo.obter(f'url?rodadas={i}', 'h', lambda: i)
+    assert memo.consultar('url?rodadas=0', 'h') == 0
+    
+    memo.obter('url?rodadas=3', 'h', lambda: 3)
+    assert len(memo) == 3
+    assert memo.consultar('url?rodadas=1', 'h') is None
+    assert memo.consultar('url?rodadas=0', 'h') == 0
+
+def test_filtros_que_mudam_a_cada_coleta_nao_crescem_sem_limite():
+    memo = ParseMemo()
+    for pendentes in range(500):
+        memo.obter(f'url#rodadas={pendentes}-38', 'h', lambda: [])
+    assert len(memo) == CACHE_CONFIG['max_memo_parsing']
@@ -0,0 +1,75 @@
+"""
+Testes da classificação calculada pelos resultados
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from src.arrays import ArraysTemporada  # noqa: E402
+from src.classificacao import MotorClassificacao  # noqa: E402
+from src.models import Partida, Rodada  # noqa: E402
+
+def _rodada(numero, *jogos):
+    """Rodada com jogos (casa, gols_casa, gols_fora, fora) já disputados"""
+    partidas = [
+        Partida(
+            partida=f"{casa} x {fora}", data=f"Sáb {numero:02d}/03 16h00", local='',
+            time_casa=casa, time_fora=fora, gols_casa=str(gc), gols_fora=str(gf),
+            resultado_texto=f"{casa} {gc} x {gf} {fora}"
+        )
+        for casa, gc, gf, fora in jogos
+    ]
+    return Rodada(rodada=f"{numero}ª rodada", inicio=f"{numero:02d}/03/2025", rodada_atual=False,
+                  partidas=partidas)
+
+def _nomes(classificacao):
+    return [classificacao.times[i] for i in classificacao.ordem]
+
+def test_confere_com_a_tabela_coletada(dados_serie_b):
+    motor = MotorClassificacao(ArraysTemporada.de_dados(dados_serie_b))
+    assert motor.calcular().conferir(dados_serie_b.tabela) == []
+
+def test_confronto_direto_desempata_dois_clubes():
+    rodadas = [
+        _rodada(1, ('Beta', 1, 0, 'Alfa'), ('Delta', 2, 1, 'Gama')),
+        _rodada(2, ('Alfa', 2, 1, 'Gama'), ('Delta', 2, 1, 'Beta')),
+    ]
+    motor = MotorClassificacao(ArraysTemporada.de_rodadas(rodadas))
+    classificacao = motor.calcular()
+    
+    # Alfa e Beta: 3 pontos, 1 vitória, saldo 0 e 2 gols pró; Beta venceu o confronto
+    alfa, beta = classificacao.times.index('Alfa'), classificacao.times.index('Beta')
+    for estatistica in ('pontos', 'vitorias', 'saldo_gols', 'gols_pro'):
+        assert getattr(classificacao, estatistica)[alfa] == getattr(classificacao, estatistica)[beta]
+    assert _nomes(classificacao) == ['Delta', 'Beta', 'Alfa', 'Gama']
+    
+    # Sem o jogo entre eles, vale a ordem alfabética
+    sem_confronto = motor.arrays.rodada != 1
+    assert _nomes(motor.calcular(sem_confronto))[:2] == ['Alfa', 'Delta']
+
+def test_empate_de_tres_clubes_fica_em_ordem_alfabetica():
+    # Cada um venceu um dos outros por 1 x 0; Beta venceu Alfa e Gama venceu Beta,
+    # mas com três empatados o confronto direto não se aplica
+    rodadas = [
+        _rodada(1, ('Beta', 1, 0, 'Alfa'), ('Delta', 0, 0, 'Zeta')),
+        _rodada(2, ('Gama', 1, 0, 'Beta'), ('Zeta', 0, 0, 'Delta')),
+        _rodada(3, ('Alfa', 1, 0, 'Gama'), ('Delta', 0, 5, 'Zeta')),
+    ]
+    classificacao = MotorClassificacao(ArraysTemporada.de_rodadas(rodadas)).calcular()
+    
+    assert _nomes(classificacao) == ['Zeta', 'Alfa', 'Beta', 'Gama', 'Delta']
+
+def test_varias_mascaras_em_um_calculo():
+    rodadas = [
+        _rodada(1, ('Beta', 1, 0, 'Alfa'), ('Delta', 2, 1, 'Gama')),
+        _rodada(2, ('Alfa', 2, 1, 'Gama'), ('Delta', 2, 1, 'Beta')),
+    ]
+    motor = MotorClassificacao(ArraysTemporada.de_rodadas(rodadas))
+    mascaras = np.stack([motor.arrays.rodada <= 1, motor.arrays.rodada <= 2])
+    
+    varias = motor.calcular(mascaras)
+    for k, rodada in enumerate((1, 2)):
+        uma = motor.ate_rodada(rodada)
+        assert list(varias.ordem[k]) == list(uma.ordem)
+        assert list(varias.pontos[k]) == list(uma.pontos)
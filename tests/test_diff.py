@@ -0,0 +1,154 @@
+"""
+Testes da comparação entre snapshots
+"""
+
+import copy
+from datetime import datetime
+
+import pytest
+
+from src.diff import (
+    ComparadorSnapshots, EventoPartida, GolMarcado, PartidaAdicionada, PartidaEncerrada,
+    PartidaRemovida, PlacarCorrigido, PosicaoAlterada
+)
+from src.utils import DataConverter, FUSO_BRASILIA
+
+# Durante a 26ª rodada (iniciada em 12/09/2025)
+AGORA = datetime(2025, 9, 13, 12, tzinfo=FUSO_BRASILIA)
+
+def _comparar(anterior, atual, agora=AGORA):
+    return ComparadorSnapshots.comparar(
+        DataConverter.dados_brasileirao_from_dict(anterior),
+        DataConverter.dados_brasileirao_from_dict(atual),
+        agora
+    )
+
+def _eventos_partida(eventos):
+    return [e for e in eventos if isinstance(e, EventoPartida)]
+
+def test_snapshots_iguais_nao_geram_eventos(dados_serie_b_dict):
+    assert _comparar(dados_serie_b_dict, copy.deepcopy(dados_serie_b_dict)) == []
+
+def test_rodadas_casadas_pelo_numero_e_nao_pela_posicao(dados_serie_b_dict):
+    atual = copy.deepcopy(dados_serie_b_dict)
+    atual['rodadas'].reverse()
+    assert _comparar(dados_serie_b_dict, atual) == []
+    
+    partida = atual['rodadas'][-5]['partidas'][0]
+    assert atual['rodadas'][-5]['rodada'] == '5ª rodada'
+    partida['gols_casa'] = str(int(partida['gols_casa']) + 1)
+    
+    eventos = _comparar(dados_serie_b_dict, atual)
+    assert eventos == [GolMarcado(
+        5, partida['time_casa'], partida['time_fora'], 2025,
+        time=partida['time_casa'], gols=1,
+        gols_casa=int(partida['gols_casa']), gols_fora=int(partida['gols_fora'])
+    )]
+
+def test_placar_e_encerramento_de_partida_em_andamento(dados_serie_b_dict):
+    atual = copy.deepcopy(dados_serie_b_dict)
+    partida = atual['rodadas'][25]['partidas'][0]
+    partida['gols_casa'], partida['gols_fora'] = '2', '1'
+    depois = datetime(2025, 9, 12, 23, tzinfo=FUSO_BRASILIA)
+    
+    eventos = _comparar(dados_serie_b_dict, atual, depois)
+    chave = (26, 'Volta Redonda', 'Criciúma', 2025)
+    assert GolMarcado(*chave, time='Volta Redonda', gols=2, gols_casa=2, gols_fora=1) in eventos
+    assert GolMarcado(*chave, time='Criciúma', gols=1, gols_casa=2, gols_fora=1) in eventos
+    assert PartidaEncerrada(*chave, gols_casa=2, gols_fora=1) in eventos
+    
+    corrigido = copy.deepcopy(atual)
+    corrigido['rodadas'][25]['partidas'][0]['gols_fora'] = '0'
+    assert _comparar(atual, corrigido, depois) == [PlacarCorrigido(*chave, '2', '1', '2', '0')]
+
+def test_partida_adicionada_e_removida(dados_serie_b_dict):
+    atual = copy.deepcopy(dados_serie_b_dict)
+    partida = atual['rodadas'][30]['partidas'].pop(2)
+    atual['rodadas'][31]['partidas'].append(partida)
+    
+    eventos = _comparar(dados_serie_b_dict, atual)
+    confronto = (partida['time_casa'], partida['time_fora'])
+    assert eventos == [
+        PartidaRemovida(31, *confronto, 2025, data=partida['data'], local=partida['local']),
+        PartidaAdicionada(32, *confronto, 2025, data=partida['data'], local=partida['local'])
+    ]
+
+def test_modelos_tipados(dados_serie_b_dict, dados_serie_b):
+    atual = copy.deepcopy(dados_serie_b_dict)
+    atual['rodadas'][25]['partidas'][0]['gols_casa'] = '1'
+    atual['rodadas'][25]['partidas'][0]['gols_fora'] = '0'
+    tipado_anterior = DataConverter.dados_tipados(dados_serie_b)
+    tipado_atual = DataConverter.dados_tipados(DataConverter.dados_brasileirao_from_dict(atual))
+    
+    assert ComparadorSnapshots.comparar(tipado_anterior, tipado_anterior, AGORA) == []
+    eventos = ComparadorSnapshots.comparar(tipado_anterior, tipado_atual, AGORA)
+    chave = (26, 'Volta Redonda', 'Criciúma', 2025)
+    assert eventos == [
+        GolMarcado(*chave, time='Volta Redonda', gols=1, gols_casa=1, gols_fora=0),
+        PartidaEncerrada(*chave, gols_casa=1, gols_fora=0)
+    ]
+    
+    # Placar apagado: None nos modelos tipados vira PlacarCorrigido
+    eventos = ComparadorSnapshots.comparar(tipado_atual, tipado_anterior, AGORA)
+    assert eventos == [PlacarCorrigido(*chave, '1', '0', '', '')]
+
+def test_posicao_alterada(dados_serie_b_dict):
+    atual = copy.deepcopy(dados_serie_b_dict)
+    primeiro, segundo = atual['tabela'][0], atual['tabela'][1]
+    primeiro['posicao'], segundo['posicao'] = segundo['posicao'], primeiro['posicao']
+    
+    eventos = _comparar(dados_serie_b_dict, atual)
+    assert eventos == [
+        PosicaoAlterada(time=primeiro['nome'], posicao_anterior=1, posicao=2),
+        PosicaoAlterada(time=segundo['nome'], posicao_anterior=2, posicao=1)
+    ]
+
+def test_processar_entrega_aos_inscritos(dados_serie_b_dict):
+    atual = copy.deepcopy(dados_serie_b_dict)
+    atual['rodadas'][0]['partidas'][0]['gols_fora'] = '3'
+    recebidos = []
+    comparador = ComparadorSnapshots()
+    comparador.inscrever(GolMarcado, recebidos.append)
+    
+    anterior = DataConverter.dados_brasileirao_from_dict(dados_serie_b_dict)
+    assert comparador.processar(None, anterior) == []
+    eventos = comparador.processar(anterior, DataConverter.dados_brasileirao_from_dict(atual), AGORA)
+    assert recebidos == eventos == _eventos_partida(eventos)
+    assert recebidos[0].gols == 3
+
+def test_impressoes_guardadas_evitam_percorrer_rodadas_inalteradas(dados_serie_b_dict, monkeypatch):
+    anterior = DataConverter.dados_brasileirao_from_dict(dados_serie_b_dict)
+    atual = DataConverter.dados_brasileirao_from_dict(copy.deepcopy(dados_serie_b_dict))
+    fora_da_janela = datetime(2025, 12, 31, tzinfo=FUSO_BRASILIA)
+    
+    calculadas = []
+    impressao_rodada = DataConverter.impressao_rodada
+    monkeypatch.setattr(DataConverter, 'impressao_rodada', staticmethod(
+        lambda rodada: calculadas.append(rodada.rodada) or impressao_rodada(rodada)
+    ))
+    
+    assert ComparadorSnapshots.comparar(anterior, atual, fora_da_janela) == []
+    assert len(calculadas) == 76
+    assert set(anterior.impressoes) == set(range(1, 39))
+    
+    # Na coleta seguinte, o snapshot atual vira o anterior e já tem suas impressões
+    calculadas.clear()
+    seguinte = DataConverter.dados_brasileirao_from_dict(copy.deepcopy(dados_serie_b_dict))
+    seguinte.impressoes = dict(atual.impressoes)
+    monkeypatch.setattr(type(seguinte.rodadas[0]), '__eq__', lambda a, b: pytest.fail("rodada percorrida"))
+    assert ComparadorSnapshots.comparar(atual, seguinte, fora_da_janela) == []
+    assert calculadas == []
+
+def test_snapshot_de_texto_contra_tipado(dados_serie_b_dict):
+    texto = DataConverter.dados_brasileirao_from_dict(dados_serie_b_dict)
+    tipado = DataConverter.dados_tipados(DataConverter.dados_brasileirao_from_dict(dados_serie_b_dict))
+    
+    assert ComparadorSnapshots.comparar(texto, tipado, AGORA) == []
+    assert ComparadorSnapshots.comparar(tipado, texto, AGORA) == []
+    
+    tipado.tabela.times[0].posicao, tipado.tabela.times[1].posicao = 2, 1
+    eventos = ComparadorSnapshots.comparar(texto, tipado, AGORA)
+    assert eventos == [
+        PosicaoAlterada(time=tipado.tabela.times[0].nome, posicao_anterior=1, posicao=2),
+        PosicaoAlterada(time=tipado.tabela.times[1].nome, posicao_anterior=2, posicao=1),
+    ]
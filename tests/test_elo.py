@@ -0,0 +1,74 @@
+"""
+Testes dos ratings Elo
+"""
+
+import pytest
+
+from src.diff import PartidaEncerrada, PlacarCorrigido
+from src.elo import RatingsElo
+from src.utils import DataConverter
+
+def test_mesma_partida_aplicada_uma_vez():
+    elo = RatingsElo()
+    assert elo.registrar_resultado('A', 'B', 1, 0, 1, 2025)
+    assert not elo.registrar_resultado('A', 'B', 2, 0, 1, 2025)
+    assert len(elo.ajustes) == 1
+
+def test_mesmo_confronto_em_outra_rodada_temporada_ou_campeonato():
+    elo = RatingsElo(campeonato='serie_b')
+    assert elo.registrar_resultado('A', 'B', 1, 0, 1, 2025)
+    assert elo.registrar_resultado('A', 'B', 2, 0, 20, 2025)
+    assert elo.registrar_resultado('A', 'B', 1, 0, 1, 2026)
+    assert elo.registrar_resultado('A', 'B', 1, 0, 1, 2025, campeonato='copa_do_brasil')
+    assert len(elo.ajustes) == 4
+    assert elo.rating('A') > elo.rating_inicial
+
+def test_correcao_troca_apenas_o_ajuste_da_partida():
+    elo = RatingsElo()
+    elo.processar_evento(PartidaEncerrada(1, 'A', 'B', 2025, gols_casa=1, gols_fora=0))
+    elo.processar_evento(PartidaEncerrada(20, 'A', 'B', 2025, gols_casa=0, gols_fora=0))
+    antes = elo.rating('A')
+    
+    assert elo.processar_evento(PlacarCorrigido(20, 'A', 'B', 2025, '0', '0', '0', '1'))
+    assert elo.rating('A') < antes
+    assert not elo.processar_evento(PlacarCorrigido(5, 'A', 'B', 2025, '0', '0', '0', '1'))
+    assert elo.rating('A') + elo.rating('B') == 2 * elo.rating_inicial
+
+def test_de_rodadas_e_persistencia(dados_serie_b, tmp_path):
+    elo = RatingsElo.de_rodadas(dados_serie_b.rodadas, campeonato='serie_b')
+    # Turno e returno: cada partida jogada tem o seu ajuste
+    jogadas = sum(1 for r in dados_serie_b.rodadas for p in r.partidas if p.gols_casa != '')
+    assert len(elo.ajustes) == jogadas
+    
+    arquivo = tmp_path / "elo.json"
+    elo.salvar(str(arquivo))
+    restaurado = RatingsElo.carregar(str(arquivo))
+    assert restaurado.ratings == elo.ratings
+    assert restaurado.ajustes == elo.ajustes
+    assert restaurado.campeonato == 'serie_b'
+    
+    # Reaplicar a temporada não muda nada
+    for rodada in dados_serie_b.rodadas:
+        for partida in rodada.partidas:
+            restaurado.atualizar(partida, DataConverter.numero_rodada(rodada.rodada), 2025)
+    assert restaurado.ratings == elo.ratings
+
+def test_arquivo_ausente_devolve_none(tmp_path):
+    assert RatingsElo.carregar(str(tmp_path / "elo.json")) is None
+
+@pytest.mark.parametrize('conteudo, mensagem', [
+    ('não é json', None),
+    ('[1, 2]', 'objeto JSON'),
+    ('{"k": 20, "ratings": {}, "ajustes": {}}', 'faltam vantagem_casa'),
+    ('{"k": "20", "vantagem_casa": 60, "fator_margem": true, "rating_inicial": 1500, '
+     '"campeonato": "", "ratings": {}, "ajustes": {}}', 'k deve ser numérico'),
+    ('{"k": 20, "vantagem_casa": 60, "fator_margem": 1, "rating_inicial": 1500, '
+     '"campeonato": "", "ratings": {}, "ajustes": {}}', 'fator_margem'),
+    ('{"k": 20, "vantagem_casa": 60, "fator_margem": true, "rating_inicial": 1500, '
+     '"campeonato": "", "ratings": {"A": "1500"}, "ajustes": {}}', 'ratings'),
+])
+def test_arquivo_fora_do_formato_gera_erro(tmp_path, conteudo, mensagem):
+    arquivo = tmp_path / "elo.json"
+    arquivo.write_text(conteudo, encoding='utf-8')
+    with pytest.raises(ValueError, match=mensagem):
+        RatingsElo.carregar(str(arquivo))
@@ -0,0 +1,54 @@
+"""
+Testes das engines de parsing: todas devem produzir os mesmos modelos
+"""
+
+import pytest
+
+from scripts.benchmark_parsers import gerar_html_rodadas, gerar_html_tabela
+from scrapers.config import PARSER_CONFIG
+from scrapers.engines import No, NoBS4, criar_documento
+from scrapers.http_client import HTTPClient
+from scrapers.parsers import RodadasParser, TabelaParser
+
+MODULOS_ENGINE = {
+    'html.parser': None,
+    'lxml': 'lxml.html',
+    'selectolax': 'selectolax.parser',
+}
+
+@pytest.fixture(params=list(MODULOS_ENGINE))
+def engine(request):
+    """Cada engine instalada; as ausentes são puladas"""
+    modulo = MODULOS_ENGINE[request.param]
+    if modulo is not None:
+        pytest.importorskip(modulo)
+    if request.param == 'lxml':
+        pytest.importorskip('cssselect')
+    return request.param
+
+@pytest.fixture(scope='module')
+def paginas(dados_serie_b_dict):
+    return (
+        gerar_html_tabela(dados_serie_b_dict['tabela']),
+        gerar_html_rodadas(dados_serie_b_dict['rodadas'])
+    )
+
+def test_no_e_abstrato():
+    with pytest.raises(TypeError):
+        No()
+
+def test_engines_produzem_os_mesmos_modelos(engine, paginas, dados_serie_b):
+    html_tabela, html_rodadas = paginas
+    
+    tabela = TabelaParser.parse_tabela(criar_documento(html_tabela, engine))
+    rodadas = RodadasParser.parse_rodadas(criar_documento(html_rodadas, engine))
+    
+    assert tabela == dados_serie_b.tabela
+    assert rodadas == dados_serie_b.rodadas
+
+def test_parse_html_usa_a_engine_configurada(monkeypatch, paginas, dados_serie_b):
+    monkeypatch.setitem(PARSER_CONFIG, 'engine', 'html.parser')
+    
+    documento = HTTPClient.parse_html(paginas[0])
+    assert isinstance(documento, NoBS4)
+    assert TabelaParser.parse_tabela(documento) == dados_serie_b.tabela
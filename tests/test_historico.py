@@ -0,0 +1,127 @@
+"""
+Testes do histórico de snapshots com deltas
+"""
+
+import copy
+from datetime import date, datetime, timezone
+
+import pytest
+
+from src.historico import FORMATO_ARQUIVO, HistoricoSnapshots
+from src.serializacao import decodificar
+from src.utils import FUSO_BRASILIA
+
+SERIE = 'serie_b'
+
+def _momento(dia, hora=0):
+    return datetime(2025, 9, dia, hora)
+
+def test_registro_e_reconstrucao_ida_e_volta(tmp_path, dados_serie_b_dict):
+    historico = HistoricoSnapshots(tmp_path)
+    versoes = [copy.deepcopy(dados_serie_b_dict)]
+    
+    # Placar corrigido
+    v = copy.deepcopy(versoes[-1])
+    v['rodadas'][0]['partidas'][0]['gols_casa'] = '7'
+    versoes.append(v)
+    
+    # Tabela reordenada
+    v = copy.deepcopy(versoes[-1])
+    v['tabela'][0], v['tabela'][1] = v['tabela'][1], v['tabela'][0]
+    v['tabela'][0]['posicao'], v['tabela'][1]['posicao'] = '1', '2'
+    versoes.append(v)
+    
+    # Partida removida de uma rodada e acrescentada em outra
+    v = copy.deepcopy(versoes[-1])
+    partida = v['rodadas'][30]['partidas'].pop(3)
+    v['rodadas'][31]['partidas'].append(partida)
+    versoes.append(v)
+    
+    for dia, versao in enumerate(versoes, start=10):
+        assert historico.registrar(SERIE, versao, _momento(dia)) is not None
+    
+    momentos = historico.momentos(SERIE)
+    assert len(momentos) == len(versoes)
+    assert (tmp_path / SERIE / 'base.json').exists()
+    assert len(list((tmp_path / SERIE / 'deltas').glob('*.json'))) == len(versoes) - 1
+    
+    for dia, versao in enumerate(versoes, start=10):
+        assert historico.reconstruir(SERIE, date(2025, 9, dia)) == versao
+        assert HistoricoSnapshots(tmp_path).reconstruir(SERIE, _momento(dia, 12)) == versao
+    assert historico.reconstruir(SERIE) == versoes[-1]
+    assert historico.reconstruir(SERIE, date(2025, 9, 9)) is None
+
+def test_delta_guarda_so_o_que_mudou(tmp_path, dados_serie_b_dict):
+    historico = HistoricoSnapshots(tmp_path)
+    historico.registrar(SERIE, dados_serie_b_dict, _momento(10))
+    
+    alterado = copy.deepcopy(dados_serie_b_dict)
+    alterado['rodadas'][0]['partidas'][0]['gols_fora'] = '9'
+    arquivo = historico.registrar(SERIE, alterado, _momento(11))
+    
+    with open(arquivo, 'rb') as f:
+        delta = decodificar(f.read())
+    assert list(delta) == ['rodadas']
+    # Rodadas ficam pelo número ('1ª rodada' -> '1'), não pelo título
+    assert list(delta['rodadas']) == ['1']
+    assert len(delta['rodadas']['1']['partidas']) == 1
+
+def test_coleta_sem_mudancas_nao_grava(tmp_path, dados_serie_b_dict):
+    historico = HistoricoSnapshots(tmp_path)
+    historico.registrar(SERIE, dados_serie_b_dict, _momento(10))
+    assert historico.registrar(SERIE, copy.deepcopy(dados_serie_b_dict), _momento(11)) is None
+    assert historico.momentos(SERIE) == ['2025-09-10T00-00-00']
+
+@pytest.mark.parametrize('hora', [8, 9])
+def test_coleta_nao_posterior_levanta_erro(tmp_path, dados_serie_b_dict, hora):
+    historico = HistoricoSnapshots(tmp_path)
+    historico.registrar(SERIE, dados_serie_b_dict, _momento(10, 9))
+    with pytest.raises(ValueError):
+        historico.registrar(SERIE, dados_serie_b_dict, _momento(10, hora))
+    
+    # Também ao retomar o histórico já gravado em outra instância
+    with pytest.raises(ValueError):
+        HistoricoSnapshots(tmp_path).registrar(SERIE, dados_serie_b_dict, _momento(10, hora))
+
+def test_rodadas_com_titulos_vazios_ou_sem_numero(tmp_path, dados_serie_b_dict):
+    historico = HistoricoSnapshots(tmp_path)
+    base = copy.deepcopy(dados_serie_b_dict)
+    base['rodadas'] = base['rodadas'][:3]
+    for rodada in base['rodadas'][:2]:
+        rodada['rodada'] = ''
+    historico.registrar(SERIE, base, _momento(10))
+    
+    # Cada rodada sem título fica na sua posição: uma mudança não vaza para a outra
+    alterado = copy.deepcopy(base)
+    alterado['rodadas'][1]['partidas'][0]['gols_casa'] = '8'
+    historico.registrar(SERIE, alterado, _momento(11))
+    
+    assert historico.reconstruir(SERIE, date(2025, 9, 10)) == base
+    assert HistoricoSnapshots(tmp_path).reconstruir(SERIE) == alterado
+
+def test_rodadas_com_o_mesmo_numero_levantam_erro(tmp_path, dados_serie_b_dict):
+    dados = copy.deepcopy(dados_serie_b_dict)
+    dados['rodadas'][1]['rodada'] = dados['rodadas'][0]['rodada']
+    with pytest.raises(ValueError, match="repetida"):
+        HistoricoSnapshots(tmp_path).registrar(SERIE, dados, _momento(10))
+
+def test_momentos_no_horario_de_brasilia(tmp_path, dados_serie_b_dict):
+    historico = HistoricoSnapshots(tmp_path)
+    antes = datetime.now(FUSO_BRASILIA).replace(microsecond=0, tzinfo=None)
+    historico.registrar(SERIE, dados_serie_b_dict)
+    depois = datetime.now(FUSO_BRASILIA).replace(tzinfo=None)
+    
+    padrao = datetime.strptime(historico.momentos(SERIE)[0], FORMATO_ARQUIVO)
+    assert antes <= padrao <= depois
+    
+    # Momentos com fuso são convertidos: 03h00 UTC do dia 11 é meia-noite em Brasília
+    alterado = copy.deepcopy(dados_serie_b_dict)
+    alterado['rodadas'][0]['partidas'][0]['gols_casa'] = '7'
+    historico = HistoricoSnapshots(tmp_path / "outro")
+    historico.registrar(SERIE, dados_serie_b_dict, _momento(10, 20))
+    historico.registrar(SERIE, alterado, datetime(2025, 9, 11, 3, tzinfo=timezone.utc))
+    
+    assert historico.momentos(SERIE) == ['2025-09-10T20-00-00', '2025-09-11T00-00-00']
+    assert historico.reconstruir(SERIE, datetime(2025, 9, 11, 2, 59, tzinfo=timezone.utc)) == dados_serie_b_dict
+    assert historico.reconstruir(SERIE, datetime(2025, 9, 10, 21, tzinfo=FUSO_BRASILIA)) == dados_serie_b_dict
+    assert historico.reconstruir(SERIE, datetime(2025, 9, 11, 3, tzinfo=timezone.utc)) == alterado
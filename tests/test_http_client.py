@@ -0,0 +1,133 @@
+"""
+Testes do cliente HTTP (deadline, corpo e headers) contra um servidor local
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scrapers.cache import ResponseCache, hash_conteudo
+from scrapers.config import REQUEST_CONFIG
+from scrapers.http_client import TAMANHO_BLOCO, HTTPClient
+
+BLOCOS = 20
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    conexoes = set()
+    agentes = []
+    condicionais = []
+    
+    def do_GET(self):
+        _Handler.conexoes.add(self.client_address)
+        _Handler.agentes.append(self.headers.get('User-Agent'))
+        _Handler.condicionais.append((self.headers.get('If-None-Match'), self.headers.get('If-Modified-Since')))
+        if self.path == '/etag':
+            if self.headers.get('If-None-Match') == '"v1"':
+                self.send_response(304)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            corpo = b'<html>v1</html>'
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('ETag', '"v1"')
+            self.send_header('Last-Modified', 'Tue, 09 Sep 2025 12:00:00 GMT')
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+            return
+        if self.path == '/latin1':
+            corpo = 'Grêmio x São Paulo'.encode('latin-1')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=iso-8859-1')
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+            return
+        lento = self.path == '/lento'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(BLOCOS * TAMANHO_BLOCO if lento else 2))
+        self.end_headers()
+        if not lento:
+            self.wfile.write(b'ok')
+            return
+        try:
+            for _ in range(BLOCOS):
+                self.wfile.write(b'x' * TAMANHO_BLOCO)
+                self.wfile.flush()
+                time.sleep(0.1)
+        except OSError:
+            pass
+    
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def servidor():
+    _Handler.conexoes = set()
+    _Handler.agentes = []
+    _Handler.condicionais = []
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_corpo_lento_respeita_o_deadline(servidor):
+    with HTTPClient() as cliente:
+        inicio = time.monotonic()
+        with pytest.raises(Exception, match='Timeout'):
+            cliente.get_conteudo(f"{servidor}/lento", deadline=0.5)
+        # Sem streaming a leitura levaria os 2s do corpo inteiro
+        assert time.monotonic() - inicio < 1.5
+
+def test_corpo_lido_e_conexao_reaproveitada(servidor):
+    with HTTPClient() as cliente:
+        for _ in range(3):
+            assert cliente.get_conteudo(f"{servidor}/rapido")[0] == 'ok'
+    assert len(_Handler.conexoes) == 1
+
+def test_deadline_zero_nao_vira_o_padrao(servidor):
+    with HTTPClient() as cliente:
+        with pytest.raises(Exception, match='Timeout'):
+            cliente.get_conteudo(f"{servidor}/rapido", deadline=0)
+    assert _Handler.agentes == []
+
+def test_corpo_devolvido_e_decodificado_pelo_charset(servidor):
+    with HTTPClient() as cliente:
+        response, corpo = cliente._get_medido(f"{servidor}/latin1", {}, 5)
+        assert corpo == 'Grêmio x São Paulo'.encode('latin-1')
+        assert not hasattr(response, '_content') or response._content is False
+        assert cliente.get_conteudo(f"{servidor}/latin1")[0] == 'Grêmio x São Paulo'
+
+def test_user_agent_rotacionado_por_requisicao_sem_alterar_a_sessao(servidor, monkeypatch):
+    monkeypatch.setitem(REQUEST_CONFIG, 'user_agent_rotation', True)
+    with HTTPClient() as cliente:
+        agentes = iter(['agente-1', 'agente-2', 'agente-3'])
+        cliente.ua = type('Pool', (), {'random': property(lambda self: next(agentes))})()
+        da_sessao = dict(cliente.session.headers)
+        for _ in range(3):
+            cliente.get_conteudo(f"{servidor}/rapido")
+        assert dict(cliente.session.headers) == da_sessao
+    assert _Handler.agentes == ['agente-1', 'agente-2', 'agente-3']
+
+def test_get_condicional_devolve_o_corpo_guardado_no_304(servidor, tmp_path):
+    url = f"{servidor}/etag"
+    with HTTPClient(ResponseCache(tmp_path)) as cliente:
+        primeiro = cliente.get_conteudo(url)
+        segundo = cliente.get_conteudo(url)
+    
+    assert primeiro == segundo == ('<html>v1</html>', hash_conteudo('<html>v1</html>'))
+    assert _Handler.condicionais == [
+        (None, None),
+        ('"v1"', 'Tue, 09 Sep 2025 12:00:00 GMT'),
+    ]
+    
+    # Outro cliente sobre o mesmo diretório também aproveita o cache
+    with HTTPClient(ResponseCache(tmp_path)) as cliente:
+        assert cliente.get_conteudo(url) == primeiro
+    assert len(_Handler.condicionais) == 3 and _Handler.condicionais[-1][0] == '"v1"'
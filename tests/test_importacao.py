@@ -0,0 +1,46 @@
+"""
+Testes do custo de importação: modelos e utilitários não carregam a pilha HTTP
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from conftest import RAIZ
+
+MODULOS_PESADOS = ('requests', 'bs4', 'fake_useragent', 'lxml', 'selectolax', 'urllib3', 'numpy')
+
+SONDA = """
+import sys, json
+exec({codigo!r})
+print(json.dumps(sorted(m for m in sys.modules if m.split('.')[0] in {pesados!r})))
+"""
+
+def _pesados_carregados(codigo):
+    """Executa a importação em um interpretador limpo e retorna os módulos pesados carregados"""
+    saida = subprocess.run(
+        [sys.executable, "-c", SONDA.format(codigo=codigo, pesados=MODULOS_PESADOS)],
+        cwd=str(RAIZ), capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(saida)
+
+@pytest.mark.parametrize('codigo', [
+    "import src.models",
+    "from src.models import Time, Partida, Rodada",
+    "from src.utils import JSONUtils, DataConverter",
+    "from src.diff import ComparadorSnapshots",
+    "import src, scrapers",
+    "from scrapers.config import URLS",
+])
+def test_importacao_leve_nao_carrega_pilha_http(codigo):
+    assert _pesados_carregados(codigo) == []
+
+def test_atributo_preguicoso_carrega_so_no_acesso():
+    assert _pesados_carregados("import src; src.DataConverter") == []
+    assert 'requests' in _pesados_carregados("import src; src.Brasileirao")
+
+def test_dir_lista_atributos_preguicosos():
+    import src
+    assert set(src.__all__) <= set(dir(src))
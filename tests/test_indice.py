@@ -0,0 +1,57 @@
+"""
+Testes dos índices da temporada
+"""
+
+from datetime import datetime
+
+from scripts.benchmark_parsers import gerar_html_rodadas
+from scrapers.engines import criar_documento
+from scrapers.parsers import RodadasParser
+from src.indice import IndiceTemporada
+from src.temporada import Temporada
+from src.utils import DataConverter, FUSO_BRASILIA
+
+def test_guarda_os_proprios_modelos_recebidos(dados_serie_b):
+    originais = [p for r in dados_serie_b.rodadas for p in r.partidas]
+    nomes = [(p.time_casa, p.time_fora, p.local) for p in originais]
+    
+    indice = IndiceTemporada(dados_serie_b.rodadas)
+    
+    assert all(guardada is original for guardada, original in zip(indice.partidas, originais))
+    for partida, (casa, fora, local) in zip(originais, nomes):
+        assert partida.time_casa is casa and partida.time_fora is fora and partida.local is local
+    
+    temporada = Temporada(dados_serie_b)
+    assert temporada.partidas_do_time('Remo')[0] is next(
+        p for p in temporada.rodada(1).partidas if 'Remo' in (p.time_casa, p.time_fora)
+    )
+
+def test_nomes_internados_ao_carregar_e_ao_parsear(dados_serie_b_dict, dados_serie_b):
+    indice = IndiceTemporada(dados_serie_b.rodadas)
+    jogos = indice.partidas_do_time('Remo')
+    assert len(jogos) == 38
+    remo = indice.times[indice.id_time('Remo')]
+    assert all(p.time_casa is remo or p.time_fora is remo for p in jogos)
+    
+    # Cada carga do JSON e cada parsing da página reaproveitam as mesmas strings
+    outra_carga = DataConverter.dados_brasileirao_from_dict(dados_serie_b_dict)
+    for a, b in zip(dados_serie_b.rodadas[0].partidas, outra_carga.rodadas[0].partidas):
+        assert a.partida is b.partida and a.local is b.local and a.resultado_texto is b.resultado_texto
+    
+    doc = criar_documento(gerar_html_rodadas(dados_serie_b_dict['rodadas'][:1]))
+    for tipado in (False, True):
+        for a, b in zip(dados_serie_b.rodadas[0].partidas, RodadasParser.parse_rodadas(doc, tipado=tipado)[0].partidas):
+            assert a.time_casa is b.time_casa and a.time_fora is b.time_fora
+            assert a.partida is b.partida and a.local is b.local
+
+def test_consultas_com_modelos_tipados(dados_serie_b):
+    tipadas = DataConverter.dados_tipados(dados_serie_b).rodadas
+    indice = IndiceTemporada(tipadas)
+    assert len(indice) == 380
+    assert indice.partidas_da_rodada(26) == tipadas[25].partidas
+    
+    inicio = datetime(2025, 9, 12, tzinfo=FUSO_BRASILIA)
+    fim = datetime(2025, 9, 14, 23, 59, tzinfo=FUSO_BRASILIA)
+    periodo = indice.partidas_entre(inicio, fim)
+    assert periodo
+    assert all(inicio <= p.data <= fim for p in periodo)
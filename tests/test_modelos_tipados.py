@@ -0,0 +1,66 @@
+"""
+Testes do parsing direto para os modelos tipados (TimeTipado, RodadaTipada, PartidaTipada)
+"""
+
+import copy
+from datetime import date, datetime
+
+import pytest
+
+from scripts.benchmark_parsers import gerar_html_rodadas, gerar_html_tabela
+from scrapers.engines import criar_documento
+from scrapers.parsers import RodadasParser, TabelaParser
+from src.models import DadosBrasileirao, PartidaTipada, RodadaTipada, TimeTipado
+from src.utils import DataConverter, FUSO_BRASILIA
+
+@pytest.fixture(scope='module')
+def tipados(dados_serie_b_dict):
+    tabela = TabelaParser.parse_tabela(criar_documento(gerar_html_tabela(dados_serie_b_dict['tabela'])), tipado=True)
+    rodadas = RodadasParser.parse_rodadas(criar_documento(gerar_html_rodadas(dados_serie_b_dict['rodadas'])), tipado=True)
+    return DadosBrasileirao(tabela=tabela, rodadas=rodadas)
+
+def test_campos_numericos_e_horarios(tipados):
+    lider = tipados.tabela.times[0]
+    assert isinstance(lider, TimeTipado)
+    assert (lider.nome, lider.posicao, lider.pontos, lider.jogos, lider.saldo_gols, lider.aproveitamento) == (
+        'Coritiba', 1, 46, 25, 12, 61
+    )
+    
+    primeira = tipados.rodadas[0]
+    assert isinstance(primeira, RodadaTipada)
+    assert (primeira.numero, primeira.inicio) == (1, date(2025, 4, 4))
+    partida = primeira.partidas[0]
+    assert isinstance(partida, PartidaTipada)
+    assert (partida.time_casa, partida.gols_casa, partida.gols_fora, partida.time_fora) == ('Goiás', 1, 0, 'Amazonas')
+    assert partida.data == datetime(2025, 4, 4, 19, tzinfo=FUSO_BRASILIA)
+    assert partida.data_texto == 'Sex 04/04 19h00'
+    assert partida.resultado_texto == 'Goiás 1 x 0 Amazonas'
+    
+    pendente = tipados.rodadas[25].partidas[0]
+    assert pendente.gols_casa is None and pendente.gols_fora is None
+    assert pendente.resultado_texto == 'Volta Redonda  x  Criciúma'
+
+def test_modelos_com_slots(tipados):
+    for modelo in (tipados.tabela.times[0], tipados.rodadas[0], tipados.rodadas[0].partidas[0]):
+        assert not hasattr(modelo, '__dict__')
+        with pytest.raises(AttributeError):
+            modelo.campo_inexistente = 1
+
+def test_parsing_tipado_igual_a_conversao_dos_modelos_de_texto(tipados, dados_serie_b):
+    assert tipados.tabela.times == [DataConverter.time_tipado(t) for t in dados_serie_b.tabela.times]
+    assert tipados.rodadas == [DataConverter.rodada_tipada(r) for r in dados_serie_b.rodadas]
+
+def test_dicionario_igual_ao_dos_modelos_de_texto(tipados, dados_serie_b_dict):
+    assert DataConverter.dados_brasileirao_to_dict(tipados) == dados_serie_b_dict
+
+def test_partidas_na_virada_do_ano_e_sem_horario(dados_serie_b_dict):
+    rodada = copy.deepcopy(dados_serie_b_dict['rodadas'][37])
+    rodada['inicio'] = '30/12/2025'
+    rodada['partidas'][0]['data'] = 'Sex 02/01 16h00'
+    rodada['partidas'][1]['data'] = ''
+    doc = criar_documento(gerar_html_rodadas([rodada]))
+    
+    partidas = RodadasParser.parse_rodadas(doc, tipado=True)[0].partidas
+    assert partidas[0].data == datetime(2026, 1, 2, 16, tzinfo=FUSO_BRASILIA)
+    assert partidas[1].data is None and partidas[1].data_texto == ''
+    assert list(RodadasParser.iter_partidas(doc, tipado=True)) == partidas
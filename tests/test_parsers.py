@@ -0,0 +1,88 @@
+"""
+Testes dos filtros de rodadas e times do parser de rodadas
+"""
+
+import copy
+
+import pytest
+
+from scripts.benchmark_parsers import gerar_html_rodadas
+from scrapers.config import CSS_SELECTORS
+from scrapers.engines import NoBS4, criar_documento
+from scrapers.parsers import RodadasParser, _separar_times
+
+def _renomear(rodadas, antigo, novo):
+    for rodada in rodadas:
+        for partida in rodada['partidas']:
+            for campo in ('time_casa', 'time_fora'):
+                if partida[campo] == antigo:
+                    partida[campo] = novo
+            partida['partida'] = f"{partida['time_casa']} x {partida['time_fora']}"
+    return rodadas
+
+def test_separar_times_usa_o_separador_com_espacos():
+    assert _separar_times('Caxias x Náutico') == ('Caxias', 'Náutico')
+    assert _separar_times(' Ypiranga x Brusque ') == ('Ypiranga', 'Brusque')
+    with pytest.raises(ValueError):
+        _separar_times('Caxias - Náutico')
+
+def test_filtro_de_rodadas_usa_o_numero_do_titulo(dados_serie_b_dict):
+    # Página parcial: a primeira rodada listada é a 10ª
+    doc = criar_documento(gerar_html_rodadas(dados_serie_b_dict['rodadas'][9:15]))
+    
+    rodadas = RodadasParser.parse_rodadas(doc, rodadas=[11, 12])
+    assert [r.rodada for r in rodadas] == ['11ª rodada', '12ª rodada']
+    assert RodadasParser.parse_rodadas(doc, rodadas=[3]) == []
+    
+    tipadas = RodadasParser.parse_rodadas(doc, rodadas=range(13, 40), tipado=True)
+    assert [r.numero for r in tipadas] == [13, 14, 15]
+    
+    partidas = list(RodadasParser.iter_partidas(doc, rodadas=[10]))
+    assert partidas == RodadasParser.parse_rodadas(doc, rodadas=[10])[0].partidas
+
+def test_filtro_de_times_com_nomes_contendo_x(dados_serie_b_dict):
+    rodadas = _renomear(copy.deepcopy(dados_serie_b_dict['rodadas'][:5]), 'Remo', 'Caxias')
+    doc = criar_documento(gerar_html_rodadas(rodadas))
+    
+    filtradas = RodadasParser.parse_rodadas(doc, times={'Caxias'})
+    assert len(filtradas) == 5
+    for rodada in filtradas:
+        assert len(rodada.partidas) == 1
+        partida = rodada.partidas[0]
+        assert 'Caxias' in (partida.time_casa, partida.time_fora)
+        assert partida.partida == f"{partida.time_casa} x {partida.time_fora}"
+
+def _contar_titulos(monkeypatch):
+    lidos = []
+    original = NoBS4.select_one
+    
+    def select_one(self, seletor):
+        if seletor == CSS_SELECTORS['rodadas']['titulo']:
+            lidos.append(seletor)
+        return original(self, seletor)
+    monkeypatch.setattr(NoBS4, 'select_one', select_one)
+    return lidos
+
+def test_busca_para_quando_nao_falta_nenhuma_rodada(dados_serie_b_dict, monkeypatch):
+    doc = criar_documento(gerar_html_rodadas(dados_serie_b_dict['rodadas']), 'html.parser')
+    lidos = _contar_titulos(monkeypatch)
+    
+    rodadas = list(RodadasParser.iter_rodadas(doc, rodadas=[3, 5]))
+    assert [r.rodada for r in rodadas] == ['3ª rodada', '5ª rodada']
+    assert len(lidos) == 5
+    
+    # Rodada inexistente: lê todos os títulos e devolve as encontradas
+    del lidos[:]
+    assert [p.time_casa for p in RodadasParser.iter_partidas(doc, rodadas=[38, 40])][:1] == [
+        dados_serie_b_dict['rodadas'][37]['partidas'][0]['time_casa']
+    ]
+    assert len(lidos) == 38
+
+def test_filtro_de_rodadas_nao_depende_da_ordem_da_pagina(dados_serie_b_dict, monkeypatch):
+    doc = criar_documento(gerar_html_rodadas(dados_serie_b_dict['rodadas'][::-1]), 'html.parser')
+    lidos = _contar_titulos(monkeypatch)
+    
+    rodadas = RodadasParser.parse_rodadas(doc, rodadas=[36, 2])
+    assert [r.rodada for r in rodadas] == ['36ª rodada', '2ª rodada']
+    assert len(lidos) == 37
+    assert RodadasParser.parse_rodadas(doc, rodadas=[]) == []
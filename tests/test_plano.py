@@ -0,0 +1,47 @@
+"""
+Testes do plano de extração: mesmos modelos que o caminho por seletores
+"""
+
+import pytest
+
+from scripts.benchmark_parsers import gerar_html_rodadas, gerar_html_tabela
+from scrapers.engines import como_no, criar_documento, engines_disponiveis
+from scrapers.parsers import RodadasParser, TabelaParser
+from scrapers.plano import CAMPOS, ExtracaoPorSeletores, PlanoExtracao
+
+@pytest.fixture(scope='module')
+def html_serie_b(dados_serie_b_dict):
+    return gerar_html_tabela(dados_serie_b_dict['tabela']), gerar_html_rodadas(dados_serie_b_dict['rodadas'])
+
+@pytest.mark.parametrize('engine', engines_disponiveis())
+def test_plano_e_seletores_extraem_os_mesmos_campos(engine, html_serie_b):
+    html_tabela, html_rodadas = html_serie_b
+    tabela = como_no(criar_documento(html_tabela, engine))
+    rodadas = como_no(criar_documento(html_rodadas, engine))
+    
+    casos = [('time', linha) for linha in tabela.select('tbody tr')]
+    for rodada in rodadas.select('ul.rounds > li'):
+        casos.append(('rodada', rodada))
+        casos.extend(('partida', partida) for partida in rodada.select('li.match'))
+    assert len(casos) == 20 + 38 + 380
+    
+    for grupo, no in casos:
+        plano = PlanoExtracao(CAMPOS[grupo]).extrair(no)
+        assert plano == ExtracaoPorSeletores(CAMPOS[grupo]).extrair(no)
+        assert any(valor is not None for valor in plano.values())
+
+@pytest.mark.parametrize('engine', engines_disponiveis())
+@pytest.mark.parametrize('tipado', [False, True])
+def test_plano_e_seletores_geram_a_mesma_tabela_e_rodadas(engine, tipado, html_serie_b, dados_serie_b):
+    html_tabela, html_rodadas = html_serie_b
+    doc_tabela = criar_documento(html_tabela, engine)
+    doc_rodadas = criar_documento(html_rodadas, engine)
+    
+    tabela = TabelaParser.parse_tabela(doc_tabela, plano=True, tipado=tipado)
+    rodadas = RodadasParser.parse_rodadas(doc_rodadas, plano=True, tipado=tipado)
+    assert tabela == TabelaParser.parse_tabela(doc_tabela, plano=False, tipado=tipado)
+    assert rodadas == RodadasParser.parse_rodadas(doc_rodadas, plano=False, tipado=tipado)
+    
+    if not tipado:
+        assert tabela == dados_serie_b.tabela
+        assert rodadas == dados_serie_b.rodadas
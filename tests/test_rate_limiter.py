@@ -0,0 +1,148 @@
+"""
+Testes do limitador de taxa: reposição, rajada, chaves por host e estado compartilhado em arquivo
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from conftest import RAIZ
+from scrapers import rate_limiter
+from scrapers.config import RATE_LIMIT_CONFIG
+from scrapers.rate_limiter import TokenBucket, TokenBucketArquivo
+
+class RelogioFalso:
+    """Relógio controlado pelo teste"""
+    
+    def __init__(self, inicio=1000.0):
+        self.agora = inicio
+    
+    def __call__(self):
+        return self.agora
+
+def _com_relogio(bucket, relogio):
+    bucket._agora = relogio
+    bucket._atualizado = relogio()
+    return bucket
+
+@pytest.fixture
+def config_limite(monkeypatch):
+    """Liga o limitador com uma configuração própria e descarta os buckets ao final"""
+    monkeypatch.setitem(RATE_LIMIT_CONFIG, 'habilitado', True)
+    monkeypatch.setitem(RATE_LIMIT_CONFIG, 'taxa', 1.0)
+    monkeypatch.setitem(RATE_LIMIT_CONFIG, 'rajada', 2)
+    monkeypatch.setitem(RATE_LIMIT_CONFIG, 'diretorio_lock', None)
+    monkeypatch.setitem(RATE_LIMIT_CONFIG, 'hosts', {})
+    rate_limiter.redefinir_limitadores()
+    yield RATE_LIMIT_CONFIG
+    rate_limiter.redefinir_limitadores()
+
+def test_desligado_por_padrao():
+    assert RATE_LIMIT_CONFIG['habilitado'] is False
+    assert rate_limiter.aguardar_vez("https://p1.trrsf.com/x", timeout=0) is True
+
+def test_rajada_libera_a_capacidade_e_depois_pede_espera():
+    relogio = RelogioFalso()
+    bucket = _com_relogio(TokenBucket(taxa=2.0, rajada=3), relogio)
+    
+    assert [bucket._consumir() for _ in range(3)] == [0, 0, 0]
+    assert bucket._consumir() == pytest.approx(0.5)
+
+def test_reposicao_proporcional_ao_tempo_e_limitada_a_rajada():
+    relogio = RelogioFalso()
+    bucket = _com_relogio(TokenBucket(taxa=2.0, rajada=3), relogio)
+    for _ in range(3):
+        bucket._consumir()
+    
+    relogio.agora += 0.5
+    assert bucket._consumir() == 0
+    assert bucket._consumir() > 0
+    
+    relogio.agora += 60
+    assert [bucket._consumir() for _ in range(4)][:3] == [0, 0, 0]
+    assert bucket._consumir() > 0
+
+def test_relogio_para_tras_nao_gera_tokens():
+    relogio = RelogioFalso()
+    bucket = _com_relogio(TokenBucket(taxa=1.0, rajada=1), relogio)
+    bucket._consumir()
+    
+    relogio.agora -= 100
+    assert bucket._consumir() > 0
+
+def test_relogio_em_processo_e_monotonico(monkeypatch):
+    bucket = TokenBucket(taxa=1.0, rajada=1)
+    monkeypatch.setattr(rate_limiter.time, 'time', lambda: 0.0)
+    assert bucket._agora() == pytest.approx(rate_limiter.time.monotonic(), abs=1)
+
+def test_adquirir_respeita_timeout():
+    bucket = TokenBucket(taxa=0.01, rajada=1)
+    assert bucket.adquirir(timeout=0) is True
+    assert bucket.adquirir(timeout=0.05) is False
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        TokenBucket(taxa=0, rajada=1)
+    with pytest.raises(ValueError):
+        TokenBucket(taxa=1, rajada=0)
+
+def test_limitadores_separados_por_host(config_limite):
+    config_limite['hosts'] = {'lento.exemplo': {'taxa': 0.5, 'rajada': 1}}
+    
+    a = rate_limiter.obter_limitador('p1.trrsf.com')
+    assert rate_limiter.obter_limitador('p1.trrsf.com') is a
+    lento = rate_limiter.obter_limitador('lento.exemplo')
+    assert lento is not a
+    assert (lento.taxa, lento.rajada) == (0.5, 1)
+    assert (a.taxa, a.rajada) == (1.0, 2)
+    
+    assert rate_limiter.aguardar_vez("https://lento.exemplo/a", timeout=0) is True
+    assert rate_limiter.aguardar_vez("https://lento.exemplo/b", timeout=0) is False
+    assert rate_limiter.aguardar_vez("https://p1.trrsf.com/a", timeout=0) is True
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="flock indisponível")
+def test_diretorio_lock_cria_bucket_em_arquivo(config_limite, tmp_path):
+    config_limite['diretorio_lock'] = str(tmp_path)
+    bucket = rate_limiter.obter_limitador('p1.trrsf.com')
+    
+    assert isinstance(bucket, TokenBucketArquivo)
+    assert bucket.arquivo == tmp_path / "p1.trrsf.com.bucket"
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="flock indisponível")
+def test_bucket_em_arquivo_repoe_pelo_estado_gravado(tmp_path):
+    relogio = RelogioFalso()
+    bucket = TokenBucketArquivo(taxa=1.0, rajada=2, arquivo=str(tmp_path / "b.bucket"))
+    bucket._agora = relogio
+    
+    assert [bucket._consumir() for _ in range(2)] == [0, 0]
+    assert bucket._consumir() == pytest.approx(1.0)
+    
+    relogio.agora += 1
+    outro = TokenBucketArquivo(taxa=1.0, rajada=2, arquivo=str(tmp_path / "b.bucket"))
+    outro._agora = relogio
+    assert outro._consumir() == 0
+    assert bucket._consumir() > 0
+
+_CONSUMIDOR = """
+import sys
+sys.path.insert(0, sys.argv[1])
+from scrapers.rate_limiter import TokenBucketArquivo
+bucket = TokenBucketArquivo(taxa=0.001, rajada=5, arquivo=sys.argv[2])
+print(sum(bucket._consumir() == 0 for _ in range(5)))
+"""
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="flock indisponível")
+def test_dois_processos_dividem_o_mesmo_arquivo(tmp_path):
+    arquivo = str(tmp_path / "compartilhado.bucket")
+    processos = [
+        subprocess.Popen(
+            [sys.executable, "-c", _CONSUMIDOR, str(RAIZ), arquivo],
+            stdout=subprocess.PIPE, universal_newlines=True
+        )
+        for _ in range(2)
+    ]
+    concedidos = [int(p.communicate(timeout=60)[0]) for p in processos]
+    
+    assert all(p.returncode == 0 for p in processos)
+    assert sum(concedidos) == 5
@@ -0,0 +1,135 @@
+"""
+Testes da serialização: backends, gravação atômica e leitura incremental
+"""
+
+import json
+
+import pytest
+
+from conftest import DIRETORIO_DADOS
+from src import serializacao
+from src.serializacao import iter_itens
+
+def _gravar(tmp_path, texto, nome='dados.json'):
+    arquivo = tmp_path / nome
+    arquivo.write_text(texto, encoding='utf-8')
+    return arquivo
+
+@pytest.mark.parametrize('tamanho_bloco', [1, 7, 64, 1 << 16])
+def test_itens_do_arquivo_coletado(dados_serie_b_dict, tamanho_bloco):
+    arquivo = DIRETORIO_DADOS / "2025-09-09" / "serie_b.json"
+    rodadas = list(iter_itens(arquivo, 'rodadas', tamanho_bloco=tamanho_bloco))
+    assert rodadas == dados_serie_b_dict['rodadas']
+
+def test_itens_atravessando_blocos(tmp_path):
+    itens = [
+        {"texto": 'aspas " e barra \\ no meio', "lista": [1, [2, {"x": "]}"}]]},
+        "string com } e ] dentro",
+        [],
+        {},
+        -12.5e3,
+        None,
+        True,
+    ]
+    arquivo = _gravar(tmp_path, json.dumps({"itens": itens}, ensure_ascii=False))
+    assert list(iter_itens(arquivo, 'itens', tamanho_bloco=7)) == itens
+
+def test_numero_no_fim_do_bloco(tmp_path):
+    # Com blocos de 7 caracteres, '{"a":[1' termina no meio do número 12345
+    arquivo = _gravar(tmp_path, '{"a":[12345,6789012,3]}')
+    assert list(iter_itens(arquivo, 'a', tamanho_bloco=7)) == [12345, 6789012, 3]
+
+def test_pula_chaves_que_nao_sao_a_pedida(tmp_path, monkeypatch):
+    texto = json.dumps({
+        "antes": {"rodadas": [9, 9]},
+        "escalar": "rodadas",
+        "outra_lista": [{"a": [1, 2]}, "x", 3],
+        "rodadas": [{"n": 1}, {"n": 2}],
+        "depois": [1]
+    })
+    arquivo = _gravar(tmp_path, texto)
+    
+    decodificados = []
+    raw_decode = json.JSONDecoder.raw_decode
+    
+    def contar(self, s, idx=0):
+        valor, fim = raw_decode(self, s, idx)
+        decodificados.append(valor)
+        return valor, fim
+    monkeypatch.setattr(json.JSONDecoder, 'raw_decode', contar)
+    
+    assert list(iter_itens(arquivo, 'rodadas', tamanho_bloco=5)) == [{"n": 1}, {"n": 2}]
+    # Só as chaves e os itens pedidos são decodificados, cada um uma única vez
+    assert decodificados == ["antes", "escalar", "outra_lista", "rodadas", {"n": 1}, {"n": 2}]
+
+def test_chave_ausente_ou_objeto_vazio(tmp_path):
+    assert list(iter_itens(_gravar(tmp_path, '{"tabela": []}'), 'rodadas')) == []
+    assert list(iter_itens(_gravar(tmp_path, '{ }', 'vazio.json'), 'rodadas')) == []
+
+def test_item_grande_e_varrido_uma_vez(tmp_path, monkeypatch):
+    item = {"partidas": [{"local": "x" * 50, "n": i} for i in range(200)]}
+    texto = json.dumps({"rodadas": [item]})
+    arquivo = _gravar(tmp_path, texto)
+    
+    buscas = []
+    busca = serializacao._ESTRUTURA.search
+    
+    class Contador:
+        def search(self, texto, pos):
+            buscas.append(pos)
+            return busca(texto, pos)
+    monkeypatch.setattr(serializacao, '_ESTRUTURA', Contador())
+    
+    assert list(iter_itens(arquivo, 'rodadas', tamanho_bloco=16)) == [item]
+    # A varredura continua de onde parou: uma busca por delimitador ou aspa de
+    # abertura, mais uma retomada por bloco lido
+    delimitadores = sum(texto.count(c) for c in '[]{}') + texto.count('"') // 2
+    assert len(buscas) <= delimitadores + len(texto) // 16 + 1
+
+@pytest.mark.parametrize('texto', [
+    '{"rodadas": [{"n": 1}, {"n": 2',
+    '{"rodadas": [1, 2',
+    '{"rodadas": ["sem fim',
+    '{"rodadas": [12',
+    '{"rodadas": [1 2]}',
+    '{"rodadas": [tru]}',
+    '{"rodadas": [12abc]}',
+    '{"rodadas" [1]}',
+    '["rodadas"]',
+    '',
+])
+def test_json_truncado_ou_invalido(tmp_path, texto):
+    arquivo = _gravar(tmp_path, texto)
+    with pytest.raises(ValueError):
+        list(iter_itens(arquivo, 'rodadas', tamanho_bloco=7))
+
+@pytest.mark.parametrize('compacto', [False, True])
+@pytest.mark.parametrize('backend', serializacao.backends_disponiveis())
+def test_backends_produzem_o_mesmo_texto(dados_serie_b_dict, backend, compacto):
+    esperado = serializacao.codificar(dados_serie_b_dict, compacto=compacto, backend='json')
+    
+    assert serializacao.codificar(dados_serie_b_dict, compacto=compacto, backend=backend) == esperado
+    assert serializacao.decodificar(esperado, backend=backend) == dados_serie_b_dict
+
+def test_gravar_atomico_substitui_o_arquivo(tmp_path):
+    arquivo = tmp_path / "serie_b.json"
+    arquivo.write_bytes(b'{"antigo": true}')
+    
+    serializacao.gravar_atomico(arquivo, b'{"novo": true}')
+    
+    assert arquivo.read_bytes() == b'{"novo": true}'
+    assert [p.name for p in tmp_path.iterdir()] == ["serie_b.json"]
+
+def test_gravar_atomico_com_falha_preserva_o_arquivo_anterior(tmp_path, monkeypatch):
+    arquivo = tmp_path / "serie_b.json"
+    arquivo.write_bytes(b'{"antigo": true}')
+    
+    def falhar(fd):
+        raise OSError("disco cheio")
+    monkeypatch.setattr(serializacao.os, 'fsync', falhar)
+    
+    with pytest.raises(OSError, match="disco cheio"):
+        serializacao.gravar_atomico(arquivo, b'{"novo": true}')
+    
+    assert arquivo.read_bytes() == b'{"antigo": true}'
+    assert [p.name for p in tmp_path.iterdir()] == ["serie_b.json"]
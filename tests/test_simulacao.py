@@ -0,0 +1,38 @@
+"""
+Testes da simulação Monte Carlo
+"""
+
+import numpy as np
+import pytest
+
+from src.arrays import ArraysTemporada
+from src.classificacao import MotorClassificacao
+from src.models import Partida, Rodada
+from src.simulacao import SimuladorTemporada
+
+def _partida(casa, fora, gols_casa='', gols_fora=''):
+    return Partida(f"{casa} x {fora}", '', '', casa, fora, gols_casa, gols_fora, '')
+
+def test_desempate_alfabetico_igual_ao_motor_de_classificacao():
+    # Ids fora da ordem alfabética; Alfa/Zeta e Beta/Meio empatam em todos os critérios
+    rodadas = [Rodada('1ª rodada', '04/04/2025', False, [
+        _partida('Zeta', 'Alfa', '1', '1'), _partida('Meio', 'Beta', '0', '0')
+    ])]
+    arrays = ArraysTemporada.de_rodadas(rodadas, times=['Zeta', 'Meio', 'Beta', 'Alfa'])
+    ordem = MotorClassificacao(arrays).calcular().ordem
+    assert [arrays.times[i] for i in ordem] == ['Alfa', 'Zeta', 'Beta', 'Meio']
+    
+    resultado = SimuladorTemporada(arrays).simular(20, workers=1, semente=1)
+    posicoes = resultado.contagem_posicoes.argmax(axis=1)
+    assert [arrays.times[i] for i in np.argsort(posicoes)] == ['Alfa', 'Zeta', 'Beta', 'Meio']
+    assert (resultado.contagem_posicoes.max(axis=1) == 20).all()
+
+def test_probabilidades_somam_um(dados_serie_b):
+    resultado = SimuladorTemporada(ArraysTemporada.de_dados(dados_serie_b)).simular(
+        2000, workers=1, semente=7
+    )
+    probabilidades = resultado.probabilidades_posicao
+    assert probabilidades.sum(axis=0) == pytest.approx(1.0)
+    assert probabilidades.sum(axis=1) == pytest.approx(1.0)
+    assert resultado.titulo.sum() == pytest.approx(1.0)
+    assert resultado.probabilidade_acesso.sum() == pytest.approx(resultado.acesso)
@@ -0,0 +1,68 @@
+"""
+Testes das consultas sobre a temporada
+"""
+
+import copy
+from datetime import date, datetime, timezone
+
+from src.temporada import Temporada
+from src.utils import FUSO_BRASILIA
+
+def _jogo_remo(rodada):
+    return next(p for p in rodada['partidas'] if 'Remo' in (p['time_casa'], p['time_fora']))
+
+def test_consultas_basicas(dados_serie_b_dict):
+    temporada = Temporada.de_dict(dados_serie_b_dict)
+    
+    assert len(temporada.partidas_do_time('Remo')) == 38
+    assert len(temporada.partidas_do_time('Remo', mando='casa')) == 19
+    assert temporada.partidas_do_time('Inexistente') == []
+    assert temporada.rodada(26).rodada == '26ª rodada'
+    assert temporada.rodada(39) is None
+    assert temporada.posicao('Inexistente') is None and temporada.time('Inexistente') is None
+    assert temporada.time('Remo').nome == 'Remo'
+    
+    jogos = temporada.jogos_entre(date(2025, 9, 12), date(2025, 9, 12))
+    assert jogos[0].partida == 'Volta Redonda x Criciúma'
+    assert all('12/09' in p.data for p in jogos)
+
+def test_confronto_traz_turno_returno_e_jogos_extras(dados_serie_b_dict):
+    temporada = Temporada.de_dict(dados_serie_b_dict)
+    jogos = temporada.confronto('Remo', 'Paysandu')
+    assert [(p.time_casa, p.time_fora) for p in jogos] == [('Remo', 'Paysandu'), ('Paysandu', 'Remo')]
+    assert temporada.confronto('Remo', 'Inexistente') == []
+    
+    # Um segundo jogo com o mesmo mando não substitui o primeiro
+    dados = copy.deepcopy(dados_serie_b_dict)
+    extra = copy.deepcopy(dados['rodadas'][-1])
+    extra['rodada'] = '39ª rodada'
+    revanche = dict(jogos[0].__dict__, data='Sáb 06/12 16h00', gols_casa='', gols_fora='')
+    extra['partidas'] = [revanche]
+    dados['rodadas'].append(extra)
+    
+    jogos = Temporada.de_dict(dados).confronto('Remo', 'Paysandu')
+    assert [(p.time_casa, p.data) for p in jogos] == [
+        ('Remo', jogos[0].data), ('Remo', 'Sáb 06/12 16h00'), ('Paysandu', jogos[2].data)
+    ]
+    assert jogos[0].gols_casa != '' and jogos[1].gols_casa == ''
+
+def test_proximos_jogos_incluem_pendentes_sem_data(dados_serie_b_dict):
+    dados = copy.deepcopy(dados_serie_b_dict)
+    _jogo_remo(dados['rodadas'][-1])['data'] = ''
+    temporada = Temporada.de_dict(dados)
+    ultima = temporada.rodada(38).partidas
+    sem_data = next(p for p in ultima if 'Remo' in (p.time_casa, p.time_fora))
+    
+    pendentes = temporada.proximos_jogos('Remo', k=38)
+    assert len(pendentes) == 13
+    assert all(p.gols_casa == '' for p in pendentes)
+    assert pendentes[-1] is sem_data
+    assert (pendentes[0].time_casa, pendentes[0].time_fora) == ('Vila Nova', 'Remo')
+    assert temporada.proximos_jogos('Inexistente') == []
+    
+    # Com horário de referência, só entram partidas com data
+    agora = datetime(2025, 9, 13, 21, 29, tzinfo=timezone.utc)
+    proximos = temporada.proximos_jogos('Remo', k=38, agora=agora)
+    assert proximos[0] is pendentes[0] and sem_data not in proximos
+    assert temporada.proximos_jogos('Remo', k=2, agora=datetime(2025, 9, 13, 18, 31))[0] is pendentes[1]
+    assert temporada.proximos_jogos('Remo', k=1, agora=datetime(2025, 9, 13, 18, 30, tzinfo=FUSO_BRASILIA)) == [pendentes[0]]
@@ -0,0 +1,47 @@
+"""
+Testes do pool de User-Agents embutido
+"""
+
+import random
+import sys
+from collections import Counter
+
+import pytest
+
+from scrapers import user_agents
+from scrapers.config import REQUEST_CONFIG
+from scrapers.user_agents import USER_AGENTS, PoolUserAgents, obter_pool
+
+@pytest.fixture
+def pool_limpo():
+    obter_pool.cache_clear()
+    yield
+    obter_pool.cache_clear()
+
+def test_sorteio_respeita_os_pesos(monkeypatch):
+    monkeypatch.setattr(user_agents, 'random', random.Random(2025))
+    pool = PoolUserAgents((('a', 3), ('b', 1), ('c', 0)))
+    
+    contagem = Counter(pool.random for _ in range(20000))
+    assert set(contagem) == {'a', 'b'}
+    assert contagem['a'] / 20000 == pytest.approx(0.75, abs=0.02)
+
+def test_pool_embutido_tem_todos_os_agentes():
+    pool = PoolUserAgents()
+    assert len(pool._tabela) == sum(peso for _, peso in USER_AGENTS)
+    assert set(pool._tabela) == {ua for ua, _ in USER_AGENTS}
+    assert pool.random in pool._tabela
+
+@pytest.mark.parametrize('agentes', [(), (('a', 0),)])
+def test_pool_vazio_levanta_erro(agentes):
+    with pytest.raises(ValueError, match='vazio'):
+        PoolUserAgents(agentes)
+
+def test_obter_pool_criado_uma_vez(pool_limpo):
+    assert isinstance(obter_pool(), PoolUserAgents)
+    assert obter_pool() is obter_pool()
+
+def test_fake_useragent_ausente_usa_o_pool_embutido(pool_limpo, monkeypatch):
+    monkeypatch.setitem(REQUEST_CONFIG, 'fonte_user_agent', 'fake_useragent')
+    monkeypatch.setitem(sys.modules, 'fake_useragent', None)
+    assert isinstance(obter_pool(), PoolUserAgents)
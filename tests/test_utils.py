@@ -0,0 +1,24 @@
+"""
+Testes dos utilitários de JSON
+"""
+
+from src.async_brasileirao import AsyncBrasileirao
+from src.brasileirao import Brasileirao
+from src.utils import JSONUtils
+
+def test_salvar_json_das_duas_classes(tmp_path, capsys, dados_serie_b_dict):
+    for classe in (Brasileirao, AsyncBrasileirao):
+        instancia = classe()
+        try:
+            arquivo = tmp_path / f"{classe.__name__}.json"
+            assert instancia.salvar_json(dados_serie_b_dict, str(arquivo), compacto=True)
+            assert JSONUtils.load_from_json(str(arquivo)) == dados_serie_b_dict
+            assert f"Dados salvos em: {arquivo}" in capsys.readouterr().out
+        finally:
+            instancia.close()
+
+def test_salvar_e_informar_reporta_falha(tmp_path, capsys):
+    arquivo = tmp_path / 'nao_existe' / 'sub' / 'dados.json'
+    (tmp_path / 'nao_existe').write_text('arquivo no lugar da pasta')
+    assert not JSONUtils.salvar_e_informar({'a': 1}, str(arquivo))
+    assert f"Erro ao salvar arquivo: {arquivo}" in capsys.readouterr().out